@@ -0,0 +1,192 @@
+"""partition_news_articles_by_month
+
+Revision ID: 5b7e1c9d2a41
+Revises: c2352ab4b554
+Create Date: 2025-11-20 10:12:31.481257
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e1c9d2a41'
+down_revision: Union[str, Sequence[str], None] = 'c2352ab4b554'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns copied between the plain and partitioned tables (search_vector is generated)
+ARTICLE_COLUMNS = (
+    "id, title, content, summary, source, published_date, language, category, "
+    "tags, sentiment_score, entities, topics, url, created_at, updated_at"
+)
+
+SEARCH_VECTOR = """
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'C')
+    ) STORED
+"""
+
+ARTICLE_INDEXES = (
+    'ix_news_articles_category',
+    'ix_news_articles_id',
+    'ix_news_articles_published_date',
+    'ix_news_articles_source',
+    'ix_news_articles_title',
+    'ix_news_articles_url',
+    'ix_news_articles_url_unique',
+    'ix_news_articles_search_vector',
+)
+
+
+def upgrade() -> None:
+    """Convert news_articles to monthly range partitions with a URL dedup table."""
+    # URL dedup table: a unique index on url cannot span partitions
+    op.create_table('news_article_urls',
+    sa.Column('url_hash', sa.String(length=64), nullable=False),
+    sa.Column('url', sa.String(length=1000), nullable=False),
+    sa.Column('article_id', sa.Integer(), nullable=False),
+    sa.Column('published_date', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('url_hash')
+    )
+    op.create_index(op.f('ix_news_article_urls_article_id'), 'news_article_urls', ['article_id'], unique=False)
+
+    # Move the existing table aside and free its index names
+    op.execute("ALTER TABLE news_articles RENAME TO news_articles_legacy")
+    for index_name in ARTICLE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER TABLE news_articles_legacy DROP CONSTRAINT IF EXISTS news_articles_pkey")
+
+    # Partitioned parent; the partition key must be part of the primary key
+    op.execute(f"""
+        CREATE TABLE news_articles (
+            id integer NOT NULL DEFAULT nextval('news_articles_id_seq'),
+            title varchar(500) NOT NULL,
+            content text NOT NULL,
+            summary text,
+            source varchar(255) NOT NULL,
+            published_date timestamp without time zone NOT NULL,
+            language varchar(10),
+            category varchar(100),
+            tags json,
+            sentiment_score double precision,
+            entities json,
+            topics json,
+            url varchar(1000),
+            created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
+            updated_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
+            {SEARCH_VECTOR},
+            CONSTRAINT news_articles_pkey PRIMARY KEY (id, published_date)
+        ) PARTITION BY RANGE (published_date)
+    """)
+
+    # One partition per month from the oldest article to three months ahead;
+    # anything outside that range lands in the default partition
+    op.execute("""
+        DO $$
+        DECLARE
+            m date := date_trunc('month', coalesce(
+                (SELECT min(published_date) FROM news_articles_legacy), now()));
+            last_month date := date_trunc('month', now()) + interval '3 months';
+        BEGIN
+            WHILE m <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF news_articles FOR VALUES FROM (%L) TO (%L)',
+                    'news_articles_' || to_char(m, 'YYYY_MM'), m, m + interval '1 month');
+                m := m + interval '1 month';
+            END LOOP;
+        END $$;
+    """)
+    op.execute("CREATE TABLE news_articles_default PARTITION OF news_articles DEFAULT")
+
+    # Copy data and register URLs (keep the first article per URL)
+    op.execute(f"""
+        INSERT INTO news_articles ({ARTICLE_COLUMNS})
+        SELECT {ARTICLE_COLUMNS} FROM news_articles_legacy
+    """)
+    op.execute("""
+        INSERT INTO news_article_urls (url_hash, url, article_id, published_date)
+        SELECT DISTINCT ON (url) encode(sha256(convert_to(url, 'UTF8')), 'hex'),
+               url, id, published_date
+        FROM news_articles_legacy
+        WHERE url IS NOT NULL
+        ORDER BY url, id
+    """)
+
+    op.execute("ALTER SEQUENCE news_articles_id_seq OWNED BY news_articles.id")
+    op.execute("DROP TABLE news_articles_legacy")
+
+    # Indexes on the parent cascade to every partition
+    op.create_index(op.f('ix_news_articles_category'), 'news_articles', ['category'], unique=False)
+    op.create_index(op.f('ix_news_articles_id'), 'news_articles', ['id'], unique=False)
+    op.create_index(op.f('ix_news_articles_published_date'), 'news_articles', ['published_date'], unique=False)
+    op.create_index(op.f('ix_news_articles_source'), 'news_articles', ['source'], unique=False)
+    op.create_index(op.f('ix_news_articles_title'), 'news_articles', ['title'], unique=False)
+    op.create_index(op.f('ix_news_articles_url'), 'news_articles', ['url'], unique=False)
+    op.create_index(
+        'ix_news_articles_search_vector',
+        'news_articles',
+        ['search_vector'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Collapse partitions back into a single news_articles table."""
+    op.execute("ALTER TABLE news_articles RENAME TO news_articles_partitioned")
+    for index_name in ARTICLE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute(
+        "ALTER TABLE news_articles_partitioned DROP CONSTRAINT IF EXISTS news_articles_pkey"
+    )
+
+    op.execute(f"""
+        CREATE TABLE news_articles (
+            id integer NOT NULL DEFAULT nextval('news_articles_id_seq'),
+            title varchar(500) NOT NULL,
+            content text NOT NULL,
+            summary text,
+            source varchar(255) NOT NULL,
+            published_date timestamp without time zone NOT NULL,
+            language varchar(10),
+            category varchar(100),
+            tags json,
+            sentiment_score double precision,
+            entities json,
+            topics json,
+            url varchar(1000),
+            created_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
+            updated_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP,
+            {SEARCH_VECTOR},
+            CONSTRAINT news_articles_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO news_articles ({ARTICLE_COLUMNS})
+        SELECT {ARTICLE_COLUMNS} FROM news_articles_partitioned
+    """)
+    op.execute("ALTER SEQUENCE news_articles_id_seq OWNED BY news_articles.id")
+    op.execute("DROP TABLE news_articles_partitioned CASCADE")
+
+    op.create_index(op.f('ix_news_articles_category'), 'news_articles', ['category'], unique=False)
+    op.create_index(op.f('ix_news_articles_id'), 'news_articles', ['id'], unique=False)
+    op.create_index(op.f('ix_news_articles_published_date'), 'news_articles', ['published_date'], unique=False)
+    op.create_index(op.f('ix_news_articles_source'), 'news_articles', ['source'], unique=False)
+    op.create_index(op.f('ix_news_articles_title'), 'news_articles', ['title'], unique=False)
+    op.create_index(op.f('ix_news_articles_url'), 'news_articles', ['url'], unique=True)
+    op.create_index('ix_news_articles_url_unique', 'news_articles', ['url'], unique=True)
+    op.create_index(
+        'ix_news_articles_search_vector',
+        'news_articles',
+        ['search_vector'],
+        postgresql_using='gin'
+    )
+
+    op.drop_index(op.f('ix_news_article_urls_article_id'), table_name='news_article_urls')
+    op.drop_table('news_article_urls')
@@ -0,0 +1,71 @@
+"""add_query_pattern_indexes
+
+Revision ID: 8d3f6a0b7c12
+Revises: 5b7e1c9d2a41
+Create Date: 2025-11-21 14:03:55.120934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3f6a0b7c12'
+down_revision: Union[str, Sequence[str], None] = '5b7e1c9d2a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite, BRIN and partial indexes matching the API query patterns."""
+    # Equality filter + ORDER BY published_date DESC (get_articles, advanced_search)
+    op.create_index(
+        'ix_news_articles_category_published_date',
+        'news_articles',
+        ['category', sa.text('published_date DESC')],
+    )
+    op.create_index(
+        'ix_news_articles_source_published_date',
+        'news_articles',
+        ['source', sa.text('published_date DESC')],
+    )
+    op.create_index(
+        'ix_news_articles_language_published_date',
+        'news_articles',
+        ['language', sa.text('published_date DESC')],
+    )
+
+    # Tiny block-range index for date range scans on append-mostly data
+    op.create_index(
+        'ix_news_articles_published_date_brin',
+        'news_articles',
+        ['published_date'],
+        postgresql_using='brin',
+    )
+
+    # The composite indexes lead with category/source and replace the single-column ones
+    op.drop_index(op.f('ix_news_articles_category'), table_name='news_articles')
+    op.drop_index(op.f('ix_news_articles_source'), table_name='news_articles')
+
+    # Active trends only (get_active_trends), already in confidence order
+    op.create_index(
+        'ix_trends_active_confidence_score',
+        'trends',
+        [sa.text('confidence_score DESC')],
+        postgresql_where=sa.text('end_date IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column article indexes."""
+    op.drop_index('ix_trends_active_confidence_score', table_name='trends')
+
+    op.create_index(op.f('ix_news_articles_source'), 'news_articles', ['source'], unique=False)
+    op.create_index(op.f('ix_news_articles_category'), 'news_articles', ['category'], unique=False)
+
+    op.drop_index('ix_news_articles_published_date_brin', table_name='news_articles')
+    op.drop_index('ix_news_articles_language_published_date', table_name='news_articles')
+    op.drop_index('ix_news_articles_source_published_date', table_name='news_articles')
+    op.drop_index('ix_news_articles_category_published_date', table_name='news_articles')
@@ -0,0 +1,32 @@
+"""add_article_nlp_version
+
+Revision ID: a4c8e2f61d57
+Revises: f3b9d2c7e815
+Create Date: 2025-11-26 10:41:18.205613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f61d57'
+down_revision: Union[str, Sequence[str], None] = 'f3b9d2c7e815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Stamp articles with the NLP model/lexicon version that analysed them.
+
+    Existing rows stay NULL and are picked up by scripts/backfill_nlp.py.
+    No index: the backfill walks the primary key and filters on the fly.
+    """
+    op.add_column('news_articles', sa.Column('nlp_version', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the NLP version stamp."""
+    op.drop_column('news_articles', 'nlp_version')
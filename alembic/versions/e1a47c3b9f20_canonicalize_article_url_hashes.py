@@ -0,0 +1,108 @@
+"""canonicalize_article_url_hashes
+
+Revision ID: e1a47c3b9f20
+Revises: 8d3f6a0b7c12
+Create Date: 2025-11-24 09:41:12.508317
+
+"""
+import hashlib
+import posixpath
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a47c3b9f20'
+down_revision: Union[str, Sequence[str], None] = '8d3f6a0b7c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+url_table = sa.table(
+    'news_article_urls',
+    sa.column('url_hash', sa.String),
+    sa.column('url', sa.String),
+    sa.column('article_id', sa.Integer),
+    sa.column('published_date', sa.DateTime),
+)
+
+# Frozen copy of app.ingestion.urls.canonicalize_url as of this revision, so
+# replaying the migration always produces the same hashes
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', 'ref', 'ref_src', 'referrer', 'cmpid', 'ocid', 'ito',
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'pk_', 'mtm_')
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical dedup form of an article URL (malformed URLs are returned as given)."""
+    url = str(url).strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme in ('http', 'https'):
+        scheme = 'https'
+
+    host = (parts.hostname or '').lower().rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    netloc = host if port is None or str(port) in DEFAULT_PORTS.values() else f'{host}:{port}'
+
+    path = quote(unquote(parts.path), safe="/:@!$&'()*+,;=-._~")
+    if path:
+        path = posixpath.normpath(path)
+        if parts.path.endswith('/') and path != '/':
+            path = path.rstrip('/')
+    if path in ('', '.', '/'):
+        path = ''
+
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking(name)
+        )
+    )
+
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def _rekey(normalize) -> None:
+    """Rewrite every dedup row as hash(normalize(url)); the oldest article wins a clash."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(url_table).order_by(url_table.c.article_id)
+    ).mappings().all()
+
+    rekeyed = {}
+    for row in rows:
+        url = normalize(row['url'])
+        url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        rekeyed.setdefault(url_hash, {**row, 'url': url, 'url_hash': url_hash})
+
+    op.execute(url_table.delete())
+    if rekeyed:
+        op.bulk_insert(url_table, list(rekeyed.values()))
+
+
+def upgrade() -> None:
+    """Key the URL dedup table by canonical URL (no tracking params, https, no fragment)."""
+    _rekey(canonicalize_url)
+
+
+def downgrade() -> None:
+    """Keep canonical URLs but hash them as stored (raw-URL hashing as before)."""
+    _rekey(lambda url: url)
@@ -0,0 +1,35 @@
+"""add_article_duplicate_of
+
+Revision ID: f3b9d2c7e815
+Revises: e1a47c3b9f20
+Create Date: 2025-11-25 16:22:07.913540
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b9d2c7e815'
+down_revision: Union[str, Sequence[str], None] = 'e1a47c3b9f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Link near-duplicate articles to their canonical article."""
+    op.add_column('news_articles', sa.Column('duplicate_of', sa.Integer(), nullable=True))
+    op.create_index(
+        'ix_news_articles_duplicate_of',
+        'news_articles',
+        ['duplicate_of'],
+        postgresql_where=sa.text('duplicate_of IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Drop near-duplicate links."""
+    op.drop_index('ix_news_articles_duplicate_of', table_name='news_articles')
+    op.drop_column('news_articles', 'duplicate_of')
@@ -0,0 +1,80 @@
+"""
+ARAS Debug API Router
+Slow-request capture and on-demand sampling profiles (ENABLE_PROFILING)
+
+Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
+"""
+
+import asyncio
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core import multiprocess
+from app.core.config import settings
+from app.core.profiling import sampling_profiler, slow_requests
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Only callers presenting PROFILING_ADMIN_TOKEN may use the debug endpoints."""
+    token = settings.PROFILING_ADMIN_TOKEN
+    if not token or not x_admin_token or not secrets.compare_digest(x_admin_token, token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/slow-requests")
+async def get_slow_requests(limit: Optional[int] = Query(None, ge=1)):
+    """
+    Recent requests over PROFILING_SLOW_REQUEST_MS, newest first.
+
+    Each entry breaks the request time down into db, redis, nlp, serialize
+    and other milliseconds, plus the number of calls per span. Under
+    gunicorn every worker's requests are included (capacity is per worker).
+    """
+    return {
+        "threshold_ms": slow_requests.threshold_ms,
+        "capacity": slow_requests.entries.maxlen,
+        "requests": multiprocess.collect_slow_requests(slow_requests, limit),
+    }
+
+
+@router.delete("/slow-requests", status_code=204)
+async def clear_slow_requests():
+    """Empty the slow-request buffer of every worker."""
+    multiprocess.clear_slow_requests(slow_requests)
+
+
+@router.post("/profile")
+async def run_profile(
+    seconds: float = Query(10.0, gt=0),
+    format: str = Query("json", pattern="^(json|collapsed)$"),
+    include_idle: bool = False,
+):
+    """
+    Sample every thread's stack for the given number of seconds.
+
+    The "collapsed" format returns one "frame;frame;... count" line per
+    stack, ready for flamegraph.pl or speedscope. Under gunicorn only the
+    worker answering the request (pid in the result) is sampled.
+    """
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be at most {settings.PROFILING_MAX_SECONDS}",
+        )
+    if sampling_profiler.busy:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    try:
+        result = await asyncio.to_thread(sampling_profiler.run, seconds, include_idle)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if format == "collapsed":
+        return PlainTextResponse(result["collapsed"])
+    return result
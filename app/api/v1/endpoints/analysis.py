@@ -5,8 +5,10 @@ NLP and analytics operations
 Built by Elite Team - Data Scientist (PhD in Data Science)
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
+from app.core.profiling import ProfiledRoute
+from app.core.rate_limiter import nlp_budget
 from app.schemas.news_schemas import (
     AnalysisRequest,
     SentimentResponse,
@@ -15,17 +17,25 @@ from app.schemas.news_schemas import (
 )
 from app.services.analysis_service import AnalysisService
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
+# NLP budget units per call (plus a per-KB surcharge on each route)
+SENTIMENT_COST = 2
+EXTRACTION_COST = 5
 
-@router.post("/sentiment", response_model=SentimentResponse)
+
+@router.post(
+    "/sentiment",
+    response_model=SentimentResponse,
+    dependencies=[Depends(nlp_budget.charge(SENTIMENT_COST, per_kb=1))],
+)
 async def analyze_sentiment(request: AnalysisRequest):
     """
     Analyze sentiment of text.
-    
+
     Returns sentiment classification (positive/negative/neutral),
     polarity score (-1 to +1), and confidence (0 to 1).
-    
+
     Example:
         POST /api/v1/analysis/sentiment
         {
@@ -42,14 +52,18 @@ async def analyze_sentiment(request: AnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Sentiment analysis failed: {str(e)}")
 
 
-@router.post("/entities", response_model=EntitiesResponse)
+@router.post(
+    "/entities",
+    response_model=EntitiesResponse,
+    dependencies=[Depends(nlp_budget.charge(EXTRACTION_COST, per_kb=2))],
+)
 async def extract_entities(request: AnalysisRequest):
     """
     Extract named entities from text.
-    
+
     Recognizes: PERSON, ORG (organizations), GPE (geo-political entities),
     DATE, TIME, MONEY, PERCENT, CARDINAL, ORDINAL, and more.
-    
+
     Example:
         POST /api/v1/analysis/entities
         {
@@ -66,14 +80,18 @@ async def extract_entities(request: AnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Entity extraction failed: {str(e)}")
 
 
-@router.post("/topics", response_model=TopicsResponse)
+@router.post(
+    "/topics",
+    response_model=TopicsResponse,
+    dependencies=[Depends(nlp_budget.charge(EXTRACTION_COST, per_kb=2))],
+)
 async def extract_topics(request: AnalysisRequest):
     """
     Extract keywords/topics from text.
-    
+
     Uses TF-IDF with POS filtering to identify most important
     keywords (nouns, proper nouns, adjectives).
-    
+
     Example:
         POST /api/v1/analysis/topics
         {
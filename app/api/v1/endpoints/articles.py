@@ -5,16 +5,31 @@ CRUD operations for news articles
 Built by Elite Team - Backend Developers (PhD in Software Engineering)
 """
 
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.profiling import ProfiledRoute
+from app.core.task_queue import task_queue
 from app.schemas.news_schemas import APIResponse, NewsArticle, NewsArticleCreate, NewsArticleUpdate
 from app.services.news_service import NewsService
+from app.tasks.handlers import ENRICH_ARTICLE
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
+
+
+def validate_date_range(start_date: Optional[str], end_date: Optional[str]) -> None:
+    """Reject date filters that are not ISO timestamps with a 422."""
+    for name, value in (("start_date", start_date), ("end_date", end_date)):
+        if not value:
+            continue
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"{name} must be an ISO date: {value!r}")
 
 
 @router.post("/", response_model=APIResponse)
@@ -22,6 +37,10 @@ async def create_article(article: NewsArticleCreate, db: AsyncSession = Depends(
     """Create a new news article."""
     try:
         created_article = await NewsService.create_article(db, article)
+        # NLP runs in the background worker, off the request path
+        await task_queue.enqueue(
+            ENRICH_ARTICLE, {"article_id": created_article.id}, dedup_key=str(created_article.id)
+        )
         return APIResponse(
             success=True,
             message="Article created successfully",
@@ -34,7 +53,7 @@ async def create_article(article: NewsArticleCreate, db: AsyncSession = Depends(
 
 
 @router.get("/{article_id}", response_model=APIResponse)
-async def get_article(article_id: int, db: AsyncSession = Depends(get_db)):
+async def get_article(article_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific news article by ID."""
     article = await NewsService.get_article_by_id(db, article_id)
     if not article:
@@ -64,7 +83,7 @@ async def get_articles(
     sort_order: str = Query(
         "desc", regex="^(asc|desc)$", description="Sort order: 'asc' or 'desc'"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get list of news articles with filtering, sorting, and pagination.
@@ -116,6 +135,13 @@ async def update_article(
     if not updated_article:
         raise HTTPException(status_code=404, detail="Article not found")
 
+    # New content is re-analysed unless the caller supplied the NLP fields
+    changes = article_update.model_dump(exclude_unset=True)
+    if "content" in changes and not {"sentiment_score", "entities", "topics"} & changes.keys():
+        await task_queue.enqueue(
+            ENRICH_ARTICLE, {"article_id": article_id}, dedup_key=str(article_id)
+        )
+
     return APIResponse(
         success=True,
         message="Article updated successfully",
@@ -138,25 +164,50 @@ async def search_articles(
     q: str = Query(..., min_length=1, max_length=200, description="Search query"),
     skip: int = Query(0, ge=0, description="Pagination offset"),
     limit: int = Query(50, ge=1, le=200, description="Results limit"),
-    db: AsyncSession = Depends(get_db),
+    start_date: Optional[str] = Query(
+        None, description="Filter by published_date >= start_date (ISO format)"
+    ),
+    end_date: Optional[str] = Query(
+        None, description="Filter by published_date <= end_date (ISO format)"
+    ),
+    facets: Optional[str] = Query(
+        None,
+        description="Comma-separated facets: category,source,language,sentiment_bucket,day",
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Full-text search articles using PostgreSQL.
 
     Searches in title, content, and summary with relevance ranking.
+    Optional facet counts are computed over the full match set in one query.
     """
-    articles = await NewsService.search_articles(db, q, skip, limit)
+    try:
+        facet_names = NewsService.parse_facets(facets)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    validate_date_range(start_date, end_date)
+
+    articles = await NewsService.search_articles(
+        db, q, skip, limit, start_date=start_date, end_date=end_date
+    )
+
+    data = {
+        "articles": [NewsArticle.from_orm(article).model_dump() for article in articles],
+        "query": q,
+        "total": len(articles),
+        "skip": skip,
+        "limit": limit,
+    }
+    if facet_names:
+        data["facets"] = await NewsService.get_search_facets(
+            db, facet_names, query=q, start_date=start_date, end_date=end_date
+        )
 
     return APIResponse(
         success=True,
         message=f"Found {len(articles)} articles matching '{q}'",
-        data={
-            "articles": [NewsArticle.from_orm(article).model_dump() for article in articles],
-            "query": q,
-            "total": len(articles),
-            "skip": skip,
-            "limit": limit,
-        },
+        data=data,
     )
 
 
@@ -173,7 +224,11 @@ async def advanced_search(
     end_date: Optional[str] = Query(None, description="End date (ISO format)"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db),
+    facets: Optional[str] = Query(
+        None,
+        description="Comma-separated facets: category,source,language,sentiment_bucket,day",
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Advanced search with multiple filters.
@@ -185,49 +240,51 @@ async def advanced_search(
     - Sentiment range filtering
     - Date range filtering
     - Pagination
+    - Facet counts (facets=category,source,language,sentiment_bucket,day)
     """
+    try:
+        facet_names = NewsService.parse_facets(facets)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     # Parse tags if provided
     tag_list = [tag.strip() for tag in tags.split(",")] if tags else None
 
-    articles = await NewsService.advanced_search(
-        db=db,
-        query=q,
-        category=category,
-        source=source,
-        language=language,
-        tags=tag_list,
-        sentiment_min=sentiment_min,
-        sentiment_max=sentiment_max,
-        start_date=start_date,
-        end_date=end_date,
-        skip=skip,
-        limit=limit,
-    )
+    filters = {
+        "query": q,
+        "category": category,
+        "source": source,
+        "language": language,
+        "tags": tag_list,
+        "sentiment_min": sentiment_min,
+        "sentiment_max": sentiment_max,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    articles = await NewsService.advanced_search(db=db, skip=skip, limit=limit, **filters)
 
-    return APIResponse(
-        success=True,
-        message=f"Found {len(articles)} articles",
-        data={
-            "articles": [NewsArticle.from_orm(article).model_dump() for article in articles],
-            "filters": {
-                "query": q,
-                "category": category,
-                "source": source,
-                "language": language,
-                "tags": tag_list,
-                "sentiment_range": (
-                    [sentiment_min, sentiment_max]
-                    if sentiment_min is not None or sentiment_max is not None
-                    else None
-                ),
-                "date_range": (
-                    [start_date, end_date]
-                    if start_date is not None or end_date is not None
-                    else None
-                ),
-            },
-            "total": len(articles),
-            "skip": skip,
-            "limit": limit,
+    data = {
+        "articles": [NewsArticle.from_orm(article).model_dump() for article in articles],
+        "filters": {
+            "query": q,
+            "category": category,
+            "source": source,
+            "language": language,
+            "tags": tag_list,
+            "sentiment_range": (
+                [sentiment_min, sentiment_max]
+                if sentiment_min is not None or sentiment_max is not None
+                else None
+            ),
+            "date_range": (
+                [start_date, end_date] if start_date is not None or end_date is not None else None
+            ),
         },
-    )
+        "total": len(articles),
+        "skip": skip,
+        "limit": limit,
+    }
+    if facet_names:
+        data["facets"] = await NewsService.get_search_facets(db, facet_names, **filters)
+
+    return APIResponse(success=True, message=f"Found {len(articles)} articles", data=data)
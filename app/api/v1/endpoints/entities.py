@@ -11,13 +11,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.profiling import ProfiledRoute
 from app.models.news_models import Entity
 from app.schemas.news_schemas import APIResponse
 from app.schemas.news_schemas import Entity as EntitySchema
 from app.schemas.news_schemas import EntityCreate, EntityUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 
 @router.post("/", response_model=APIResponse)
@@ -48,7 +49,7 @@ async def create_entity(entity: EntityCreate, db: AsyncSession = Depends(get_db)
 
 
 @router.get("/{entity_id}", response_model=APIResponse)
-async def get_entity(entity_id: int, db: AsyncSession = Depends(get_db)):
+async def get_entity(entity_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific entity by ID."""
     result = await db.execute(select(Entity).where(Entity.id == entity_id))
     entity = result.scalar_one_or_none()
@@ -77,7 +78,7 @@ async def get_entities(
         "name", description="Field to sort by (name, confidence_score, created_at)"
     ),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order: 'asc' or 'desc'"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get list of entities with filtering, sorting, and pagination.
@@ -169,7 +170,7 @@ async def search_entities(
     entity_type: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Search entities by name."""
     query = select(Entity).where(Entity.name.ilike(f"%{q}%")).offset(skip).limit(limit)
@@ -8,11 +8,12 @@ Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_pool_stats
+from app.core.profiling import ProfiledRoute
 from app.core.redis_client import redis_client
 from app.schemas.news_schemas import APIResponse
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 
 @router.get("/", response_model=APIResponse)
@@ -52,6 +53,12 @@ async def database_health(db: AsyncSession = Depends(get_db)):
         return APIResponse(success=False, message=f"Database connection failed: {str(e)}")
 
 
+@router.get("/database/pool", response_model=APIResponse)
+async def database_pool_stats():
+    """Connection pool occupancy, checkout counts and wait times per engine."""
+    return APIResponse(success=True, message="Database pool statistics", data=get_pool_stats())
+
+
 @router.get("/redis", response_model=APIResponse)
 async def redis_health():
     """Redis-specific health check."""
@@ -11,13 +11,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.profiling import ProfiledRoute
 from app.models.news_models import Trend
 from app.schemas.news_schemas import APIResponse
 from app.schemas.news_schemas import Trend as TrendSchema
 from app.schemas.news_schemas import TrendCreate, TrendUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 
 @router.post("/", response_model=APIResponse)
@@ -39,7 +40,7 @@ async def create_trend(trend: TrendCreate, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{trend_id}", response_model=APIResponse)
-async def get_trend(trend_id: int, db: AsyncSession = Depends(get_db)):
+async def get_trend(trend_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get a specific trend by ID."""
     result = await db.execute(select(Trend).where(Trend.id == trend_id))
     trend = result.scalar_one_or_none()
@@ -72,7 +73,7 @@ async def get_trends(
     sort_order: str = Query(
         "desc", regex="^(asc|desc)$", description="Sort order: 'asc' or 'desc'"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get list of trends with filtering, sorting, and pagination.
@@ -170,7 +171,7 @@ async def delete_trend(trend_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/active/", response_model=APIResponse)
-async def get_active_trends(db: AsyncSession = Depends(get_db)):
+async def get_active_trends(db: AsyncSession = Depends(get_read_db)):
     """Get currently active trends (no end_date)."""
     result = await db.execute(
         select(Trend).where(Trend.end_date.is_(None)).order_by(Trend.confidence_score.desc())
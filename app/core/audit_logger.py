@@ -5,176 +5,145 @@ Track all API requests and responses for security analysis
 Built by Elite Team - DevOps Engineer (Kubernetes Expert)
 """
 
-import json
 import logging
 import time
-from datetime import datetime
-from typing import Callable
+import uuid
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.audit_sink import AuditSink, audit_sink
 
 logger = logging.getLogger("aras.audit")
 
 
-class AuditLoggerMiddleware(BaseHTTPMiddleware):
+def get_client_ip(scope: Scope, headers: Headers) -> str:
+    """Client IP address, preferring the proxy's forwarded headers."""
+    # Check for forwarded IP (behind proxy/load balancer)
+    forwarded_for = headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+
+    # Check for real IP header
+    real_ip = headers.get("x-real-ip")
+    if real_ip:
+        return real_ip
+
+    # Fallback to direct client
+    client = scope.get("client")
+    if client:
+        return client[0]
+
+    return "unknown"
+
+
+class AuditLoggerMiddleware:
     """
     Middleware for comprehensive API audit logging.
-    
-    Logs all HTTP requests and responses with:
-    - Request: method, path, query params, headers, IP, user agent
+
+    Logs one record per HTTP request once the response has been sent:
+    - Request: method, path, query string, IP, user agent, referer
     - Response: status code, duration, size
-    - Errors: exception details, stack trace
-    
-    Logs are structured JSON for easy parsing and analysis.
+    - Errors: exception details (stack trace goes to the regular log)
+
+    Records are handed to the audit sink, which batches them to NDJSON
+    off the event loop; successful GETs may be sampled (AUDIT_*_SAMPLE_RATE).
+
+    Pure ASGI: request metadata comes straight from the scope and the
+    X-Request-ID / X-Response-Time / X-Process-Time headers are added to
+    the http.response.start message.
     """
-    
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        # Configure structured JSON logging
-        self._configure_logger()
-    
-    def _configure_logger(self):
-        """Configure audit logger with JSON formatter."""
-        # Create console handler with JSON formatting
-        handler = logging.StreamHandler()
-        handler.setLevel(logging.INFO)
-        
-        # Custom JSON formatter
-        class JSONFormatter(logging.Formatter):
-            def format(self, record):
-                log_data = {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                }
-                
-                # Add extra fields if present
-                if hasattr(record, 'audit_data'):
-                    log_data.update(record.audit_data)
-                
-                return json.dumps(log_data)
-        
-        handler.setFormatter(JSONFormatter())
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        logger.propagate = False
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    def __init__(self, app: ASGIApp, sink: Optional[AuditSink] = None):
+        self.app = app
+        self.sink = sink or audit_sink
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log audit trail."""
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate request ID
-        request_id = self._generate_request_id(request)
-        
+        request_id = str(uuid.uuid4())
+
         # Start timer
-        start_time = time.time()
-        
-        # Extract request metadata
-        request_data = {
-            "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "client_ip": self._get_client_ip(request),
-            "user_agent": request.headers.get("user-agent", ""),
-            "referer": request.headers.get("referer", ""),
-        }
-        
-        # Log request
-        logger.info(
-            f"{request.method} {request.url.path}",
-            extra={"audit_data": {
-                **request_data,
-                "event": "request_received",
-            }}
-        )
-        
+        started_at = time.time()
+        start_time = time.perf_counter()
+        status_code = 0
+        response_size = 0
+
+        async def send_with_audit(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                # Duration up to the first byte of the response
+                duration = time.perf_counter() - start_time
+                status_code = message["status"]
+
+                # Add audit headers
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-request-id", request_id.encode("latin-1")),
+                    (b"x-response-time", f"{duration * 1000:.2f}ms".encode("latin-1")),
+                    (b"x-process-time", str(duration).encode("latin-1")),
+                ]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Extract response metadata
-            response_data = {
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-                "response_size": int(response.headers.get("content-length", 0)),
-            }
-            
-            # Log response
-            logger.info(
-                f"{request.method} {request.url.path} - {response.status_code}",
-                extra={"audit_data": {
-                    **request_data,
-                    **response_data,
-                    "event": "request_completed",
-                }}
-            )
-            
-            # Add audit headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
-            
-            return response
-            
+            await self.app(scope, receive, send_with_audit)
         except Exception as e:
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
             # Log error
-            logger.error(
-                f"{request.method} {request.url.path} - ERROR: {str(e)}",
-                extra={"audit_data": {
-                    **request_data,
-                    "event": "request_error",
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "duration_ms": round(duration_ms, 2),
-                }},
-                exc_info=True
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            record = self._record(scope, request_id, started_at, "request_error")
+            record.update(
+                error=str(e),
+                error_type=type(e).__name__,
+                duration_ms=round(duration_ms, 2),
             )
-            
+            self.sink.emit(record)
+            logger.error(f"{scope['method']} {scope['path']} - ERROR: {str(e)}", exc_info=True)
             raise
-    
-    def _generate_request_id(self, request: Request) -> str:
-        """Generate unique request ID."""
-        import uuid
-        return str(uuid.uuid4())
-    
-    def _get_client_ip(self, request: Request) -> str:
+
+        if not self.sink.sampled(scope["method"], scope["path"], status_code):
+            return
+        record = self._record(scope, request_id, started_at, "request_completed")
+        record.update(
+            status_code=status_code,
+            duration_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            response_size=response_size,
+        )
+        self.sink.emit(record)
+
+    def _record(self, scope: Scope, request_id: str, started_at: float, event: str) -> dict:
+        """Request metadata straight from the scope."""
+        headers = Headers(scope=scope)
+        return {
+            "ts": started_at,
+            "event": event,
+            "request_id": request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope["query_string"].decode("latin-1"),
+            "client_ip": self._get_client_ip(scope, headers),
+            "user_agent": headers.get("user-agent", ""),
+            "referer": headers.get("referer", ""),
+        }
+
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """Extract client IP address."""
-        # Check for forwarded IP (behind proxy/load balancer)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        # Check for real IP header
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-        
-        # Fallback to direct client
-        if request.client:
-            return request.client.host
-        
-        return "unknown"
+        return get_client_ip(scope, headers)
 
 
 # Utility function for manual audit logging
 def log_audit_event(
-    event: str,
-    user_id: str = None,
-    action: str = None,
-    resource: str = None,
-    details: dict = None
+    event: str, user_id: str = None, action: str = None, resource: str = None, details: dict = None
 ):
     """
     Log custom audit event.
-    
+
     Args:
         event: Event type (e.g., "user_login", "data_access")
         user_id: User identifier
@@ -184,9 +153,9 @@ def log_audit_event(
     """
     audit_data = {
         "event": event,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "ts": time.time(),
     }
-    
+
     if user_id:
         audit_data["user_id"] = user_id
     if action:
@@ -195,8 +164,5 @@ def log_audit_event(
         audit_data["resource"] = resource
     if details:
         audit_data["details"] = details
-    
-    logger.info(
-        f"Audit: {event}",
-        extra={"audit_data": audit_data}
-    )
+
+    audit_sink.emit(audit_data)
@@ -0,0 +1,233 @@
+"""
+ARAS Audit Log Sink
+Non-blocking, batched NDJSON writer for audit records
+
+Request handlers only append a dict to a bounded ring buffer; a daemon
+thread drains it in batches, encodes with orjson and writes to stderr, a
+size-rotated file or a Redis Stream. When the buffer is full the oldest
+records are dropped (and counted) rather than slowing requests down.
+
+Built by Elite Team - DevOps Engineer (Kubernetes Expert)
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # Declared dependency; stdlib fallback keeps logging alive
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def encode_record(record: Dict) -> bytes:
+    """One NDJSON line (timestamps are stored as epoch seconds until here)."""
+    record = dict(record)
+    record["timestamp"] = (
+        datetime.fromtimestamp(record.pop("ts"), timezone.utc).isoformat().replace("+00:00", "Z")
+    )
+    if orjson is not None:
+        return orjson.dumps(record, default=str) + b"\n"
+    return json.dumps(record, default=str).encode() + b"\n"
+
+
+class StreamWriter:
+    """Writes batches to stderr."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stderr.buffer
+
+    def write(self, lines: List[bytes]) -> None:
+        self.stream.write(b"".join(lines))
+        self.stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+class RotatingFileWriter:
+    """Appends batches to a file, rotating it to path.1 .. path.N by size."""
+
+    def __init__(self, path: str, max_bytes: int, backups: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, "ab")
+
+    def write(self, lines: List[bytes]) -> None:
+        data = b"".join(lines)
+        if self.max_bytes and self.file.tell() and self.file.tell() + len(data) > self.max_bytes:
+            self._rotate()
+        self.file.write(data)
+        self.file.flush()
+
+    def _rotate(self) -> None:
+        self.file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "ab")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class RedisStreamWriter:
+    """XADDs each record to a capped Redis Stream, one pipeline per batch."""
+
+    def __init__(self, url: str, stream: str, maxlen: int):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.stream = stream
+        self.maxlen = maxlen
+
+    def write(self, lines: List[bytes]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for line in lines:
+            pipe.xadd(
+                self.stream, {"record": line.rstrip(b"\n")}, maxlen=self.maxlen, approximate=True
+            )
+        pipe.execute()
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def build_writer():
+    """Writer selected by AUDIT_SINK (stream, file or redis)."""
+    if settings.AUDIT_SINK == "file":
+        return RotatingFileWriter(
+            settings.AUDIT_LOG_FILE, settings.AUDIT_LOG_MAX_BYTES, settings.AUDIT_LOG_BACKUPS
+        )
+    if settings.AUDIT_SINK == "redis":
+        return RedisStreamWriter(
+            settings.REDIS_URL, settings.AUDIT_REDIS_STREAM, settings.AUDIT_REDIS_MAXLEN
+        )
+    return StreamWriter()
+
+
+class AuditSink:
+    """Bounded ring buffer drained by a background writer thread."""
+
+    def __init__(
+        self,
+        writer=None,
+        buffer_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        get_sample_rate: Optional[float] = None,
+        sample_rates: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize sink.
+
+        Args:
+            writer: Batch writer (defaults to the one chosen by AUDIT_SINK, built on first use)
+            buffer_size: Records held before the oldest are dropped
+            batch_size: Records per write
+            flush_interval: Seconds between drains when traffic is light
+            get_sample_rate: Fraction of successful GETs recorded
+            sample_rates: Per path-prefix overrides of get_sample_rate
+        """
+        self.writer = writer
+        self.batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self.flush_interval = (
+            settings.AUDIT_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+        self.get_sample_rate = (
+            settings.AUDIT_GET_SAMPLE_RATE if get_sample_rate is None else get_sample_rate
+        )
+        sample_rates = settings.AUDIT_SAMPLE_RATES if sample_rates is None else sample_rates
+        # Longest prefix first so the most specific route wins
+        self.sample_rates = sorted(
+            sample_rates.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.buffer: deque = deque(maxlen=buffer_size or settings.AUDIT_BUFFER_SIZE)
+        self.dropped = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def sampled(self, method: str, path: str, status_code: int) -> bool:
+        """Whether a request should be recorded (errors and writes always are)."""
+        if method != "GET" or status_code >= 400:
+            return True
+        rate = self.get_sample_rate
+        for prefix, prefix_rate in self.sample_rates:
+            if path.startswith(prefix):
+                rate = prefix_rate
+                break
+        return rate >= 1.0 or random.random() < rate
+
+    def emit(self, record: Dict) -> None:
+        """Queue a record without blocking; record["ts"] is epoch seconds."""
+        if self._thread is None:
+            self._start()
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(record)
+        if len(self.buffer) >= self.batch_size:
+            self._wake.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            if self.writer is None:
+                self.writer = build_writer()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+        self.flush()
+
+    def flush(self) -> None:
+        """Write everything buffered so far (called from the writer thread)."""
+        while self.buffer:
+            batch = []
+            while self.buffer and len(batch) < self.batch_size:
+                batch.append(self.buffer.popleft())
+            try:
+                self.writer.write([encode_record(record) for record in batch])
+            except Exception as e:
+                logger.error(f"Audit sink write failed, {len(batch)} records lost: {e}")
+
+    def close(self) -> None:
+        """Stop the writer thread after a final flush."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        thread.join()
+        self.writer.close()
+        if self.dropped:
+            logger.warning(f"Audit sink dropped {self.dropped} records (buffer full)")
+
+
+audit_sink = AuditSink()
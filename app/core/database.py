@@ -5,23 +5,198 @@ Database-agnostic setup with SQLAlchemy
 Built by Elite Team - Database Engineer (PhD in Database Systems)
 """
 
+import itertools
 import logging
-from typing import AsyncGenerator
+import time
+import uuid
+from typing import AsyncGenerator, Dict, List
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from app.core.audit_logger import get_client_ip
 from app.core.config import settings
+from app.core.metrics import REGISTRY
+from app.core.partitions import maintain_partitions
+from app.core.query_stats import instrument_engine
+from app.core.redis_client import redis_client
 
 logger = logging.getLogger(__name__)
 
+
+class PoolMetrics:
+    """Connection pool counters for one engine (checkouts, wait time, timeouts)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record how long a checkout waited for a connection."""
+        self.wait_seconds_total += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+
+    def snapshot(self, pool) -> Dict:
+        """Return counters plus the pool's current occupancy."""
+        stats = {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": (
+                round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0
+            ),
+        }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                {
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return stats
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that times how long each checkout waits."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        """Carry metrics over when the engine disposes and rebuilds its pool."""
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+# Engine name -> metrics, reported by get_pool_stats()
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def _engine_options(url: str) -> Dict:
+    """
+    Build create_async_engine options from Settings.
+
+    SQLite (tests/dev) keeps SQLAlchemy's default pool; server databases get a
+    sized, recycled queue pool. For asyncpg the prepared statement cache is
+    configurable, and DATABASE_PGBOUNCER disables server-side statement caching
+    and uses unique statement names so PgBouncer transaction pooling works.
+    """
+    options = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": True,
+    }
+    backend = make_url(url)
+    if backend.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        {
+            "poolclass": InstrumentedAsyncQueuePool,
+            "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+            "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+            "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        }
+    )
+
+    if backend.get_driver_name() == "asyncpg":
+        if settings.DATABASE_PGBOUNCER:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        else:
+            options["connect_args"] = {
+                "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            }
+
+    return options
+
+
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    """Create an async engine with the shared options and pool metrics."""
+    db_engine = create_async_engine(url, **_engine_options(url))
+
+    metrics = PoolMetrics(name)
+    pool_metrics[name] = metrics
+    pool = db_engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        pool.metrics = metrics
+
+    @event.listens_for(db_engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(db_engine.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(db_engine.sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    instrument_engine(db_engine.sync_engine)
+    return db_engine
+
+
+def get_pool_stats() -> Dict[str, Dict]:
+    """Return pool metrics for the primary and every replica engine."""
+    engines = {"primary": engine}
+    engines.update({f"replica_{i}": e for i, e in enumerate(read_engines, start=1)})
+    return {
+        name: pool_metrics[name].snapshot(db_engine.sync_engine.pool)
+        for name, db_engine in engines.items()
+    }
+
+
+# Pool statistics that only ever grow are exported as counters
+_POOL_COUNTERS = {"checkouts", "checkins", "connects", "timeouts", "wait_seconds_total"}
+
+
+def _collect_pool_metrics():
+    """Scrape-time /metrics families from get_pool_stats()."""
+    families: Dict[str, List] = {}
+    for name, stats in get_pool_stats().items():
+        for stat, value in stats.items():
+            families.setdefault(stat, []).append(({"engine": name}, value))
+    for stat, samples in families.items():
+        kind = "counter" if stat in _POOL_COUNTERS else "gauge"
+        yield f"aras_db_pool_{stat}", kind, f"Database pool {stat.replace('_', ' ')}", samples
+
+
+REGISTRY.register_collector(_collect_pool_metrics)
+
+
 # Create async engine (DB-agnostic - works with PostgreSQL, MySQL, SQLite, etc.)
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-)
+engine = _create_engine(settings.DATABASE_URL, "primary")
 
 # Create async session factory
 async_session_maker = sessionmaker(
@@ -30,6 +205,38 @@ async_session_maker = sessionmaker(
     expire_on_commit=False,
 )
 
+# Read replica engines (round-robin); empty when no replicas are configured
+read_engines: List[AsyncEngine] = [
+    _create_engine(url, f"replica_{i}")
+    for i, url in enumerate(settings.DATABASE_READ_URLS, start=1)
+]
+read_session_makers = [
+    sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+    for read_engine in read_engines
+]
+_read_session_cycle = itertools.cycle(read_session_makers) if read_session_makers else None
+
+# Client key -> monotonic deadline until which its reads stay on the primary.
+# Shared with every worker and pod through a Redis key of the same lifetime;
+# this map only spares the Redis lookup when the write came through this process.
+_recent_writers: Dict[str, float] = {}
+
+READ_STICKY_PREFIX = "read_sticky"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_session_writes(session: Session, flush_context) -> None:
+    """Flag sessions that wrote rows so get_db can pin the client to the primary."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state) -> None:
+    """Flag sessions that ran ORM UPDATE/DELETE statements, which bypass flush."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
 # Base class for all models
 Base = declarative_base()
 
@@ -45,6 +252,15 @@ async def create_tables() -> None:
         raise
 
 
+async def prepare_schema() -> None:
+    """Create tables, then upcoming article partitions."""
+    await create_tables()
+    try:
+        await maintain_partitions(engine)
+    except Exception as e:
+        logger.warning(f"Partition maintenance failed: {e}")
+
+
 async def drop_tables() -> None:
     """Drop all database tables (for testing/cleanup)."""
     try:
@@ -56,9 +272,50 @@ async def drop_tables() -> None:
         raise
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+def _client_key(request: Request) -> str:
+    """Identify a client for read-your-writes stickiness (IP and optional API key)."""
+    # The forwarded address: behind a proxy request.client is the load balancer
+    client_ip = get_client_ip(request.scope, request.headers)
+    api_key = request.headers.get("X-API-Key", "")
+    return f"{client_ip}:{api_key}" if api_key else client_ip
+
+
+async def _mark_recent_writer(request: Request) -> None:
+    """Pin a client's reads to the primary for DATABASE_READ_STICKY_SECONDS."""
+    if not read_session_makers or settings.DATABASE_READ_STICKY_SECONDS <= 0:
+        return
+
+    key = _client_key(request)
+    now = time.monotonic()
+    _recent_writers[key] = now + settings.DATABASE_READ_STICKY_SECONDS
+    await redis_client.set(
+        f"{READ_STICKY_PREFIX}:{key}", "1", ttl=settings.DATABASE_READ_STICKY_SECONDS
+    )
+
+    # Keep the map bounded by dropping expired entries now and then
+    if len(_recent_writers) > 10_000:
+        for key, deadline in list(_recent_writers.items()):
+            if deadline <= now:
+                del _recent_writers[key]
+
+
+async def _use_primary_for_read(request: Request) -> bool:
+    """Decide whether a read must go to the primary instead of a replica."""
+    if not read_session_makers:
+        return True
+    if request.headers.get("X-Consistency", "").lower() == "strong":
+        return True
+    key = _client_key(request)
+    deadline = _recent_writers.get(key)
+    if deadline is not None and deadline > time.monotonic():
+        return True
+    # The write may have been served by another worker or pod
+    return await redis_client.exists(f"{READ_STICKY_PREFIX}:{key}")
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency for getting async database session.
+    Dependency for getting async database session (primary).
 
     Usage:
         async def my_endpoint(db: AsyncSession = Depends(get_db)):
@@ -69,6 +326,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            if session.info.get("has_writes"):
+                await _mark_recent_writer(request)
         except Exception as e:
             await session.rollback()
             logger.error(f"Database session error: {e}")
@@ -77,6 +336,42 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints.
+
+    Load-balances sessions across DATABASE_READ_URLS replicas (round-robin).
+    Falls back to the primary when no replicas are configured, when the client
+    wrote within DATABASE_READ_STICKY_SECONDS (read-your-writes), or when the
+    request sends "X-Consistency: strong".
+
+    Usage:
+        async def my_endpoint(db: AsyncSession = Depends(get_read_db)):
+            # Read-only queries here
+            pass
+    """
+    if await _use_primary_for_read(request):
+        session_maker = async_session_maker
+    else:
+        session_maker = next(_read_session_cycle)
+
+    async with session_maker() as session:
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Database read session error: {e}")
+            raise
+        finally:
+            await session.rollback()
+            await session.close()
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections on the primary and all replicas."""
+    for db_engine in [engine, *read_engines]:
+        await db_engine.dispose()
+
+
 async def check_db_connection() -> bool:
     """Check database connection health."""
     try:
@@ -0,0 +1,40 @@
+"""
+ARAS Lazy Imports
+Defer loading heavy libraries until they are first used
+
+Importing spaCy costs about a second and pulls in numpy, thinc and
+friends; the API, task worker and scripts import the NLP modules even
+when a request never touches a model. lazy_import returns a module whose
+code only runs on the first attribute access.
+
+Built by Elite Team - Software Architect (PhD in Computer Science)
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily with importlib's LazyLoader.
+
+    The module is registered in sys.modules right away, so later plain
+    imports get the same (possibly still unloaded) module object.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed (checked eagerly)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,316 @@
+"""
+ARAS Metrics
+In-process counters, gauges and histograms in Prometheus text format
+
+Recording is a dict lookup and a couple of list increments, with no locks
+on the hot path (an increment racing between threads may very rarely be
+lost, which is acceptable for metrics). Histograms store per-bucket counts
+and only build cumulative buckets when /metrics is scraped. Gauges updated
+from worker threads take a lock, since a lost inc/dec would drift forever.
+
+Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Seconds; fits HTTP requests and NLP calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Seconds; fits Redis round trips and single SQL statements
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+# Statements per request
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (metric name, type, help, [(labels, value), ...])
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def collect(self) -> Iterable[Family]:
+        samples = [
+            (dict(zip(self.labelnames, labels)), value)
+            for labels, value in list(self._values.items())
+        ]
+        yield self.name, self.kind, self.documentation, samples
+
+
+class Gauge(Counter):
+    """Value that goes up and down; thread-safe."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+
+class Histogram:
+    """Bucketed distribution with sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [count per bucket..., count above last bucket, sum]
+        self._series: Dict[tuple, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series.setdefault(labels, [0] * (len(self.buckets) + 1) + [0.0])
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def collect(self) -> Iterable[Family]:
+        buckets, sums, counts = [], [], []
+        for labels, series in list(self._series.items()):
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                buckets.append(({**base, "le": _format_value(float(bound))}, cumulative))
+            sums.append((base, series[-1]))
+            counts.append((base, cumulative))
+        yield f"{self.name}_bucket", self.kind, self.documentation, buckets
+        yield f"{self.name}_sum", "", "", sums
+        yield f"{self.name}_count", "", "", counts
+
+
+class MetricsRegistry:
+    """Metrics and scrape-time collectors rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Add a callable producing metric families when scraped."""
+        self._collectors.append(collector)
+
+    def collect(self) -> List[Family]:
+        """Current families of every metric and collector."""
+        families = [family for metric in self._metrics.values() for family in metric.collect()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def render(self, families: Optional[Iterable[Family]] = None) -> str:
+        """Prometheus text exposition of the given families (default: this process)."""
+        lines = []
+        if families is None:
+            families = self.collect()
+        for name, kind, documentation, samples in families:
+            if kind:
+                base = name[: -len("_bucket")] if kind == "histogram" else name
+                lines.append(f"# HELP {base} {documentation}")
+                lines.append(f"# TYPE {base} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "aras_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+REDIS_OPERATION_SECONDS = REGISTRY.histogram(
+    "aras_redis_operation_duration_seconds",
+    "Redis command latency",
+    ("operation",),
+    buckets=FAST_BUCKETS,
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "aras_db_query_duration_seconds",
+    "SQL statement latency by statement type",
+    ("operation",),
+    buckets=FAST_BUCKETS,
+)
+DB_QUERIES_PER_REQUEST = REGISTRY.histogram(
+    "aras_db_queries_per_request",
+    "SQL statements executed per request by route template",
+    ("route",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_TIME_PER_REQUEST = REGISTRY.histogram(
+    "aras_db_time_per_request_seconds",
+    "Time spent executing SQL per request by route template",
+    ("route",),
+)
+DB_REPEATED_QUERIES = REGISTRY.counter(
+    "aras_db_repeated_queries_total",
+    "Requests that ran one statement SQL_REPEATED_QUERY_THRESHOLD or more times (likely N+1)",
+    ("route",),
+)
+NLP_INFERENCE_SECONDS = REGISTRY.histogram(
+    "aras_nlp_inference_duration_seconds",
+    "Time spent inside the NLP engine per analysis",
+    ("analysis",),
+)
+NLP_EXECUTOR_QUEUED = REGISTRY.gauge(
+    "aras_nlp_executor_queued",
+    "NLP calls waiting for an executor thread",
+)
+NLP_EXECUTOR_RUNNING = REGISTRY.gauge(
+    "aras_nlp_executor_running",
+    "NLP calls currently running",
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "aras_cache_requests_total",
+    "Cache lookups by result (hit or miss)",
+    ("cache", "result"),
+)
+INGESTION_ITEMS = REGISTRY.counter(
+    "aras_ingestion_stage_items_total",
+    "Items processed by each ingestion stage",
+    ("stage",),
+)
+INGESTION_STAGE_SECONDS = REGISTRY.histogram(
+    "aras_ingestion_stage_duration_seconds",
+    "Ingestion stage handler latency (per item or batch)",
+    ("stage",),
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+def route_template(scope: Scope) -> str:
+    """Matched route path with router prefixes, or "unmatched"."""
+    # Routers included lazily by newer FastAPI keep the prefixed path here;
+    # scope["route"] then only holds the path relative to its router
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(context, "path", None) or getattr(scope.get("route"), "path", None)
+    return path or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency per route template.
+
+    The template (e.g. /api/v1/articles/{article_id}) comes from the route
+    the router stored in the scope, which keeps label cardinality bounded;
+    requests that match no route are grouped as "unmatched".
+    """
+
+    def __init__(self, app: ASGIApp, histogram: Histogram = HTTP_REQUEST_SECONDS):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.histogram.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route_template(scope),
+                str(status_code),
+            )
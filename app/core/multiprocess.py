@@ -0,0 +1,212 @@
+"""
+ARAS Multi-Process State
+Metrics and slow requests shared between gunicorn workers
+
+Counters, histograms and the slow-request log live in each worker's
+memory, so a /metrics scrape answered by one worker would only see that
+worker's share and Prometheus would see series jump between workers.
+With MULTIPROCESS_DIR set (gunicorn.conf.py sets it for every worker), each
+worker writes a JSON snapshot of both to <dir>/<kind>-<pid>.json every
+MULTIPROCESS_SYNC_INTERVAL seconds, atomically by rename. The worker that
+answers a request writes its own snapshot first and merges the latest one
+of every other worker, so other workers' figures are at most one interval
+old. Samples with the same name and labels are summed, gauges included
+(e.g. pool connections in use across the pod).
+
+When a worker exits, the master folds its counters and histograms into
+metrics-retired.json so totals never go backwards; its gauges and slow
+requests are dropped.
+
+Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
+"""
+
+import glob
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY, Family, MetricsRegistry
+from app.core.profiling import SlowRequestLog, slow_requests
+
+logger = logging.getLogger(__name__)
+
+METRICS = "metrics"
+SLOW_REQUESTS = "slow"
+RETIRED = "retired"
+# Entries captured before this time are hidden by DELETE /debug/slow-requests
+SLOW_REQUESTS_CLEARED = "slow-cleared.txt"
+# Everything this module writes (snapshots, the clear marker, interrupted temporaries)
+OWN_FILES = (
+    f"{METRICS}-*.json",
+    f"{SLOW_REQUESTS}-*.json",
+    SLOW_REQUESTS_CLEARED,
+    f"{METRICS}-*.json.*.tmp",
+    f"{SLOW_REQUESTS}-*.json.*.tmp",
+    f"{SLOW_REQUESTS_CLEARED}.*.tmp",
+)
+
+
+def enabled() -> bool:
+    return bool(settings.MULTIPROCESS_DIR)
+
+
+def prepare_directory() -> str:
+    """
+    Create the shared directory (or clear this module's files from it); run once
+    by the master before forking.
+
+    Only files written here are removed, so MULTIPROCESS_DIR may safely point at
+    a directory shared with other programs.
+
+    Returns:
+        The directory, also stored in settings so workers inherit it
+    """
+    directory = settings.MULTIPROCESS_DIR or tempfile.mkdtemp(prefix="aras-multiprocess-")
+    os.makedirs(directory, exist_ok=True)
+    for pattern in OWN_FILES:
+        for path in glob.glob(os.path.join(directory, pattern)):
+            if os.path.isfile(path):
+                os.remove(path)  # Left over from a previous server
+    settings.MULTIPROCESS_DIR = directory
+    return directory
+
+
+def _path(kind: str, process: object) -> str:
+    return os.path.join(settings.MULTIPROCESS_DIR, f"{kind}-{process}.json")
+
+
+def _write(path: str, data) -> None:
+    # Unique temporary name: the publisher thread and a request may write at once
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _read(path: str):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None  # Removed by the master meanwhile
+
+
+def _read_others(kind: str) -> List:
+    """Snapshots of kind from every other process (retired totals included)."""
+    own = _path(kind, os.getpid())
+    paths = glob.glob(os.path.join(settings.MULTIPROCESS_DIR, f"{kind}-*.json"))
+    snapshots = [_read(path) for path in sorted(paths) if path != own]
+    return [data for data in snapshots if data is not None]
+
+
+def publish(registry: MetricsRegistry = REGISTRY, log: SlowRequestLog = slow_requests) -> None:
+    """Write this process's metrics and slow requests for the other workers."""
+    pid = os.getpid()
+    _write(_path(METRICS, pid), registry.collect())
+    _write(_path(SLOW_REQUESTS, pid), list(log.entries))
+
+
+def merge_families(snapshots: List[List[Family]]) -> List[Family]:
+    """Sum samples with the same metric name and labels across snapshots."""
+    merged: Dict[str, tuple] = {}
+    for families in snapshots:
+        for name, kind, documentation, samples in families:
+            family = merged.setdefault(name, (kind, documentation, {}))
+            for labels, value in samples:
+                key = tuple(labels.items())
+                family[2][key] = family[2].get(key, 0) + value
+    return [
+        (name, kind, documentation, [(dict(key), value) for key, value in samples.items()])
+        for name, (kind, documentation, samples) in merged.items()
+    ]
+
+
+def collect_metrics(registry: MetricsRegistry = REGISTRY) -> List[Family]:
+    """Families of the whole server, or of this process when not shared."""
+    if not enabled():
+        return registry.collect()
+    own = registry.collect()
+    _write(_path(METRICS, os.getpid()), own)
+    return merge_families([own, *_read_others(METRICS)])
+
+
+def collect_slow_requests(
+    log: SlowRequestLog = slow_requests, limit: Optional[int] = None
+) -> List[Dict]:
+    """Captured slow requests of every worker, newest first."""
+    if not enabled():
+        return log.snapshot(limit)
+    own = list(log.entries)
+    _write(_path(SLOW_REQUESTS, os.getpid()), own)
+    cleared = _read(os.path.join(settings.MULTIPROCESS_DIR, SLOW_REQUESTS_CLEARED)) or 0
+    entries = [
+        entry
+        for entries in [own, *_read_others(SLOW_REQUESTS)]
+        for entry in entries
+        if entry.get("timestamp", 0) >= cleared
+    ]
+    entries.sort(key=lambda entry: entry.get("timestamp", 0), reverse=True)
+    return entries[:limit] if limit else entries
+
+
+def clear_slow_requests(log: SlowRequestLog = slow_requests) -> None:
+    """Empty this worker's buffer and hide every worker's earlier entries."""
+    log.clear()
+    if enabled():
+        _write(os.path.join(settings.MULTIPROCESS_DIR, SLOW_REQUESTS_CLEARED), time.time())
+
+
+def retire(pid: int) -> None:
+    """Fold an exited worker's counters and histograms into the retired totals."""
+    if not enabled():
+        return
+    families = _read(_path(METRICS, pid))
+    if families:
+        # Gauges describe a live process; histogram _sum/_count families have no kind
+        kept = [family for family in families if family[1] != "gauge"]
+        retired = _read(_path(METRICS, RETIRED)) or []
+        _write(_path(METRICS, RETIRED), merge_families([retired, kept]))
+    for kind in (METRICS, SLOW_REQUESTS):
+        try:
+            os.remove(_path(kind, pid))
+        except FileNotFoundError:
+            pass
+
+
+class Publisher:
+    """Daemon thread publishing this worker's snapshots every interval."""
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = settings.MULTIPROCESS_SYNC_INTERVAL if interval is None else interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if not enabled() or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="aras-multiprocess", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                publish()
+            except Exception as e:
+                logger.error(f"Failed to publish worker metrics: {e}")
+
+    def stop(self) -> None:
+        """Stop the thread and write a final snapshot."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        publish()
+
+
+publisher = Publisher()
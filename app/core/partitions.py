@@ -0,0 +1,181 @@
+"""
+ARAS Microservice Table Partitioning
+Monthly range partition maintenance for PostgreSQL
+
+Built by Elite Team - Database Engineer (PhD in Database Systems)
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(value: date) -> date:
+    """Return the first day of the month containing value."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Return the partition table name for a month, e.g. news_articles_2025_11."""
+    return f"{table}_{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[date]:
+    """Parse the month back out of a partition name (None for the default partition)."""
+    prefix = f"{table}_"
+    if not name.startswith(prefix):
+        return None
+    try:
+        year, month = name[len(prefix) :].split("_")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        return None
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    """Check whether a table is a declaratively partitioned PostgreSQL table."""
+    result = await conn.execute(
+        text("""
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = :table
+            """),
+        {"table": table},
+    )
+    return result.scalar() is not None
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> List[str]:
+    """List the names of partitions currently attached to a table."""
+    result = await conn.execute(
+        text("""
+            SELECT child.relname FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = :table
+            ORDER BY child.relname
+            """),
+        {"table": table},
+    )
+    return [row[0] for row in result.fetchall()]
+
+
+async def ensure_future_partitions(
+    conn: AsyncConnection, table: str, months_ahead: int, today: Optional[date] = None
+) -> List[str]:
+    """
+    Create monthly partitions from the current month up to months_ahead.
+
+    Returns:
+        Names of the partitions that were created
+    """
+    existing = set(await list_partitions(conn, table))
+    current = month_start(today or datetime.utcnow().date())
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(table, month)
+        if name in existing:
+            continue
+
+        # Rows already routed to the default partition for this month would make
+        # the attach fail; leave that month in the default partition and warn.
+        try:
+            async with conn.begin_nested():
+                await conn.execute(
+                    text(
+                        f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ('{month.isoformat()}') "
+                        f"TO ('{add_months(month, 1).isoformat()}')"
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"Could not create partition {name}: {e}")
+            continue
+
+        created.append(name)
+        logger.info(f"Created partition {name}")
+
+    return created
+
+
+async def archive_old_partitions(
+    conn: AsyncConnection,
+    table: str,
+    retention_months: int,
+    archive_schema: str,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    Detach partitions older than the retention window and move them to archive_schema.
+
+    Detached partitions keep their data and can be dumped or dropped separately.
+
+    Returns:
+        Names of the partitions that were archived
+    """
+    if retention_months <= 0:
+        return []
+
+    cutoff = add_months(month_start(today or datetime.utcnow().date()), -retention_months)
+
+    archived = []
+    for name in await list_partitions(conn, table):
+        month = parse_partition_month(table, name)
+        if month is None or month >= cutoff:
+            continue
+
+        await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+        await conn.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+        await conn.execute(text(f'ALTER TABLE "{name}" SET SCHEMA "{archive_schema}"'))
+
+        archived.append(name)
+        logger.info(f"Archived partition {name} to schema {archive_schema}")
+
+    return archived
+
+
+async def maintain_partitions(engine: AsyncEngine, table: str = "news_articles") -> Dict:
+    """
+    Create upcoming partitions and archive expired ones.
+
+    A no-op on databases other than PostgreSQL and on unpartitioned tables, so it
+    is safe to run at startup and from cron (scripts/manage_partitions.py).
+
+    Returns:
+        Dict with the created and archived partition names
+    """
+    stats = {"created": [], "archived": []}
+    if engine.dialect.name != "postgresql":
+        return stats
+
+    async with engine.begin() as conn:
+        if not await is_partitioned(conn, table):
+            logger.info(f"Table {table} is not partitioned; skipping partition maintenance")
+            return stats
+
+        stats["created"] = await ensure_future_partitions(
+            conn, table, settings.ARTICLE_PARTITION_MONTHS_AHEAD
+        )
+        stats["archived"] = await archive_old_partitions(
+            conn,
+            table,
+            settings.ARTICLE_PARTITION_RETENTION_MONTHS,
+            settings.ARTICLE_PARTITION_ARCHIVE_SCHEMA,
+        )
+
+    return stats
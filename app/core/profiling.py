@@ -0,0 +1,313 @@
+"""
+ARAS Profiling
+Per-request span timings, slow-request capture and on-demand sampling
+
+When ENABLE_PROFILING is on, every request carries a RequestProfile in a
+context variable. Redis, NLP and serialization code add their elapsed
+time to it through span(), SQL statements through the cursor events in
+app.core.query_stats. Requests slower than PROFILING_SLOW_REQUEST_MS are
+kept in a ring buffer served at /debug/slow-requests. With profiling off
+no profile is set and span() is a single context-variable lookup.
+
+SamplingProfiler periodically snapshots the stacks of every thread, which
+shows where CPU and waiting time went across the whole process without
+instrumenting code or redeploying.
+
+Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import route_template
+
+
+class RequestProfile:
+    """Time and call counts per span kind for one request."""
+
+    __slots__ = ("spans", "counts", "handler_done", "accounted_at_return")
+
+    def __init__(self):
+        self.spans: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.handler_done: Optional[float] = None
+        self.accounted_at_return = 0.0
+
+    def add(self, kind: str, seconds: float) -> None:
+        self.spans[kind] = self.spans.get(kind, 0.0) + seconds
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+    def accounted(self) -> float:
+        return sum(self.spans.values())
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "aras_request_profile", default=None
+)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Profile of the request being handled, if profiling is on."""
+    return _current_profile.get()
+
+
+@contextmanager
+def span(kind: str) -> Iterator[None]:
+    """Add the time spent in the block to the current request's profile."""
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(kind, time.perf_counter() - started)
+
+
+def _mark_handler_done() -> None:
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.handler_done = time.perf_counter()
+        profile.accounted_at_return = profile.accounted()
+
+
+class ProfiledRoute(APIRoute):
+    """
+    Route that notes when its endpoint returns.
+
+    The time between that and the start of the response (minus any spans
+    recorded meanwhile) is FastAPI's validation and JSON encoding of the
+    return value, reported as the "serialize" span. Endpoints are only
+    wrapped when ENABLE_PROFILING is on.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if settings.ENABLE_PROFILING:
+            endpoint = self._timed(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _timed(endpoint):
+        if inspect.isasyncgenfunction(endpoint) or inspect.isgeneratorfunction(endpoint):
+            return endpoint  # Streaming: serialization overlaps the response body
+        if asyncio.iscoroutinefunction(endpoint):
+
+            @functools.wraps(endpoint)
+            async def timed_endpoint(*args, **kwargs):
+                try:
+                    return await endpoint(*args, **kwargs)
+                finally:
+                    _mark_handler_done()
+
+        else:
+
+            @functools.wraps(endpoint)
+            def timed_endpoint(*args, **kwargs):
+                try:
+                    return endpoint(*args, **kwargs)
+                finally:
+                    _mark_handler_done()
+
+        return timed_endpoint
+
+
+class SlowRequestLog:
+    """Ring buffer of the most recent requests over the slow threshold."""
+
+    def __init__(self, threshold_ms: Optional[float] = None, capacity: Optional[int] = None):
+        self.threshold_ms = (
+            settings.PROFILING_SLOW_REQUEST_MS if threshold_ms is None else threshold_ms
+        )
+        self.entries: deque = deque(maxlen=capacity or settings.PROFILING_SLOW_REQUEST_BUFFER)
+
+    def record(self, entry: Dict) -> None:
+        self.entries.append(entry)
+
+    def snapshot(self, limit: Optional[int] = None) -> List[Dict]:
+        """Captured requests, newest first."""
+        entries = list(self.entries)[::-1]
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+slow_requests = SlowRequestLog()
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware giving each request a RequestProfile.
+
+    Requests that take at least the log's threshold are stored with their
+    span breakdown; "other" is the wall time no span accounts for (handler
+    code, middleware, event loop contention). Spans running concurrently
+    (e.g. NLP calls gathered together) can add up to more than the total.
+    """
+
+    def __init__(self, app: ASGIApp, log: Optional[SlowRequestLog] = None):
+        self.app = app
+        self.log = log or slow_requests
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        started_at = time.time()
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_profile(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if profile.handler_done is not None:
+                    elapsed = time.perf_counter() - profile.handler_done
+                    meanwhile = profile.accounted() - profile.accounted_at_return
+                    profile.add("serialize", max(elapsed - meanwhile, 0.0))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            _current_profile.reset(token)
+            duration = time.perf_counter() - started
+            if duration * 1000 >= self.log.threshold_ms:
+                self.log.record(self._entry(scope, profile, started_at, duration, status_code))
+
+    @staticmethod
+    def _entry(
+        scope: Scope, profile: RequestProfile, started_at: float, duration: float, status: int
+    ) -> Dict:
+        spans = {kind: round(seconds * 1000, 2) for kind, seconds in profile.spans.items()}
+        spans["other"] = round(max(duration - profile.accounted(), 0.0) * 1000, 2)
+        return {
+            "timestamp": started_at,
+            "pid": os.getpid(),
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route_template(scope),
+            "status_code": status,
+            "duration_ms": round(duration * 1000, 2),
+            "spans_ms": spans,
+            "calls": dict(profile.counts),
+        }
+
+
+# Leaf frames of threads that are only waiting for work
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling every thread's stack at a fixed interval.
+
+    Runs in its own thread for a bounded time, so it can be started on a
+    live process; only one profile runs at a time.
+    """
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or settings.PROFILING_SAMPLE_INTERVAL
+        self._lock = threading.Lock()
+        self._labels: Dict[object, str] = {}
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def run(self, seconds: float, include_idle: bool = False) -> Dict:
+        """
+        Sample for the given number of seconds (blocking).
+
+        Returns:
+            Dict with sample counts, the functions with the most samples
+            and collapsed stacks ("root;...;leaf count" lines) for flame graphs
+
+        Raises:
+            RuntimeError: If another profile is already running
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            stacks = self._sample(seconds, include_idle)
+        finally:
+            self._lock.release()
+        return self._summarize(stacks, seconds)
+
+    def _sample(self, seconds: float, include_idle: bool) -> Counter:
+        own_thread = threading.get_ident()
+        stacks: Counter = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                leaf = (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+                if not include_idle and leaf in _IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stacks[tuple(reversed(stack))] += 1
+            time.sleep(self.interval)
+        return stacks
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            for marker in ("site-packages" + os.sep, os.getcwd() + os.sep):
+                if marker in path:
+                    path = path.split(marker, 1)[1]
+                    break
+            label = self._labels[code] = f"{code.co_name} ({path}:{code.co_firstlineno})"
+        return label
+
+    @staticmethod
+    def _summarize(stacks: Counter, seconds: float, top: int = 30) -> Dict:
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in stacks.items():
+            own[stack[-1]] += count
+            for function in set(stack):
+                total[function] += count
+
+        def ranked(counter: Counter) -> List[Dict]:
+            return [{"function": name, "samples": n} for name, n in counter.most_common(top)]
+
+        return {
+            "pid": os.getpid(),
+            "duration_seconds": seconds,
+            "samples": sum(stacks.values()),
+            "self": ranked(own),
+            "cumulative": ranked(total),
+            "collapsed": "\n".join(
+                f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()
+            ),
+        }
+
+
+sampling_profiler = SamplingProfiler()
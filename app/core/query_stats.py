@@ -0,0 +1,214 @@
+"""
+ARAS Query Statistics
+Per-request SQL statement counts, time and slowest statement
+
+Cursor events on every engine time each statement. Inside a request the
+results accumulate in a QueryStats held in a context variable, which
+QueryStatsMiddleware turns into per-route metrics, optional X-DB-* debug
+headers and a warning when one statement repeats often enough to look
+like an N+1 pattern. QueryCounter counts statements directly on an engine,
+for query budget assertions in tests and scripts.
+
+Built by Elite Team - Database Engineer (PhD in Database Systems)
+"""
+
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    DB_QUERY_SECONDS,
+    DB_REPEATED_QUERIES,
+    DB_TIME_PER_REQUEST,
+    route_template,
+)
+from app.core.profiling import current_profile
+
+logger = logging.getLogger(__name__)
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+_WHITESPACE = re.compile(r"\s+")
+_VALUE_LISTS = re.compile(r"\((?:\s*(?:\?|%s|\$\d+|:\w+|%\(\w+\)s)\s*,?)+\)")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str, max_length: int = 200) -> str:
+    """Statement with whitespace collapsed and literals and IN lists replaced."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _VALUE_LISTS.sub("(...)", normalized)
+    normalized = _LITERALS.sub("?", normalized)
+    return normalized[:max_length]
+
+
+@lru_cache(maxsize=1024)
+def _operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+
+class QueryStats:
+    """SQL statements executed while handling one request."""
+
+    __slots__ = ("count", "seconds", "slowest_seconds", "slowest_statement", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = ""
+        self.statements: Dict[str, int] = {}
+
+    def add(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if seconds >= self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Fingerprints of statements executed at least threshold times."""
+        return [
+            (fingerprint(statement), count)
+            for statement, count in self.statements.items()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("aras_query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    """Query statistics of the request being handled, if any."""
+    return _current_stats.get()
+
+
+def instrument_engine(sync_engine) -> None:
+    """
+    Time every statement run on the engine.
+
+    Each statement feeds the latency histogram, the current request's
+    QueryStats and the "db" profiling span.
+    """
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("aras_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("aras_query_started")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        DB_QUERY_SECONDS.observe(elapsed, _operation(statement))
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.add(statement, elapsed)
+        profile = current_profile()
+        if profile is not None:
+            profile.add("db", elapsed)
+
+
+class QueryStatsMiddleware:
+    """
+    Pure ASGI middleware collecting SQL statistics per request.
+
+    Statement counts and SQL time are recorded per route template once the
+    request finishes, so statements run after the response has started
+    (e.g. commits in dependency teardown) are included. With
+    SQL_DEBUG_HEADERS on, X-DB-Queries, X-DB-Time-Ms and X-DB-Slowest
+    describe the statements run before the response started.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.SQL_DEBUG_HEADERS:
+                message["headers"] = list(message.get("headers", [])) + self._headers(stats)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            self._record(scope, stats)
+
+    @staticmethod
+    def _headers(stats: QueryStats) -> List[Tuple[bytes, bytes]]:
+        headers = [
+            (b"x-db-queries", str(stats.count).encode("latin-1")),
+            (b"x-db-time-ms", f"{stats.seconds * 1000:.2f}".encode("latin-1")),
+        ]
+        if stats.slowest_statement:
+            slowest = f"{stats.slowest_seconds * 1000:.2f}ms {fingerprint(stats.slowest_statement)}"
+            headers.append((b"x-db-slowest", slowest.encode("latin-1", "replace")))
+        return headers
+
+    @staticmethod
+    def _record(scope: Scope, stats: QueryStats) -> None:
+        route = route_template(scope)
+        DB_QUERIES_PER_REQUEST.observe(stats.count, route)
+        DB_TIME_PER_REQUEST.observe(stats.seconds, route)
+
+        repeated = stats.repeated(settings.SQL_REPEATED_QUERY_THRESHOLD)
+        if repeated:
+            DB_REPEATED_QUERIES.inc(route)
+            for statement, count in repeated:
+                logger.warning(
+                    f"Possible N+1 on {scope['method']} {route}: "
+                    f"{count} executions of {statement}"
+                )
+
+
+class QueryCounter:
+    """
+    Count the statements run on an engine inside a with block.
+
+    Usage:
+        with QueryCounter(engine) as queries:
+            client.put("/api/v1/articles/1", json={"title": "New"})
+        assert queries.count <= 2, queries.report()
+    """
+
+    def __init__(self, db_engine):
+        self.sync_engine = getattr(db_engine, "sync_engine", db_engine)
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.sync_engine, "after_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.sync_engine, "after_cursor_execute", self._on_execute)
+
+    def report(self) -> str:
+        """Numbered fingerprints of the counted statements."""
+        lines = [f"{self.count} statements:"]
+        lines += [f"  {i}. {fingerprint(s)}" for i, s in enumerate(self.statements, start=1)]
+        return "\n".join(lines)
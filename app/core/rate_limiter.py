@@ -2,16 +2,280 @@
 Rate Limiting Middleware
 Redis-based rate limiting for API endpoints
 
+A Lua script applies GCRA (generic cell rate algorithm, a sliding-window
+equivalent of a token bucket) to every window of a client atomically in one
+round trip, reserving tokens only if all windows allow them. State is one
+timestamp per window and client, using Redis' own clock so every API
+instance agrees. Each process reserves tokens in leases and serves requests
+from them locally, so only lease refills reach Redis.
+
 Built by Elite Team - Backend Security Engineer
 """
 
+import asyncio
+import logging
+import math
 import time
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, Request, status
-from redis import Redis
+from fastapi.responses import JSONResponse
+from redis.asyncio import Redis
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.profiling import span
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS: one key per window. ARGV: requested tokens, then limit, period_ms per window.
+# Grants as many of the requested tokens as every window allows (possibly
+# fewer than asked, possibly none).
+# Returns {granted, retry_after_ms, remaining_1, remaining_2, ...}
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local granted = tonumber(ARGV[1])
+local tats, intervals, available, remaining = {}, {}, {}, {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i])
+    local period = tonumber(ARGV[2 * i + 1])
+    local interval = period / limit
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then tat = now end
+    available[i] = math.floor((now + period - tat) / interval + 1e-9)
+    if available[i] < 1 then
+        retry_after = math.max(retry_after, tat + interval - period - now)
+    end
+    granted = math.min(granted, available[i])
+    tats[i], intervals[i] = tat, interval
+end
+if granted < 1 then
+    for i = 1, #KEYS do remaining[i] = math.max(available[i], 0) end
+    return {0, math.max(math.ceil(retry_after), 1), unpack(remaining)}
+end
+for i, key in ipairs(KEYS) do
+    local new_tat = tats[i] + granted * intervals[i]
+    redis.call('SET', key, string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+    remaining[i] = available[i] - granted
+end
+return {granted, 0, unpack(remaining)}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of one rate limit check."""
+
+    allowed: bool = True
+    retry_after: float = 0.0  # Seconds until the request would be allowed
+    remaining: Dict[str, int] = field(default_factory=dict)  # Per window name
+    granted: int = 0  # Tokens reserved in Redis (0 when Redis is unavailable)
+
+
+class GCRALimiter:
+    """
+    Multi-window GCRA limiter evaluated in a single Redis round trip.
+
+    The Redis client is resolved on every call, so a limiter created at
+    import time starts working once Redis connects. Without Redis (or on a
+    Redis error) requests are allowed.
+    """
+
+    def __init__(
+        self, prefix: str, windows: List[Tuple[str, int, int]], redis: Optional[Redis] = None
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            prefix: Redis key prefix
+            windows: (name, limit, period_seconds) per window
+            redis: Redis client (defaults to the shared one, resolved lazily)
+        """
+        self.prefix = prefix
+        self.windows = windows
+        self._redis = redis
+        self._script = None
+        self._script_client = None
+
+    def _get_script(self):
+        client = self._redis or redis_client.client
+        if client is None:
+            return None
+        if client is not self._script_client:
+            self._script = client.register_script(GCRA_SCRIPT)
+            self._script_client = client
+        return self._script
+
+    async def hit(self, identifier: str, tokens: int = 1) -> RateLimitResult:
+        """
+        Reserve up to tokens requests for identifier.
+
+        The result is allowed if at least one token was granted.
+        """
+        script = self._get_script()
+        if script is None:
+            return RateLimitResult()
+
+        # Hash tag keeps all windows of a client in one cluster slot
+        keys = [f"{self.prefix}:{{{identifier}}}:{name}" for name, _, _ in self.windows]
+        args = [tokens]
+        for _, limit, period in self.windows:
+            args += [limit, period * 1000]
+        try:
+            with span("redis"):
+                granted, retry_after_ms, *remaining = await script(keys=keys, args=args)
+        except Exception as e:
+            logger.warning(f"Rate limiting unavailable: {e}")
+            return RateLimitResult()
+
+        return RateLimitResult(
+            allowed=granted > 0,
+            retry_after=int(retry_after_ms) / 1000,
+            remaining={name: int(left) for (name, _, _), left in zip(self.windows, remaining)},
+            granted=int(granted),
+        )
+
+
+@dataclass
+class Lease:
+    """Tokens one process has reserved from Redis for one client."""
+
+    tokens: int = 0
+    expires_at: float = 0.0
+    blocked_until: float = 0.0  # Denied by Redis until then, answered locally
+    remaining: Dict[str, int] = field(default_factory=dict)  # Redis view at reservation time
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class LeasedLimiter:
+    """
+    Per-process token buckets refilled from a shared GCRALimiter in chunks.
+
+    Each client's requests are served from a local lease; Redis is only
+    consulted when the lease is used up or expired, so a busy client costs
+    one round trip per lease instead of one per request. Leased tokens are
+    already counted in Redis, so across processes the limit can only be
+    under-used (by at most one lease per process and client), never
+    exceeded. The default lease is divided among a pod's WEB_WORKERS, so
+    the bound stays one default lease per pod however many workers run.
+    A Redis denial is also cached until its Retry-After, so clients over
+    their quota are rejected without a round trip.
+    """
+
+    def __init__(
+        self,
+        limiter: GCRALimiter,
+        lease_size: Optional[int] = None,
+        lease_ttl: Optional[float] = None,
+        max_clients: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize leased limiter.
+
+        Args:
+            limiter: Shared limiter leases are reserved from
+            lease_size: Tokens per lease (defaults to a fraction of the smallest limit)
+            lease_ttl: Seconds before unused leased tokens are dropped
+            max_clients: Leases kept in memory (least recently used evicted)
+            clock: Time source (monotonic seconds)
+        """
+        if lease_size is None:
+            smallest = min(limit for _, limit, _ in limiter.windows)
+            lease_size = int(smallest * settings.RATE_LIMIT_LEASE_FRACTION)
+            lease_size = min(lease_size, settings.RATE_LIMIT_LEASE_MAX)
+            # Split among the pod's worker processes (set by gunicorn.conf.py)
+            lease_size //= max(settings.WEB_WORKERS, 1)
+        self.limiter = limiter
+        self.windows = limiter.windows
+        self.lease_size = max(1, lease_size)
+        self.lease_ttl = settings.RATE_LIMIT_LEASE_TTL if lease_ttl is None else lease_ttl
+        self.max_clients = max_clients
+        self.clock = clock
+        self.leases: "OrderedDict[str, Lease]" = OrderedDict()
+
+    def _lease(self, identifier: str) -> Lease:
+        lease = self.leases.get(identifier)
+        if lease is None:
+            lease = self.leases[identifier] = Lease()
+            while len(self.leases) > self.max_clients:
+                self.leases.popitem(last=False)
+        else:
+            self.leases.move_to_end(identifier)
+        return lease
+
+    def _take_local(self, lease: Lease, now: float, cost: int) -> Optional[RateLimitResult]:
+        """Answer from the lease alone, or None if Redis must be asked."""
+        if now < lease.blocked_until:
+            return RateLimitResult(
+                allowed=False,
+                retry_after=lease.blocked_until - now,
+                remaining={name: 0 for name, _, _ in self.windows},
+            )
+        if now >= lease.expires_at:
+            lease.tokens = 0
+        if lease.tokens >= cost:
+            lease.tokens -= cost
+            return RateLimitResult(
+                remaining={name: left + lease.tokens for name, left in lease.remaining.items()},
+            )
+        return None
+
+    async def hit(self, identifier: str, cost: int = 1) -> RateLimitResult:
+        """Consume cost tokens for identifier."""
+        lease = self._lease(identifier)
+        result = self._take_local(lease, self.clock(), cost)
+        if result is not None:
+            return result
+
+        # One refill per client at a time; waiters are then served locally
+        async with lease.lock:
+            now = self.clock()
+            result = self._take_local(lease, now, cost)
+            if result is not None:
+                return result
 
-from app.core.redis_client import get_redis
+            result = await self.limiter.hit(identifier, max(self.lease_size, cost - lease.tokens))
+            now = self.clock()
+            if not result.allowed:
+                lease.tokens = 0
+                lease.blocked_until = now + result.retry_after
+                return result
+            if not result.granted:
+                return result  # Redis unavailable: fail open
+
+            lease.tokens += result.granted
+            lease.expires_at = now + self.lease_ttl
+            lease.remaining = result.remaining
+            if lease.tokens < cost:
+                # Partial grant too small for this request; keep it for cheaper ones
+                interval = max(period / limit for _, limit, period in self.windows)
+                return RateLimitResult(
+                    allowed=False,
+                    retry_after=(cost - lease.tokens) * interval,
+                    remaining={
+                        name: left + lease.tokens for name, left in result.remaining.items()
+                    },
+                )
+            lease.tokens -= cost
+            result.remaining = {
+                name: left + lease.tokens for name, left in result.remaining.items()
+            }
+            return result
+
+
+def too_many_requests(detail: str, retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
 
 
 class RateLimiter:
@@ -27,13 +291,19 @@ class RateLimiter:
         Initialize rate limiter.
 
         Args:
-            redis: Redis client instance
+            redis: Redis client instance (defaults to the shared client, resolved per request)
             requests_per_minute: Maximum requests per minute per client
             requests_per_hour: Maximum requests per hour per client
         """
-        self.redis = redis or get_redis()
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
+        self.limiter = LeasedLimiter(
+            GCRALimiter(
+                "rate_limit",
+                [("minute", requests_per_minute, 60), ("hour", requests_per_hour, 3600)],
+                redis=redis,
+            )
+        )
 
     def _get_client_identifier(self, request: Request) -> str:
         """
@@ -45,51 +315,72 @@ class RateLimiter:
         api_key = request.headers.get("X-API-Key", "")
         return f"{client_ip}:{api_key}" if api_key else client_ip
 
-    def _get_rate_limit_key(self, identifier: str, window: str) -> str:
-        """Generate Redis key for rate limiting."""
-        return f"rate_limit:{identifier}:{window}"
-
     async def check_rate_limit(self, request: Request) -> None:
         """
         Check if request exceeds rate limits.
 
         Raises HTTPException if limit exceeded.
         """
-        if not self.redis:
-            return  # Skip rate limiting if Redis not available
+        result = await self.limiter.hit(self._get_client_identifier(request))
+        if not result.allowed:
+            raise too_many_requests(
+                f"Rate limit exceeded: {self.requests_per_minute} requests per minute, "
+                f"{self.requests_per_hour} per hour",
+                result.retry_after,
+            )
 
-        identifier = self._get_client_identifier(request)
-        current_time = int(time.time())
+        # Add rate limit info to response headers
+        if result.remaining:
+            request.state.rate_limit_remaining_minute = result.remaining["minute"]
+            request.state.rate_limit_remaining_hour = result.remaining["hour"]
 
-        # Check per-minute limit
-        minute_key = self._get_rate_limit_key(identifier, f"minute:{current_time // 60}")
-        minute_count = self.redis.incr(minute_key)
-        if minute_count == 1:
-            self.redis.expire(minute_key, 60)  # Expire after 60 seconds
 
-        if minute_count > self.requests_per_minute:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded: {self.requests_per_minute} requests per minute",
-                headers={"Retry-After": "60"},
-            )
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware applying a RateLimiter to every HTTP request.
+
+    Rejected requests get a 429 without reaching the app; allowed ones get
+    X-RateLimit-Remaining-* headers on their http.response.start message.
+    """
+
+    def __init__(
+        self, app: ASGIApp, limiter: RateLimiter, exempt_paths: Tuple[str, ...] = ("/health", "/")
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.exempt_paths = frozenset(exempt_paths)
 
-        # Check per-hour limit
-        hour_key = self._get_rate_limit_key(identifier, f"hour:{current_time // 3600}")
-        hour_count = self.redis.incr(hour_key)
-        if hour_count == 1:
-            self.redis.expire(hour_key, 3600)  # Expire after 1 hour
-
-        if hour_count > self.requests_per_hour:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded: {self.requests_per_hour} requests per hour",
-                headers={"Retry-After": "3600"},
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        try:
+            await self.limiter.check_rate_limit(request)
+        except HTTPException as e:
+            response = JSONResponse(
+                status_code=e.status_code, content={"detail": e.detail}, headers=e.headers
             )
+            await response(scope, receive, send)
+            return
 
-        # Add rate limit info to response headers
-        request.state.rate_limit_remaining_minute = self.requests_per_minute - minute_count
-        request.state.rate_limit_remaining_hour = self.requests_per_hour - hour_count
+        state = scope.get("state", {})
+        if "rate_limit_remaining_minute" not in state:
+            await self.app(scope, receive, send)
+            return
+
+        extra = [
+            (b"x-ratelimit-remaining-minute", str(state["rate_limit_remaining_minute"]).encode()),
+            (b"x-ratelimit-remaining-hour", str(state["rate_limit_remaining_hour"]).encode()),
+        ]
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + extra
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 class EndpointRateLimiter:
@@ -105,26 +396,16 @@ class EndpointRateLimiter:
         """
         self.requests = requests
         self.window = window
-        self.redis = get_redis()
+        self.limiter = LeasedLimiter(GCRALimiter("endpoint_limit", [("window", requests, window)]))
 
     async def __call__(self, request: Request) -> None:
         """Check endpoint-specific rate limit."""
-        if not self.redis:
-            return
-
-        identifier = f"{request.client.host}:{request.url.path}"
-        current_time = int(time.time())
-        window_key = f"endpoint_limit:{identifier}:{current_time // self.window}"
-
-        count = self.redis.incr(window_key)
-        if count == 1:
-            self.redis.expire(window_key, self.window)
-
-        if count > self.requests:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Endpoint rate limit exceeded: {self.requests} requests per {self.window}s",
-                headers={"Retry-After": str(self.window)},
+        client_ip = request.client.host if request.client else "unknown"
+        result = await self.limiter.hit(f"{client_ip}:{request.url.path}")
+        if not result.allowed:
+            raise too_many_requests(
+                f"Endpoint rate limit exceeded: {self.requests} requests per {self.window}s",
+                result.retry_after,
             )
 
 
@@ -132,3 +413,67 @@ class EndpointRateLimiter:
 strict_rate_limit = EndpointRateLimiter(requests=10, window=60)  # 10 req/min
 moderate_rate_limit = EndpointRateLimiter(requests=30, window=60)  # 30 req/min
 relaxed_rate_limit = EndpointRateLimiter(requests=100, window=60)  # 100 req/min
+
+
+class CostRateLimiter:
+    """
+    Weighted work budget per issued API key (or IP address otherwise).
+
+    Routes declare what a call costs with charge(); expensive routes draw
+    from their own pool, so a burst of heavy calls exhausts only that pool
+    while cheap reads stay under the plain request limits.
+    """
+
+    def __init__(self, pool: str, budget: int, window: int = 60):
+        """
+        Initialize cost-weighted limiter.
+
+        Args:
+            pool: Budget name (separate Redis keys per pool)
+            budget: Cost units allowed per window
+            window: Time window in seconds
+        """
+        self.pool = pool
+        self.budget = budget
+        self.window = window
+        self.limiter = LeasedLimiter(
+            GCRALimiter(f"cost_limit:{pool}", [("window", budget, window)])
+        )
+
+    @staticmethod
+    def _get_client_identifier(request: Request) -> str:
+        # Only issued keys get their own budget; an unchecked header could be
+        # rotated on every call to start from a fresh budget
+        api_key = request.headers.get("X-API-Key")
+        if api_key and api_key in settings.RATE_LIMIT_API_KEYS:
+            return f"key:{api_key}"
+        return f"ip:{request.client.host if request.client else 'unknown'}"
+
+    def charge(self, cost: int, per_kb: int = 0) -> Callable:
+        """
+        Dependency charging cost units (plus per_kb per KB of request body).
+
+        Example:
+            @router.post("/entities", dependencies=[Depends(nlp_budget.charge(5, per_kb=1))])
+        """
+
+        async def dependency(request: Request) -> None:
+            units = cost
+            if per_kb:
+                size = int(request.headers.get("content-length") or 0)
+                units += per_kb * (size // 1024)
+            units = min(units, self.budget)  # Never unaffordable
+
+            result = await self.limiter.hit(self._get_client_identifier(request), units)
+            if not result.allowed:
+                raise too_many_requests(
+                    f"{self.pool} budget exceeded: {self.budget} units per {self.window}s "
+                    f"(this request costs {units})",
+                    result.retry_after,
+                )
+
+        return dependency
+
+
+# Work budget for NLP analysis routes
+nlp_budget = CostRateLimiter("nlp", budget=settings.RATE_LIMIT_NLP_BUDGET, window=60)
@@ -7,11 +7,13 @@ Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
 
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import redis.asyncio as redis
 
 from app.core.config import settings
+from app.core.metrics import REDIS_OPERATION_SECONDS
+from app.core.profiling import span
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +46,8 @@ class RedisClient:
         if not self.client:
             return None
         try:
-            return await self.client.get(key)
+            with REDIS_OPERATION_SECONDS.time("get"), span("redis"):
+                return await self.client.get(key)
         except Exception as e:
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
@@ -55,7 +58,8 @@ class RedisClient:
             return False
         try:
             ttl = ttl or settings.REDIS_CACHE_TTL
-            return await self.client.set(key, value, ex=ttl)
+            with REDIS_OPERATION_SECONDS.time("set"), span("redis"):
+                return await self.client.set(key, value, ex=ttl)
         except Exception as e:
             logger.error(f"Redis SET error for key {key}: {e}")
             return False
@@ -65,17 +69,35 @@ class RedisClient:
         if not self.client:
             return False
         try:
-            return bool(await self.client.delete(key))
+            with REDIS_OPERATION_SECONDS.time("delete"), span("redis"):
+                return bool(await self.client.delete(key))
         except Exception as e:
             logger.error(f"Redis DELETE error for key {key}: {e}")
             return False
 
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete keys in one round trip; returns how many existed."""
+        keys = list(keys)
+        if not self.client or not keys:
+            return 0
+        try:
+            with REDIS_OPERATION_SECONDS.time("delete"), span("redis"):
+                # One DEL per key so cluster deployments may spread keys across slots
+                pipe = self.client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.delete(key)
+                return sum(await pipe.execute())
+        except Exception as e:
+            logger.error(f"Redis DELETE error for {len(keys)} keys: {e}")
+            return 0
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in Redis."""
         if not self.client:
             return False
         try:
-            return bool(await self.client.exists(key))
+            with REDIS_OPERATION_SECONDS.time("exists"), span("redis"):
+                return bool(await self.client.exists(key))
         except Exception as e:
             logger.error(f"Redis EXISTS error for key {key}: {e}")
             return False
@@ -87,7 +109,8 @@ class RedisClient:
         try:
             if isinstance(message, dict):
                 message = json.dumps(message)
-            return bool(await self.client.publish(channel, message))
+            with REDIS_OPERATION_SECONDS.time("publish"), span("redis"):
+                return bool(await self.client.publish(channel, message))
         except Exception as e:
             logger.error(f"Redis PUBLISH error for channel {channel}: {e}")
             return False
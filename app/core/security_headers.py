@@ -6,18 +6,16 @@ Built by Elite Team - Security Expert (CISSP, CEH)
 """
 
 import logging
-from typing import Callable
+from typing import List, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add comprehensive security headers to all responses.
     
@@ -29,11 +27,20 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - X-XSS-Protection: Additional XSS protection for older browsers
     - Referrer-Policy: Controls referrer information
     - Permissions-Policy: Restricts browser features
+
+    Pure ASGI: the headers are encoded once and appended to the
+    http.response.start message, so streaming responses pass through
+    untouched.
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         self.security_headers = self._build_security_headers()
+        self._raw_headers: List[Tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.security_headers.items()
+        ]
+        self._raw_names = {name for name, _ in self._raw_headers}
 
     def _build_security_headers(self) -> dict:
         """Build security headers based on environment."""
@@ -79,17 +86,17 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
         return headers
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to response."""
-        try:
-            response = await call_next(request)
-
-            # Add all security headers
-            for header, value in self.security_headers.items():
-                response.headers[header] = value
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-            return response
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                headers = [item for item in headers if item[0] not in self._raw_names]
+                message["headers"] = headers + self._raw_headers
+            await send(message)
 
-        except Exception as e:
-            logger.error(f"Error in SecurityHeadersMiddleware: {e}")
-            raise
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,411 @@
+"""
+ARAS Background Task Queue
+Durable jobs on a Redis Streams consumer group
+
+Delivery is at-least-once: a job stays in the consumer group's pending list
+until a worker acknowledges it, and jobs left unacknowledged for longer than
+the visibility timeout (worker crash) are reclaimed by another worker.
+Failed jobs are retried with exponential backoff through a delayed set and
+moved to a dead-letter stream after TASK_MAX_ATTEMPTS. A dedup key coalesces
+identical jobs while one is still waiting to run.
+
+Without Redis the same semantics are provided in process (not durable).
+
+Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import socket
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis.exceptions import ResponseError
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Message id, fields, times delivered
+Message = Tuple[str, Dict[str, str], int]
+
+# Atomically move due retries from the delayed set back onto the stream
+PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+    redis.call('ZREM', KEYS[1], member)
+    local f = cjson.decode(member)
+    redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*',
+        'name', f.name, 'payload', f.payload, 'attempts', f.attempts, 'dedup_key', f.dedup_key)
+end
+return #due
+"""
+
+
+@dataclass
+class Task:
+    """A job delivered to a worker."""
+
+    id: str
+    name: str
+    payload: Dict[str, Any]
+    attempts: int = 1
+    dedup_key: str = ""
+
+    @classmethod
+    def from_message(cls, message: Message) -> "Task":
+        message_id, fields, deliveries = message
+        # Deliveries beyond the first are crashed or timed-out runs
+        return cls(
+            id=message_id,
+            name=fields["name"],
+            payload=json.loads(fields["payload"]),
+            attempts=int(fields.get("attempts", 1)) + deliveries - 1,
+            dedup_key=fields.get("dedup_key", ""),
+        )
+
+    def fields(self, attempts: Optional[int] = None) -> Dict[str, str]:
+        return {
+            "name": self.name,
+            "payload": json.dumps(self.payload),
+            "attempts": str(attempts or self.attempts),
+            "dedup_key": self.dedup_key,
+        }
+
+
+def _decode(fields: Dict) -> Dict[str, str]:
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in fields.items()
+    }
+
+
+def _message_id(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisStreamBackend:
+    """Stream, consumer group, delayed ZSET and dead-letter stream in Redis."""
+
+    def __init__(self, client, stream: str, group: str, maxlen: int):
+        self.client = client
+        # The stream and its side keys share one hash tag: PROMOTE_SCRIPT touches the
+        # delayed set and the stream together, which Redis Cluster allows in one slot only
+        self.stream = stream if "{" in stream else f"{{{stream}}}"
+        self.group = group
+        self.maxlen = maxlen
+        self.delayed_key = f"{self.stream}:delayed"
+        self.dead_key = f"{self.stream}:dead"
+        self._group_ready = False
+        self._promote = client.register_script(PROMOTE_SCRIPT)
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def add(self, fields: Dict[str, str]) -> str:
+        message_id = await self.client.xadd(
+            self.stream, fields, maxlen=self.maxlen, approximate=True
+        )
+        return _message_id(message_id)
+
+    async def read(self, consumer: str, count: int, block_ms: int) -> List[Message]:
+        await self._ensure_group()
+        response = await self.client.xreadgroup(
+            self.group, consumer, {self.stream: ">"}, count=count, block=block_ms or None
+        )
+        messages = []
+        for _, entries in response or []:
+            messages.extend((_message_id(mid), _decode(fields), 1) for mid, fields in entries)
+        return messages
+
+    async def reclaim(self, consumer: str, min_idle_ms: int, count: int) -> List[Message]:
+        await self._ensure_group()
+        _, entries, *_ = await self.client.xautoclaim(
+            self.stream, self.group, consumer, min_idle_ms, start_id="0-0", count=count
+        )
+        messages = []
+        for mid, fields in entries:
+            if not fields:  # Trimmed from the stream while pending
+                await self.ack(_message_id(mid))
+                continue
+            info = await self.client.xpending_range(self.stream, self.group, mid, mid, 1)
+            deliveries = info[0]["times_delivered"] if info else 2
+            messages.append((_message_id(mid), _decode(fields), deliveries))
+        return messages
+
+    async def ack(self, message_id: str) -> None:
+        await self.client.xack(self.stream, self.group, message_id)
+        await self.client.xdel(self.stream, message_id)
+
+    async def delay(self, fields: Dict[str, str], due: float) -> None:
+        await self.client.zadd(self.delayed_key, {json.dumps(fields, sort_keys=True): due})
+
+    async def promote(self, now: float, limit: int = 100) -> int:
+        return await self._promote(
+            keys=[self.delayed_key, self.stream], args=[now, limit, self.maxlen]
+        )
+
+    async def dead(self, fields: Dict[str, str]) -> None:
+        await self.client.xadd(self.dead_key, fields, maxlen=self.maxlen, approximate=True)
+
+    async def claim_key(self, key: str, ttl: int) -> bool:
+        return bool(await self.client.set(f"{self.stream}:dedup:{key}", 1, nx=True, ex=ttl))
+
+    async def release_key(self, key: str) -> None:
+        await self.client.delete(f"{self.stream}:dedup:{key}")
+
+    async def stats(self) -> Dict[str, int]:
+        await self._ensure_group()
+        pending = await self.client.xpending(self.stream, self.group)
+        return {
+            "queued": await self.client.xlen(self.stream) - pending["pending"],
+            "pending": pending["pending"],
+            "delayed": await self.client.zcard(self.delayed_key),
+            "dead": await self.client.xlen(self.dead_key),
+        }
+
+
+@dataclass
+class _Pending:
+    fields: Dict[str, str]
+    delivered_at: float
+    deliveries: int
+
+
+@dataclass
+class LocalBackend:
+    """In-process stand-in for RedisStreamBackend (used when Redis is down)."""
+
+    maxlen: int
+    queued: "OrderedDict[str, Dict[str, str]]" = field(default_factory=OrderedDict)
+    pending: Dict[str, _Pending] = field(default_factory=dict)
+    delayed: List[Tuple[float, int, Dict[str, str]]] = field(default_factory=list)
+    dead_letters: List[Dict[str, str]] = field(default_factory=list)
+    keys: Dict[str, float] = field(default_factory=dict)
+    _ids: Any = field(default_factory=itertools.count)
+
+    async def add(self, fields: Dict[str, str]) -> str:
+        message_id = f"{int(time.time() * 1000)}-{next(self._ids)}"
+        self.queued[message_id] = fields
+        while len(self.queued) > self.maxlen:
+            self.queued.popitem(last=False)
+        return message_id
+
+    async def read(self, consumer: str, count: int, block_ms: int) -> List[Message]:
+        if not self.queued and block_ms:
+            await asyncio.sleep(min(block_ms, 100) / 1000)  # No blocking read; poll
+        messages = []
+        while self.queued and len(messages) < count:
+            message_id, fields = self.queued.popitem(last=False)
+            self.pending[message_id] = _Pending(fields, time.monotonic(), 1)
+            messages.append((message_id, fields, 1))
+        return messages
+
+    async def reclaim(self, consumer: str, min_idle_ms: int, count: int) -> List[Message]:
+        cutoff = time.monotonic() - min_idle_ms / 1000
+        messages = []
+        for message_id, entry in self.pending.items():
+            if len(messages) >= count:
+                break
+            if entry.delivered_at <= cutoff:
+                entry.delivered_at = time.monotonic()
+                entry.deliveries += 1
+                messages.append((message_id, entry.fields, entry.deliveries))
+        return messages
+
+    async def ack(self, message_id: str) -> None:
+        self.pending.pop(message_id, None)
+
+    async def delay(self, fields: Dict[str, str], due: float) -> None:
+        heapq.heappush(self.delayed, (due, next(self._ids), fields))
+
+    async def promote(self, now: float, limit: int = 100) -> int:
+        promoted = 0
+        while self.delayed and self.delayed[0][0] <= now and promoted < limit:
+            _, _, fields = heapq.heappop(self.delayed)
+            await self.add(fields)
+            promoted += 1
+        return promoted
+
+    async def dead(self, fields: Dict[str, str]) -> None:
+        self.dead_letters.append(fields)
+        del self.dead_letters[: -self.maxlen]
+
+    async def claim_key(self, key: str, ttl: int) -> bool:
+        now = time.monotonic()
+        if self.keys.get(key, 0) > now:
+            return False
+        self.keys[key] = now + ttl
+        return True
+
+    async def release_key(self, key: str) -> None:
+        self.keys.pop(key, None)
+
+    async def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self.queued),
+            "pending": len(self.pending),
+            "delayed": len(self.delayed),
+            "dead": len(self.dead_letters),
+        }
+
+
+class TaskQueue:
+    """
+    Producer and consumer API over the task stream.
+
+    Producers call enqueue(); workers call claim() and then ack() or
+    retry() for each task (see app.tasks.worker).
+    """
+
+    def __init__(
+        self,
+        stream: Optional[str] = None,
+        group: Optional[str] = None,
+        consumer: Optional[str] = None,
+        visibility_timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        dedup_ttl: Optional[int] = None,
+        backend=None,
+    ):
+        """
+        Initialize task queue.
+
+        Args:
+            stream: Redis stream key
+            group: Consumer group shared by all workers
+            consumer: This worker's name within the group (default: host and current pid)
+            visibility_timeout: Seconds before an unacknowledged task is redelivered
+            max_attempts: Attempts before a task is dead-lettered
+            retry_backoff: Base seconds for exponential retry backoff
+            dedup_ttl: Seconds a dedup key is held at most
+            backend: Storage backend (Redis when connected, else in-process)
+        """
+        self.stream = stream or settings.TASK_STREAM
+        self.group = group or settings.TASK_GROUP
+        self._consumer = consumer
+        self.visibility_timeout = visibility_timeout or settings.TASK_VISIBILITY_TIMEOUT
+        self.max_attempts = max_attempts or settings.TASK_MAX_ATTEMPTS
+        self.retry_backoff = settings.TASK_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.dedup_ttl = dedup_ttl or settings.TASK_DEDUP_TTL
+        self._backend = backend
+        self._local: Optional[LocalBackend] = None
+
+    @property
+    def consumer(self) -> str:
+        """This worker's consumer name (per process: resolved after a preload fork)."""
+        return self._consumer or f"{socket.gethostname()}-{os.getpid()}"
+
+    @property
+    def backend(self):
+        """Redis backend while connected, otherwise the in-process fallback."""
+        if self._backend is not None:
+            return self._backend
+        if redis_client.client is not None:
+            self._backend = RedisStreamBackend(
+                redis_client.client, self.stream, self.group, settings.TASK_STREAM_MAXLEN
+            )
+            return self._backend
+        if self._local is None:
+            logger.warning("Redis unavailable, background tasks are queued in process only")
+            self._local = LocalBackend(maxlen=settings.TASK_STREAM_MAXLEN)
+        return self._local
+
+    async def enqueue(
+        self, name: str, payload: Dict[str, Any], dedup_key: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Queue a job.
+
+        Args:
+            name: Task name (see app.tasks.handlers.TASK_HANDLERS)
+            payload: JSON-serialisable arguments
+            dedup_key: Jobs with the same key are coalesced while one is waiting
+
+        Returns:
+            Message id, or None if coalesced or the queue is unavailable
+        """
+        key = f"{name}:{dedup_key}" if dedup_key else None
+        claimed = False
+        try:
+            if key:
+                if not await self.backend.claim_key(key, self.dedup_ttl):
+                    return None
+                claimed = True
+            task = Task(id="", name=name, payload=payload, dedup_key=dedup_key or "")
+            return await self.backend.add(task.fields())
+        except Exception as e:
+            logger.error(f"Failed to enqueue task {name}: {e}")
+            if claimed:
+                # Otherwise later jobs with this key coalesce into one that was never queued
+                try:
+                    await self.backend.release_key(key)
+                except Exception as release_error:
+                    logger.error(f"Failed to release dedup key {key}: {release_error}")
+            return None
+
+    async def claim(self, count: int, block_ms: int = 0) -> List[Task]:
+        """
+        Receive up to count tasks: due retries are promoted first, then
+        tasks whose visibility timeout expired, then new ones.
+        """
+        backend = self.backend
+        await backend.promote(time.time())
+        messages = await backend.reclaim(self.consumer, int(self.visibility_timeout * 1000), count)
+        if len(messages) < count:
+            messages += await backend.read(self.consumer, count - len(messages), block_ms)
+
+        tasks = []
+        for message in messages:
+            task = Task.from_message(message)
+            if task.attempts > self.max_attempts:
+                await self.dead_letter(task, "delivered too many times without acknowledgement")
+                continue
+            # Dedup covers waiting jobs only; a new request during the run is kept
+            if task.dedup_key:
+                await backend.release_key(f"{task.name}:{task.dedup_key}")
+            tasks.append(task)
+        return tasks
+
+    async def ack(self, task: Task) -> None:
+        """Mark a task as done."""
+        await self.backend.ack(task.id)
+
+    async def retry(self, task: Task, error: str) -> None:
+        """Reschedule a failed task with backoff, or dead-letter it."""
+        if task.attempts >= self.max_attempts:
+            await self.dead_letter(task, error)
+            return
+        due = time.time() + self.retry_backoff * 2 ** (task.attempts - 1)
+        await self.backend.delay(task.fields(attempts=task.attempts + 1), due)
+        await self.backend.ack(task.id)
+        logger.warning(f"Task {task.name} failed (attempt {task.attempts}), retrying: {error}")
+
+    async def dead_letter(self, task: Task, error: str) -> None:
+        """Move a task to the dead-letter stream."""
+        await self.backend.dead({**task.fields(), "error": error[:1000]})
+        await self.backend.ack(task.id)
+        logger.error(f"Task {task.name} dead-lettered after {task.attempts} attempts: {error}")
+
+    async def stats(self) -> Dict[str, int]:
+        """Queued, pending (in progress), delayed and dead-lettered counts."""
+        return await self.backend.stats()
+
+
+# Global task queue instance
+task_queue = TaskQueue()
@@ -0,0 +1,165 @@
+"""
+ARAS URL Dedup Index
+Bloom filter in front of the article URL table
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import hashlib
+import logging
+import math
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+from app.ingestion.urls import canonicalize_url
+from app.models.news_models import ArticleUrl, hash_url
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Bloom filter stored as a Redis bitmap (SETBIT/GETBIT), shared by all
+    workers and kept across restarts.
+
+    A local bitmap mirrors every add, so lookups keep working (per process)
+    while Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        key: Optional[str] = None,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+    ):
+        """
+        Initialize filter.
+
+        Args:
+            key: Redis key of the bitmap
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        self.key = key or settings.URL_BLOOM_KEY
+        capacity = capacity or settings.URL_BLOOM_CAPACITY
+        error_rate = error_rate or settings.URL_BLOOM_ERROR_RATE
+
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._local = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> List[int]:
+        """Bit positions for item (Kirsch-Mitzenmacher double hashing)."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def _local_contains(self, positions: List[int]) -> bool:
+        return all(self._local[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    async def add_many(self, items: Iterable[str]) -> None:
+        """Add items to the filter."""
+        positions = [p for item in items for p in self._positions(item)]
+        if not positions:
+            return
+        for p in positions:
+            self._local[p >> 3] |= 1 << (p & 7)
+
+        if redis_client.client:
+            try:
+                pipe = redis_client.client.pipeline(transaction=False)
+                for p in positions:
+                    pipe.setbit(self.key, p, 1)
+                await pipe.execute()
+            except Exception as e:
+                logger.error(f"Bloom filter SETBIT error for {self.key}: {e}")
+
+    async def contains_many(self, items: List[str]) -> List[bool]:
+        """Membership test per item (False = definitely never added)."""
+        positions = [self._positions(item) for item in items]
+        if not positions:
+            return []
+
+        if redis_client.client:
+            try:
+                pipe = redis_client.client.pipeline(transaction=False)
+                for item_positions in positions:
+                    for p in item_positions:
+                        pipe.getbit(self.key, p)
+                bits = await pipe.execute()
+                k = self.hash_count
+                return [
+                    all(bits[i * k : (i + 1) * k]) or self._local_contains(item_positions)
+                    for i, item_positions in enumerate(positions)
+                ]
+            except Exception as e:
+                logger.error(f"Bloom filter GETBIT error for {self.key}: {e}")
+
+        return [self._local_contains(item_positions) for item_positions in positions]
+
+
+class UrlDeduplicator:
+    """
+    Decide which article URLs still need fetching.
+
+    URLs are canonicalized, then checked against the Bloom filter. A negative
+    answer is definitive, so the URL is new and no database query is needed.
+    Positives may be false, so they are confirmed with one batched lookup in
+    news_article_urls, whose primary key is the source of truth.
+    """
+
+    def __init__(
+        self,
+        bloom: Optional[BloomFilter] = None,
+        session_factory: Optional[Callable] = None,
+    ):
+        """
+        Initialize deduplicator.
+
+        Args:
+            bloom: Bloom filter (defaults to the shared Redis one)
+            session_factory: Async session factory used to confirm positives;
+                without it Bloom positives are trusted
+        """
+        self.bloom = bloom or BloomFilter()
+        self.session_factory = session_factory
+
+    async def filter_new(self, urls: List[str]) -> List[str]:
+        """Return the URLs (original form, input order) not stored yet."""
+        canonical = {}
+        for url in urls:
+            canonical.setdefault(canonicalize_url(url), url)
+        if not canonical:
+            return []
+
+        keys = list(canonical)
+        maybe_seen = await self.bloom.contains_many(keys)
+        new = {key for key, seen in zip(keys, maybe_seen) if not seen}
+        candidates = [key for key, seen in zip(keys, maybe_seen) if seen]
+
+        if candidates and self.session_factory is not None:
+            stored = await self._stored_hashes([hash_url(key) for key in candidates])
+            new.update(key for key in candidates if hash_url(key) not in stored)
+
+        return [canonical[key] for key in keys if key in new]
+
+    async def mark_seen(self, urls: Iterable[str]) -> None:
+        """Record URLs as fetched so later crawls skip them."""
+        await self.bloom.add_many(canonicalize_url(url) for url in urls)
+
+    async def _stored_hashes(self, url_hashes: List[str]) -> set:
+        """URL hashes already registered in news_article_urls."""
+        try:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(ArticleUrl.url_hash).where(ArticleUrl.url_hash.in_(url_hashes))
+                )
+                return set(result.scalars().all())
+        except Exception as e:
+            # Fall back to trusting the filter rather than re-fetching everything
+            logger.error(f"URL dedup lookup failed: {e}")
+            return set(url_hashes)
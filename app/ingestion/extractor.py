@@ -0,0 +1,267 @@
+"""
+ARAS Content Extractor
+Single-pass lxml parsing with text-density boilerplate removal
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Union
+
+import lxml.html
+from cssselect import HTMLTranslator
+
+logger = logging.getLogger(__name__)
+
+# Never article text
+BOILERPLATE_TAGS = {
+    "script",
+    "style",
+    "noscript",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "form",
+    "iframe",
+    "svg",
+    "button",
+    "select",
+    "figcaption",
+    "template",
+}
+
+# class/id hints (same idea as Readability's unlikely/positive candidates)
+NEGATIVE_HINTS = re.compile(
+    r"comment|share|social|related|promo|advert|sponsor|sidebar|footer|header|"
+    r"\bnav|menu|cookie|newsletter|subscribe|breadcrumb|popup|modal|widget|tags",
+    re.I,
+)
+POSITIVE_HINTS = re.compile(r"article|body|content|entry|main|post|story|text", re.I)
+
+# Elements whose text makes up the article body
+TEXT_TAGS = ("p", "pre", "blockquote", "h2", "h3", "li")
+
+# Paragraph-like elements that vote for their container
+SCORED_TAGS = ("p", "pre", "blockquote")
+
+# A <div> without block children is treated as a paragraph (text in <div>/<br> layouts)
+BLOCK_TAGS = {
+    "p",
+    "div",
+    "pre",
+    "blockquote",
+    "table",
+    "ul",
+    "ol",
+    "dl",
+    "section",
+    "article",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "form",
+    "figure",
+}
+
+# Minimum characters for a paragraph to count
+MIN_PARAGRAPH_LENGTH = 25
+
+# Per-source selector results shorter than this fall back to scoring
+MIN_CONTENT_LENGTH = 100
+
+# Sibling blocks scoring at least this share of the best one are kept too
+SIBLING_SCORE_RATIO = 0.2
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _hints(element) -> str:
+    return f"{element.get('class', '')} {element.get('id', '')}"
+
+
+def link_density(element) -> float:
+    """Share of an element's text that sits inside links."""
+    text_length = len(_clean(element.text_content()))
+    if not text_length:
+        return 0.0
+    link_length = sum(len(_clean(a.text_content())) for a in element.iter("a"))
+    return link_length / text_length
+
+
+def is_paragraph(element) -> bool:
+    """True for paragraph tags and for divs that only hold inline content."""
+    if element.tag in SCORED_TAGS:
+        return True
+    return element.tag == "div" and not any(child.tag in BLOCK_TAGS for child in element)
+
+
+def parse_html(html: Union[str, bytes]):
+    """Parse a document once with lxml (str with an encoding declaration is re-encoded)."""
+    if isinstance(html, str):
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            html = html.encode("utf-8")
+    return lxml.html.document_fromstring(html)
+
+
+class ContentExtractor:
+    """
+    Extract title and body text from article pages.
+
+    The page is parsed once. Per-source CSS selectors are tried first if the
+    source defines them (news_sources.yaml "selectors": {"title": ..., "content": ...}).
+    Otherwise boilerplate (navigation, sidebars, footers, comment blocks, ...)
+    is stripped and the container with the highest text-density score is
+    kept. Scoring favours long, comma-rich paragraphs and penalises links.
+    """
+
+    def __init__(self):
+        # CSS -> XPath translations; compiled XPath objects are not thread-safe,
+        # and extraction runs in worker threads
+        self._xpaths: Dict[str, str] = {}
+        self._translator = HTMLTranslator()
+
+    def _select(self, doc, selector: str) -> List:
+        """Run a per-source CSS selector (translated once, cached)."""
+        xpath = self._xpaths.get(selector)
+        if xpath is None:
+            xpath = self._translator.css_to_xpath(selector)
+            self._xpaths[selector] = xpath
+        return doc.xpath(xpath)
+
+    def extract(
+        self, html: Union[str, bytes], selectors: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """
+        Extract article title and content.
+
+        Args:
+            html: Page markup
+            selectors: Optional per-source CSS overrides ("title", "content")
+
+        Returns:
+            Dict with title and content (paragraphs separated by blank lines)
+        """
+        doc = parse_html(html)
+        selectors = selectors or {}
+
+        title = self._title(doc, selectors.get("title"))
+
+        content = ""
+        if selectors.get("content"):
+            content = self._selected_text(doc, selectors["content"])
+        if len(content) <= MIN_CONTENT_LENGTH:
+            self._strip_boilerplate(doc)
+            content = self._scored_text(doc)
+
+        return {"title": title, "content": content}
+
+    def _title(self, doc, selector: Optional[str]) -> str:
+        """Title from the source selector, og:title, the first <h1>, or <title>."""
+        if selector:
+            for element in self._select(doc, selector):
+                text = _clean(element.text_content())
+                if text:
+                    return text
+
+        for meta in doc.iter("meta"):
+            if meta.get("property") == "og:title" and meta.get("content"):
+                return _clean(meta.get("content"))
+
+        for tag in ("h1", "title"):
+            for element in doc.iter(tag):
+                text = _clean(element.text_content())
+                if text:
+                    return text
+        return ""
+
+    def _selected_text(self, doc, selector: str) -> str:
+        """Text of every element matched by a per-source content selector."""
+        paragraphs = []
+        for element in self._select(doc, selector):
+            blocks = [el for el in element.iter(*TEXT_TAGS)] or [element]
+            paragraphs.extend(_clean(block.text_content()) for block in blocks)
+        return "\n\n".join(p for p in paragraphs if p)
+
+    @staticmethod
+    def _strip_boilerplate(doc) -> None:
+        """Drop non-content tags and elements whose class/id look like chrome."""
+        doomed = []
+        for element in doc.iter():
+            if not isinstance(element.tag, str):
+                doomed.append(element)  # comments, processing instructions
+            elif element.tag in BOILERPLATE_TAGS:
+                doomed.append(element)
+            elif element.tag not in ("html", "body", "article", "main"):
+                hints = _hints(element)
+                if NEGATIVE_HINTS.search(hints) and not POSITIVE_HINTS.search(hints):
+                    doomed.append(element)
+        for element in doomed:
+            if element.getparent() is not None:
+                element.drop_tree()
+
+    @staticmethod
+    def _scored_text(doc) -> str:
+        """Paragraphs of the densest container (plus strong siblings)."""
+        scores: Dict = {}
+        for paragraph in doc.iter(*SCORED_TAGS, "div"):
+            if not is_paragraph(paragraph):
+                continue
+            text = _clean(paragraph.text_content())
+            if len(text) < MIN_PARAGRAPH_LENGTH:
+                continue
+            score = 1 + text.count(",") + min(len(text) // 100, 3)
+            parent = paragraph.getparent()
+            if parent is None:
+                continue
+            scores[parent] = scores.get(parent, 0.0) + score
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] = scores.get(grandparent, 0.0) + score / 2
+
+        if not scores:
+            return ""
+
+        for element in scores:
+            hints = _hints(element)
+            weight = (25 if POSITIVE_HINTS.search(hints) else 0) - (
+                25 if NEGATIVE_HINTS.search(hints) else 0
+            )
+            scores[element] = (scores[element] + weight) * (1 - link_density(element))
+
+        best = max(scores, key=scores.get)
+        containers = [best]
+        parent = best.getparent()
+        if parent is not None:
+            threshold = max(scores[best] * SIBLING_SCORE_RATIO, 10)
+            containers = [
+                sibling
+                for sibling in parent
+                if sibling is best or scores.get(sibling, 0) >= threshold
+            ]
+
+        paragraphs = []
+        for container in containers:
+            for element in container.iter(*TEXT_TAGS, "div"):
+                if element.tag == "div" and not is_paragraph(element):
+                    continue
+                # Nested text blocks are covered by their outermost block
+                if any(ancestor.tag in TEXT_TAGS for ancestor in element.iterancestors()):
+                    continue
+                text = _clean(element.text_content())
+                is_heading = element.tag in ("h2", "h3")
+                if not text or (not is_heading and len(text) < MIN_PARAGRAPH_LENGTH):
+                    continue
+                if link_density(element) > 0.5:
+                    continue
+                paragraphs.append(text)
+
+        return "\n\n".join(paragraphs)
@@ -0,0 +1,77 @@
+"""
+ARAS Feed State Store
+Per-feed HTTP validators and seen-entry tracking across crawls
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import hashlib
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FeedState:
+    """What we know about a feed from previous polls."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    seen_guids: List[str] = field(default_factory=list)  # Most recent first
+    last_entry_date: Optional[str] = None  # ISO timestamp of newest entry
+    last_polled_at: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for the next poll."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def remember(self, guids: List[str]) -> None:
+        """Record newly seen entry GUIDs, keeping a bounded window."""
+        known = set(self.seen_guids)
+        fresh = [guid for guid in guids if guid not in known]
+        self.seen_guids = (fresh + self.seen_guids)[: settings.FEED_STATE_MAX_GUIDS]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeedState":
+        """Build from a stored dict, ignoring unknown keys."""
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+class FeedStateStore:
+    """
+    Feed state persisted in Redis (key feed_state:{sha256(url)}).
+
+    An in-process copy is kept as well, so conditional GETs still work
+    within one process when Redis is unavailable.
+    """
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.ttl = ttl or settings.FEED_STATE_TTL
+        self._local: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _key(feed_url: str) -> str:
+        return f"feed_state:{hashlib.sha256(feed_url.encode()).hexdigest()}"
+
+    async def get(self, feed_url: str) -> FeedState:
+        """Load state for a feed (empty state if never polled)."""
+        key = self._key(feed_url)
+        data = await redis_client.get_json(key) or self._local.get(key)
+        return FeedState.from_dict(data) if data else FeedState()
+
+    async def save(self, feed_url: str, state: FeedState) -> None:
+        """Persist state for a feed."""
+        key = self._key(feed_url)
+        data = asdict(state)
+        self._local[key] = data
+        await redis_client.set_json(key, data, ttl=self.ttl)
@@ -0,0 +1,544 @@
+"""
+ARAS Streaming Ingestion Pipeline
+feeds → fetch → extract → dedup → NLP → store as bounded async stages
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import INGESTION_ITEMS, INGESTION_STAGE_SECONDS
+from app.core.task_queue import TaskQueue, task_queue
+from app.ingestion.crawler import FeedPoll, RSSCrawler
+from app.ingestion.near_duplicates import NearDuplicateDetector, similarity
+from app.schemas.news_schemas import NewsArticleCreate
+from app.services.news_service import NewsService
+from app.services.nlp_service import NLPService, analysis_fields
+from app.tasks.handlers import ENRICH_ARTICLE, REBUILD_GRAPH, RECOMPUTE_TRENDS
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker; each worker of the next stage receives one
+_DONE = object()
+
+# Recently extracted (not yet stored) signatures compared within a run
+PENDING_SIGNATURES = 2000
+
+# Latency samples kept per stage (reservoir sampling keeps memory flat)
+LATENCY_SAMPLES = 10000
+
+Enricher = Callable[[List[str]], Awaitable[Optional[List[Dict]]]]
+
+
+@dataclass
+class IngestItem:
+    """One article travelling through the pipeline."""
+
+    poll: FeedPoll
+    entry: Dict
+    html: Optional[str] = None
+    article: Optional[Dict] = None
+    signature: Optional[np.ndarray] = None
+    duplicate_of: Optional[int] = None
+    canonical: Optional["IngestItem"] = None  # Near-duplicate of an item still in flight
+    enriched: bool = False
+    article_id: Optional[int] = None
+    done: bool = False  # Counted off its feed poll (stored, dropped or failed)
+
+
+@dataclass
+class StageMetrics:
+    """Counters for one pipeline stage."""
+
+    name: str
+    workers: int
+    processed: int = 0
+    emitted: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+    latencies: List[float] = field(default_factory=list)
+    _calls: int = 0
+
+    def record(self, seconds: float, items: int = 1) -> None:
+        """Account one handler call (an item, or a batch for batch stages)."""
+        self.processed += items
+        self.busy_seconds += seconds
+        self._calls += 1
+        INGESTION_ITEMS.inc(self.name, amount=items)
+        INGESTION_STAGE_SECONDS.observe(seconds, self.name)
+        if len(self.latencies) < LATENCY_SAMPLES:
+            self.latencies.append(seconds)
+        else:
+            slot = random.randrange(self._calls)
+            if slot < LATENCY_SAMPLES:
+                self.latencies[slot] = seconds
+
+    def snapshot(self) -> Dict:
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        p50, p99 = np.percentile(self.latencies, [50, 99]) if self.latencies else (0.0, 0.0)
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "errors": self.errors,
+            "items_per_second": round(self.processed / elapsed, 2) if elapsed > 0 else 0.0,
+            "utilization": (
+                round(self.busy_seconds / (elapsed * self.workers), 3) if elapsed > 0 else 0.0
+            ),
+            "max_queue_depth": self.max_queue_depth,
+            "p50_ms": round(float(p50) * 1000, 2),
+            "p99_ms": round(float(p99) * 1000, 2),
+        }
+
+
+class IngestionPipeline:
+    """
+    Streaming ingestion with bounded queues between stages.
+
+    Each stage runs a configurable number of workers. A full queue blocks
+    the stage in front of it, so memory stays bounded by the queue sizes and
+    batch sizes whatever the crawl size. NLP and DB writes are batched.
+    Near-duplicates skip NLP and are stored with duplicate_of set.
+
+    An entry is only counted off its feed poll once it is stored, dropped
+    or has failed, so feed state (seen GUIDs, validators, known URLs) is
+    never saved for entries that could still be lost; failed entries stay
+    unseen and are retried on the next poll.
+    """
+
+    STAGES = ("feeds", "fetch", "extract", "dedup", "nlp", "store")
+
+    def __init__(
+        self,
+        crawler: RSSCrawler,
+        session_factory: Callable,
+        near_duplicates: Optional[NearDuplicateDetector] = None,
+        enricher: Optional[Enricher] = NLPService.analyze_documents,
+        queue_size: Optional[int] = None,
+        workers: Optional[Dict[str, int]] = None,
+        nlp_batch_size: Optional[int] = None,
+        store_batch_size: Optional[int] = None,
+        batch_wait: Optional[float] = None,
+        tasks: Optional[TaskQueue] = None,
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            crawler: Feed poller, fetcher and extractor
+            session_factory: Async session factory for the store stage
+            near_duplicates: Near-duplicate detector (None disables the check)
+            enricher: Async batch NLP callable (None disables enrichment)
+            queue_size: Capacity of each inter-stage queue
+            workers: Per-stage worker counts overriding the settings
+            nlp_batch_size: Articles per NLP batch
+            store_batch_size: Articles per DB transaction
+            batch_wait: Seconds to wait for a batch to fill
+            tasks: Queue for follow-up jobs (graph, trends, deferred NLP)
+        """
+        self.crawler = crawler
+        self.session_factory = session_factory
+        self.near_duplicates = near_duplicates
+        self.enricher = enricher
+        self.queue_size = queue_size or settings.INGESTION_QUEUE_SIZE
+        self.nlp_batch_size = nlp_batch_size or settings.INGESTION_NLP_BATCH_SIZE
+        self.store_batch_size = store_batch_size or settings.INGESTION_STORE_BATCH_SIZE
+        self.batch_wait = settings.INGESTION_BATCH_WAIT if batch_wait is None else batch_wait
+        self.tasks = tasks or task_queue
+
+        self.workers = {
+            "feeds": settings.INGESTION_FEED_WORKERS,
+            "fetch": settings.INGESTION_FETCH_WORKERS,
+            "extract": settings.INGESTION_EXTRACT_WORKERS,
+            "dedup": 1,  # Sequential so in-flight near-duplicates see each other
+            "nlp": settings.INGESTION_NLP_WORKERS,
+            "store": settings.INGESTION_STORE_WORKERS,
+            **(workers or {}),
+        }
+        self.metrics: Dict[str, StageMetrics] = {}
+        self.stats: Dict[str, int] = {}
+        self._pending: "OrderedDict[int, IngestItem]" = OrderedDict()
+        # Copies that reached the store stage before their canonical, by id(canonical)
+        self._held: Dict[int, List[IngestItem]] = {}
+        self._enricher_available = True
+
+    @classmethod
+    def for_session(cls, crawler: RSSCrawler, db_session, **kwargs) -> "IngestionPipeline":
+        """Pipeline writing through one existing session (single store worker)."""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield db_session
+
+        workers = {**kwargs.pop("workers", {}), "store": 1}
+        return cls(crawler, session_factory, workers=workers, **kwargs)
+
+    async def run(self, sources: List[Dict]) -> Dict:
+        """
+        Run all feeds of sources through the pipeline.
+
+        Returns:
+            Ingestion statistics plus per-stage metrics
+        """
+        self.metrics = {name: StageMetrics(name, self.workers[name]) for name in self.STAGES}
+        self.stats = {
+            "feeds": 0,
+            "entries": 0,
+            "inserted": 0,
+            "duplicates": 0,
+            "near_duplicates": 0,
+            "errors": 0,
+        }
+        self._pending.clear()
+        self._held.clear()
+
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.STAGES]
+        handlers = {
+            "feeds": self._poll_feed,
+            "fetch": self._fetch,
+            "extract": self._extract,
+            "dedup": self._dedup,
+        }
+
+        tasks = [asyncio.create_task(self._produce(sources, queues[0]))]
+        for index, name in enumerate(self.STAGES):
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            if name == "nlp":
+                runner = self._batch_stage(name, inbox, outbox, self.nlp_batch_size, self._enrich)
+            elif name == "store":
+                runner = self._batch_stage(name, inbox, None, self.store_batch_size, self._store)
+            else:
+                runner = self._stage(name, inbox, outbox, handlers[name])
+            tasks.append(asyncio.create_task(runner))
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        # Every canonical finishes before the store stage closes; this is a safeguard
+        await self._fail([copy for copies in self._held.values() for copy in copies])
+        self._held.clear()
+
+        if self.stats["inserted"]:
+            await self.tasks.enqueue(RECOMPUTE_TRENDS, {}, dedup_key="all")
+
+        stats = {**self.stats, "stages": {name: m.snapshot() for name, m in self.metrics.items()}}
+        logger.info(
+            f"Pipeline complete: {stats['inserted']} inserted "
+            f"({stats['near_duplicates']} near-duplicates), "
+            f"{stats['duplicates']} duplicates, {stats['errors']} errors"
+        )
+        return stats
+
+    # ------------------------------------------------------------------
+    # Stage plumbing
+    # ------------------------------------------------------------------
+
+    async def _produce(self, sources: List[Dict], outbox: asyncio.Queue) -> None:
+        """Feed every (source, feed_url) pair into the first stage."""
+        for source in sources:
+            for feed_url in source.get("rss_feeds", []):
+                await outbox.put((source, feed_url))
+        for _ in range(self.workers["feeds"]):
+            await outbox.put(_DONE)
+
+    async def _put(self, name: str, outbox: Optional[asyncio.Queue], item: Any) -> None:
+        if outbox is None:
+            return
+        await outbox.put(item)
+        metrics = self.metrics[name]
+        metrics.emitted += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, outbox.qsize())
+
+    async def _close(self, name: str, outbox: Optional[asyncio.Queue]) -> None:
+        """Signal end-of-stream to every worker of the next stage."""
+        self.metrics[name].finished_at = time.perf_counter()
+        if outbox is None:
+            return
+        next_name = self.STAGES[self.STAGES.index(name) + 1]
+        for _ in range(self.workers[next_name]):
+            await outbox.put(_DONE)
+
+    async def _stage(
+        self, name: str, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue], handler
+    ) -> None:
+        """Run a per-item stage with its configured number of workers."""
+        metrics = self.metrics[name]
+
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    return
+                start = time.perf_counter()
+                try:
+                    results = await handler(item)
+                except Exception as e:
+                    metrics.errors += 1
+                    self.stats["errors"] += 1
+                    logger.error(f"Pipeline stage {name} failed: {e}")
+                    if isinstance(item, IngestItem):
+                        await self._fail([item])
+                    results = []
+                finally:
+                    metrics.record(time.perf_counter() - start)
+                for result in results:
+                    await self._put(name, outbox, result)
+
+        await asyncio.gather(*(worker() for _ in range(self.workers[name])))
+        await self._close(name, outbox)
+
+    async def _batch_stage(
+        self,
+        name: str,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        batch_size: int,
+        handler,
+    ) -> None:
+        """Run a stage that handles items in batches (size or time bound)."""
+        metrics = self.metrics[name]
+
+        async def worker():
+            done = False
+            while not done:
+                batch, done = await self._next_batch(inbox, batch_size)
+                if not batch:
+                    continue
+                start = time.perf_counter()
+                try:
+                    results = await handler(batch)
+                except Exception as e:
+                    metrics.errors += 1
+                    self.stats["errors"] += len(batch)
+                    logger.error(f"Pipeline stage {name} failed for a batch of {len(batch)}: {e}")
+                    await self._fail(batch)
+                    results = []
+                finally:
+                    metrics.record(time.perf_counter() - start, len(batch))
+                for result in results:
+                    await self._put(name, outbox, result)
+
+        await asyncio.gather(*(worker() for _ in range(self.workers[name])))
+        await self._close(name, outbox)
+
+    async def _next_batch(self, inbox: asyncio.Queue, size: int) -> Tuple[List, bool]:
+        """Collect up to size items, waiting at most batch_wait after the first."""
+        first = await inbox.get()
+        if first is _DONE:
+            return [], True
+
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait
+        while len(batch) < size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(inbox.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _poll_feed(self, job: Tuple[Dict, str]) -> List[IngestItem]:
+        """Conditional GET of a feed; emits its new, unseen entries."""
+        source, feed_url = job
+        self.stats["feeds"] += 1
+        poll = await self.crawler.poll_feed(source, feed_url)
+        if poll is None:
+            return []
+        if not poll.to_fetch:
+            await self.crawler.finish_poll(poll)
+            return []
+
+        poll.pending = len(poll.to_fetch)
+        self.stats["entries"] += poll.pending
+        return [IngestItem(poll=poll, entry=entry) for entry in poll.to_fetch]
+
+    async def _complete(self, item: IngestItem, failed: bool = False) -> None:
+        """Mark an entry done for its feed; the last one persists feed state."""
+        if item.done:
+            return
+        item.done = True
+        self._pending.pop(id(item), None)
+        poll = item.poll
+        if failed:
+            poll.failed.add(item.entry["guid"])
+            # Copies waiting for this canonical are retried with it
+            for copy in self._held.pop(id(item), []):
+                await self._complete(copy, failed=True)
+        poll.pending -= 1
+        if poll.pending == 0:
+            await self.crawler.finish_poll(poll)
+
+    async def _fail(self, items: List[IngestItem]) -> None:
+        """Complete entries lost to a stage error so their feeds retry them."""
+        for item in items:
+            try:
+                await self._complete(item, failed=True)
+            except Exception as e:
+                logger.error(f"Could not finish poll of {item.poll.feed_url}: {e}")
+
+    async def _fetch(self, item: IngestItem) -> List[IngestItem]:
+        """Download the article page."""
+        result = await self.crawler.fetcher.fetch(item.entry["url"])
+        if not result.ok:
+            await self._complete(item, failed=result.retryable)
+            return []
+        item.html = result.text
+        return [item]
+
+    async def _extract(self, item: IngestItem) -> List[IngestItem]:
+        """Extract title and content; the page markup is released here."""
+        html, item.html = item.html, None
+        item.article = await self.crawler.extract_article(item.poll.source, item.entry, html)
+        if not item.article:
+            await self._complete(item)
+            return []
+        return [item]
+
+    async def _dedup(self, item: IngestItem) -> List[IngestItem]:
+        """Near-duplicate check against stored and in-flight articles."""
+        if self.near_duplicates is None:
+            return [item]
+
+        item.signature = await asyncio.to_thread(
+            self.near_duplicates.signature, item.article["content"]
+        )
+        if item.signature is None:
+            return [item]
+
+        item.duplicate_of = await self.near_duplicates.find_canonical(item.signature)
+        if item.duplicate_of is None:
+            item.canonical = self._pending_match(item.signature)
+        if item.duplicate_of is None and item.canonical is None:
+            self._pending[id(item)] = item
+            while len(self._pending) > PENDING_SIGNATURES:
+                self._pending.popitem(last=False)
+        return [item]
+
+    def _pending_match(self, signature: np.ndarray) -> Optional[IngestItem]:
+        """Most similar canonical item extracted earlier in this run, if any."""
+        threshold = self.near_duplicates.index.threshold
+        best, best_score = None, threshold
+        for pending in self._pending.values():
+            score = similarity(signature, pending.signature)
+            if score >= best_score:
+                best, best_score = pending, score
+        return best
+
+    async def _enrich(self, batch: List[IngestItem]) -> List[IngestItem]:
+        """Batched NLP for canonical articles; near-duplicates pass straight through."""
+        targets = [item for item in batch if item.duplicate_of is None and item.canonical is None]
+        if targets and self.enricher is not None and self._enricher_available:
+            results = await self.enricher([item.article["content"] for item in targets])
+            if results is None:
+                self._enricher_available = False
+                logger.warning("NLP enrichment unavailable, storing articles without analysis")
+            else:
+                for item, analysis in zip(targets, results):
+                    item.article.update(analysis_fields(analysis))
+                    item.enriched = True
+        return batch
+
+    async def _store(self, batch: List[IngestItem]) -> List:
+        """Bulk insert a batch and index new canonical articles."""
+        try:
+            while batch:
+                batch = await self._ready(batch)
+                await self._insert(batch)
+                # Copies that were waiting for these canonicals now have their ids
+                batch = [copy for item in batch for copy in self._held.pop(id(item), [])]
+        except Exception:
+            await self._fail(batch)
+            raise
+        return []
+
+    async def _ready(self, items: List[IngestItem]) -> List[IngestItem]:
+        """
+        Items that can be written now.
+
+        A copy whose canonical is still in flight (later in this batch, in
+        NLP or in another store batch) is held until the canonical is
+        stored. A copy whose canonical was dropped (exact duplicate, failed)
+        becomes a canonical itself and gets the NLP it skipped.
+        """
+        orphans = [
+            item
+            for item in items
+            if item.canonical is not None
+            and item.canonical.done
+            and item.canonical.article_id is None
+        ]
+        for item in orphans:
+            item.canonical = None
+        if orphans:
+            await self._enrich(orphans)
+
+        ready = []
+        for item in items:
+            if item.canonical is not None and not item.canonical.done:
+                self._held.setdefault(id(item.canonical), []).append(item)
+            else:
+                ready.append(item)
+        return ready
+
+    async def _insert(self, items: List[IngestItem]) -> None:
+        """Write items in one transaction and record their ids."""
+        for item in items:
+            if item.canonical is not None:
+                item.duplicate_of = item.canonical.article_id
+            if item.duplicate_of is not None:
+                item.article["duplicate_of"] = item.duplicate_of
+
+        async with self.session_factory() as session:
+            created = await NewsService.create_articles_bulk(
+                session, [NewsArticleCreate(**item.article) for item in items]
+            )
+            ids = [article.id if article is not None else None for article in created]
+
+        enriched, unenriched = [], []
+        for item, article_id in zip(items, ids):
+            if article_id is None:
+                self.stats["duplicates"] += 1
+            else:
+                item.article_id = article_id
+                self.stats["inserted"] += 1
+                if item.duplicate_of is not None:
+                    self.stats["near_duplicates"] += 1
+                else:
+                    if self.near_duplicates is not None:
+                        await self.near_duplicates.register(article_id, item.signature)
+                    (enriched if item.enriched else unenriched).append(article_id)
+            await self._complete(item)
+
+        # Graph edges need entities; articles that missed inline NLP get it in the background
+        if enriched:
+            await self.tasks.enqueue(REBUILD_GRAPH, {"article_ids": enriched})
+        if unenriched:
+            await self.tasks.enqueue(ENRICH_ARTICLE, {"article_ids": unenriched})
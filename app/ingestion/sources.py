@@ -0,0 +1,42 @@
+"""
+ARAS News Source Configuration
+Loads feed definitions from config/news_sources.yaml
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import logging
+from typing import Dict, List
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+def load_news_sources(config_path: str) -> List[Dict]:
+    """
+    Load every news source from the YAML config.
+
+    All top-level groups ending in "_sources" (iranian_english_sources,
+    international_sources, specialized_sources, ...) are merged.
+
+    Returns:
+        List of source dicts (name, url, rss_feeds, category, priority, ...)
+    """
+    try:
+        with open(config_path, "r") as f:
+            config = yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.error(f"Failed to load news sources config: {e}")
+        return []
+
+    sources = []
+    for group, entries in config.items():
+        if group.endswith("_sources") and isinstance(entries, list):
+            sources.extend(entries)
+    return sources
+
+
+def iter_feeds(sources: List[Dict]) -> List[tuple]:
+    """Return (source, feed_url) pairs for every configured RSS feed."""
+    return [(source, feed_url) for source in sources for feed_url in source.get("rss_feeds", [])]
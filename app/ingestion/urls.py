@@ -0,0 +1,84 @@
+"""
+ARAS URL Canonicalization
+Normalize article URLs so trivial variants dedup to one key
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import posixpath
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track campaigns/referrers and never change content
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "ref",
+    "ref_src",
+    "referrer",
+    "cmpid",
+    "ocid",
+    "ito",
+}
+TRACKING_PREFIXES = ("utm_", "at_", "pk_", "mtm_")
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _is_tracking(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return the canonical form of an article URL.
+
+    - http/https collapse to https, host lowercased, "www." and default port dropped
+    - fragment removed, tracking parameters (utm_*, fbclid, ...) removed
+    - remaining query parameters sorted, path dot-segments and trailing slash removed
+    - percent-encoding normalized
+
+    Only used as a dedup key; articles are still fetched from their original URL.
+    Malformed URLs (bad port, unbalanced IPv6 brackets) are returned as given.
+    """
+    url = str(url).strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme in ("http", "https"):
+        scheme = "https"
+
+    host = (parts.hostname or "").lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host if port is None or str(port) in DEFAULT_PORTS.values() else f"{host}:{port}"
+
+    path = quote(unquote(parts.path), safe="/:@!$&'()*+,;=-._~")
+    if path:
+        path = posixpath.normpath(path)
+        if parts.path.endswith("/") and path != "/":
+            path = path.rstrip("/")
+    if path in ("", ".", "/"):
+        path = ""
+
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking(name)
+        )
+    )
+
+    return urlunsplit((scheme, netloc, path, query, ""))
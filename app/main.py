@@ -19,23 +19,29 @@ Features:
 - Topic modeling
 """
 
+import asyncio
 import logging
-import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from app.api.debug import router as debug_router
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.database import create_tables
-from app.core.rate_limiter import RateLimiter
+from app.core.database import dispose_engines, prepare_schema
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, MetricsMiddleware
+from app.core.multiprocess import collect_metrics
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.rate_limiter import RateLimiter, RateLimitMiddleware
 from app.core.redis_client import redis_client
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.core.audit_logger import AuditLoggerMiddleware
+from app.core.audit_sink import audit_sink
 
 # Configure logging
 logging.basicConfig(
@@ -50,16 +56,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager."""
     logger.info("Starting ARAS Microservice...")
 
-    # Startup
-    await create_tables()
+    # Startup (under gunicorn the master already ran the DDL once, before forking)
+    if settings.DATABASE_SCHEMA_ON_STARTUP:
+        await prepare_schema()
     await redis_client.connect()
 
+    if settings.NLP_PRELOAD:
+        from app.nlp.spacy_engine import get_nlp_engine
+
+        # Already loaded when the gunicorn master preloaded it before forking
+        await asyncio.to_thread(lambda: get_nlp_engine().warm_up())
+
+    worker_stop, worker_task = None, None
+    if settings.TASK_WORKER_EMBEDDED:
+        from app.tasks.worker import TaskWorker
+
+        worker_stop = asyncio.Event()
+        worker_task = asyncio.create_task(TaskWorker(block_ms=1000).run(worker_stop))
+
     logger.info("ARAS Microservice started successfully")
 
     yield
 
     # Shutdown
+    if worker_task is not None:
+        worker_stop.set()
+        await worker_task
     await redis_client.disconnect()
+    await dispose_engines()
+    await asyncio.to_thread(audit_sink.close)
     logger.info("ARAS Microservice shut down")
 
 
@@ -74,6 +99,26 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Middleware is pure ASGI and listed innermost first; the resulting order is
+# security headers -> audit/timing -> metrics -> profiling -> SQL stats -> CORS ->
+# trusted host -> rate limit -> app
+
+# Rate limiting middleware
+rate_limiter = RateLimiter(
+    requests_per_minute=settings.RATE_LIMIT_PER_MINUTE,
+    requests_per_hour=settings.RATE_LIMIT_PER_HOUR,
+)
+app.add_middleware(
+    RateLimitMiddleware, limiter=rate_limiter, exempt_paths=("/health", "/", "/metrics")
+)
+
+# Add trusted host middleware
+if not settings.DEBUG:
+    app.add_middleware(
+        TrustedHostMiddleware,
+        allowed_hosts=settings.ALLOWED_HOSTS,
+    )
+
 # Set up CORS
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -84,56 +129,23 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
-# Add security headers middleware
-app.add_middleware(SecurityHeadersMiddleware)
+# Per-request SQL statement counts for /metrics and X-DB-* debug headers
+if settings.ENABLE_METRICS or settings.SQL_DEBUG_HEADERS:
+    app.add_middleware(QueryStatsMiddleware)
 
-# Add audit logging middleware
-app.add_middleware(AuditLoggerMiddleware)
+# Per-request span timings and slow-request capture for /debug
+if settings.ENABLE_PROFILING:
+    app.add_middleware(ProfilingMiddleware)
 
-# Add trusted host middleware
-if not settings.DEBUG:
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=settings.ALLOWED_HOSTS,
-    )
+# Record request latency histograms for /metrics
+if settings.ENABLE_METRICS:
+    app.add_middleware(MetricsMiddleware)
 
+# Add audit logging middleware (also sets X-Request-ID and timing headers)
+app.add_middleware(AuditLoggerMiddleware)
 
-# Rate limiting middleware
-rate_limiter = RateLimiter(requests_per_minute=60, requests_per_hour=1000)
-
-
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
-    """Apply rate limiting to all requests."""
-    # Skip rate limiting for health check
-    if request.url.path in ["/health", "/"]:
-        return await call_next(request)
-
-    # Check rate limit
-    try:
-        await rate_limiter.check_rate_limit(request)
-    except Exception as e:
-        # If rate limit exceeded, exception is already raised
-        # If Redis error, log and continue
-        if "Rate limit exceeded" not in str(e):
-            logger.warning(f"Rate limiting error: {e}")
-
-    # Add request timing
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-
-    # Add headers
-    response.headers["X-Process-Time"] = str(process_time)
-    if hasattr(request.state, "rate_limit_remaining_minute"):
-        response.headers["X-RateLimit-Remaining-Minute"] = str(
-            request.state.rate_limit_remaining_minute
-        )
-        response.headers["X-RateLimit-Remaining-Hour"] = str(
-            request.state.rate_limit_remaining_hour
-        )
-
-    return response
+# Add security headers middleware
+app.add_middleware(SecurityHeadersMiddleware)
 
 
 @app.get("/health")
@@ -142,6 +154,15 @@ async def health_check():
     return {"status": "healthy", "service": "ARAS Microservice"}
 
 
+if settings.ENABLE_METRICS:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics."""
+        # Under gunicorn this merges every worker's metrics
+        return Response(REGISTRY.render(collect_metrics()), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -156,6 +177,9 @@ async def root():
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+if settings.ENABLE_PROFILING:
+    app.include_router(debug_router, prefix="/debug", include_in_schema=False)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -5,7 +5,9 @@ SQLAlchemy models for news analysis
 Built by Elite Team - Database Engineer (PhD in Database Systems)
 """
 
-from sqlalchemy import JSON, Column, DateTime, Float, Integer, String, Text
+import hashlib
+
+from sqlalchemy import JSON, Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 
@@ -13,7 +15,17 @@ from app.core.database import Base
 
 
 class NewsArticle(Base):
-    """News article model."""
+    """
+    News article model.
+
+    In PostgreSQL the table is range-partitioned by month on published_date
+    (see alembic revision 5b7e1c9d2a41 and app/core/partitions.py). The physical
+    primary key is (id, published_date); ids stay globally unique because all
+    partitions share one sequence, so the ORM keeps mapping on id alone.
+    create_tables() builds a plain table (development and tests); partition
+    maintenance skips it. URL uniqueness is enforced by the ArticleUrl dedup
+    table, since a unique index cannot span partitions.
+    """
 
     __tablename__ = "news_articles"
 
@@ -21,18 +33,41 @@ class NewsArticle(Base):
     title = Column(String(500), nullable=False, index=True)
     content = Column(Text, nullable=False)
     summary = Column(Text)
-    source = Column(String(255), nullable=False, index=True)
+    source = Column(String(255), nullable=False)
     published_date = Column(DateTime, nullable=False, index=True)
     language = Column(String(10), default="en")
-    category = Column(String(100), index=True)
+    category = Column(String(100))
     tags = Column(JSON, default=list)  # List of tags
     sentiment_score = Column(Float, default=0.0)  # -1 to 1
     entities = Column(JSON, default=list)  # Extracted entities
     topics = Column(JSON, default=list)  # Topic modeling results
-    url = Column(String(1000), unique=True, index=True)
+    url = Column(String(1000), index=True)
+    duplicate_of = Column(Integer, nullable=True)  # Canonical article of a near-duplicate cluster
+    nlp_version = Column(
+        String(64), nullable=True
+    )  # Model/lexicon that produced sentiment, entities, topics
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Filter + sort patterns used by get_articles (alembic revision 8d3f6a0b7c12)
+        Index("ix_news_articles_category_published_date", category, published_date.desc()),
+        Index("ix_news_articles_source_published_date", source, published_date.desc()),
+        Index("ix_news_articles_language_published_date", language, published_date.desc()),
+        # Compact block-range index for date range scans
+        Index(
+            "ix_news_articles_published_date_brin",
+            published_date,
+            postgresql_using="brin",
+        ),
+        # Near-duplicate cluster members (most articles are canonical, so keep it partial)
+        Index(
+            "ix_news_articles_duplicate_of",
+            duplicate_of,
+            postgresql_where=duplicate_of.isnot(None),
+        ),
+    )
+
     @validates("url")
     def validate_url(self, key, value):
         """Convert Pydantic HttpUrl to string before DB insert."""
@@ -45,6 +80,32 @@ class NewsArticle(Base):
         return f"<NewsArticle(id={self.id}, title='{self.title[:50]}...')>"
 
 
+def hash_url(url: str) -> str:
+    """Return the SHA-256 hex digest used as the URL dedup key."""
+    return hashlib.sha256(str(url).encode("utf-8")).hexdigest()
+
+
+class ArticleUrl(Base):
+    """
+    URL dedup index for news articles.
+
+    A unique index on url cannot span partitions of news_articles, so each
+    article URL is registered here by hash and the primary key keeps URLs
+    unique across every partition.
+    """
+
+    __tablename__ = "news_article_urls"
+
+    url_hash = Column(String(64), primary_key=True)
+    url = Column(String(1000), nullable=False)
+    article_id = Column(Integer, nullable=False, index=True)
+    published_date = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ArticleUrl(article_id={self.article_id}, url='{self.url[:50]}')>"
+
+
 class Entity(Base):
     """Named entity model."""
 
@@ -78,6 +139,16 @@ class Trend(Base):
     keywords = Column(JSON, default=list)
     created_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        # Partial index serving get_active_trends (end_date IS NULL, by confidence)
+        Index(
+            "ix_trends_active_confidence_score",
+            confidence_score.desc(),
+            postgresql_where=end_date.is_(None),
+            sqlite_where=end_date.is_(None),
+        ),
+    )
+
     def __repr__(self):
         return f"<Trend(id={self.id}, name='{self.name}', confidence={self.confidence_score})>"
 
@@ -0,0 +1,194 @@
+"""
+NLP Re-enrichment Backfill
+Re-analyse articles whose nlp_version differs from the running model
+
+Walks canonical articles in primary-key order (keyset pagination, no
+OFFSET), analyses each chunk with one nlp.pipe() pass, writes results back
+with a single executemany UPDATE and checkpoints the last id in Redis. A
+restarted run continues from the checkpoint; even without one, the
+nlp_version filter means already-updated rows are skipped, never redone.
+
+Built by Elite Team - Data Scientist (PhD in NLP)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import or_, select, update
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+from app.core.task_queue import TaskQueue, task_queue
+from app.models.news_models import NewsArticle
+from app.services.nlp_service import NLPService, analysis_fields
+
+logger = logging.getLogger(__name__)
+
+Analyzer = Callable[[List[str]], Awaitable[Optional[List[Dict]]]]
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Progress of one backfill towards a target nlp_version."""
+
+    last_id: int = 0
+    processed: int = 0
+    updated_at: Optional[str] = None
+
+
+class NLPBackfill:
+    """
+    Resumable, throttled re-enrichment job.
+
+    Throttling keeps the job in the background: after each chunk it sleeps
+    long enough to stay under NLP_BACKFILL_MAX_DUTY, and it pauses while
+    the live task queue has more than NLP_BACKFILL_MAX_BACKLOG jobs waiting.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        version: Optional[str] = None,
+        analyzer: Optional[Analyzer] = None,
+        chunk_size: Optional[int] = None,
+        max_duty: Optional[float] = None,
+        max_backlog: Optional[int] = None,
+        tasks: Optional[TaskQueue] = None,
+    ):
+        """
+        Initialize backfill.
+
+        Args:
+            session_factory: Async session factory
+            version: Target nlp_version (defaults to the loaded engine's)
+            analyzer: Batch analysis callable (defaults to NLPService.analyze_documents)
+            chunk_size: Articles per round
+            max_duty: Fraction of wall time spent working (1.0 = no throttling)
+            max_backlog: Live task backlog above which the job pauses
+            tasks: Task queue whose backlog is watched
+        """
+        if version is None:
+            from app.nlp.spacy_engine import get_nlp_engine
+
+            version = get_nlp_engine().version
+        self.session_factory = session_factory
+        self.version = version
+        self.analyzer = analyzer or NLPService.analyze_documents
+        self.chunk_size = chunk_size or settings.NLP_BACKFILL_CHUNK_SIZE
+        self.max_duty = max_duty or settings.NLP_BACKFILL_MAX_DUTY
+        self.max_backlog = settings.NLP_BACKFILL_MAX_BACKLOG if max_backlog is None else max_backlog
+        self.tasks = tasks or task_queue
+        self.checkpoint_key = f"nlp_backfill:{version}"
+        self._local_checkpoint: Optional[BackfillCheckpoint] = None
+
+    async def load_checkpoint(self) -> BackfillCheckpoint:
+        data = await redis_client.get_json(self.checkpoint_key)
+        if data is not None:
+            return BackfillCheckpoint(**data)
+        return self._local_checkpoint or BackfillCheckpoint()
+
+    async def save_checkpoint(self, checkpoint: BackfillCheckpoint) -> None:
+        checkpoint.updated_at = datetime.utcnow().isoformat()
+        self._local_checkpoint = checkpoint
+        await redis_client.set_json(
+            self.checkpoint_key, asdict(checkpoint), settings.NLP_BACKFILL_CHECKPOINT_TTL
+        )
+
+    async def reset(self) -> None:
+        """Forget progress (the next run starts from the first article)."""
+        self._local_checkpoint = None
+        await redis_client.delete(self.checkpoint_key)
+
+    async def run(
+        self, stop: Optional[asyncio.Event] = None, max_chunks: Optional[int] = None
+    ) -> Dict:
+        """
+        Process stale articles until done, stopped or max_chunks rounds.
+
+        Returns:
+            Dict with processed count, last id and whether the scan finished
+        """
+        stop = stop or asyncio.Event()
+        checkpoint = await self.load_checkpoint()
+        logger.info(f"NLP backfill to {self.version} starting after id {checkpoint.last_id}")
+
+        chunks, finished = 0, False
+        while not stop.is_set() and (max_chunks is None or chunks < max_chunks):
+            await self._wait_for_quiet_queue(stop)
+
+            started = time.monotonic()
+            rows = await self._next_chunk(checkpoint.last_id)
+            if not rows:
+                finished = True
+                break
+
+            analyses = await self.analyzer([content for _, content in rows])
+            if analyses is None:
+                raise RuntimeError("NLP model unavailable, backfill cannot continue")
+            await self._write(rows, analyses)
+
+            checkpoint.last_id = rows[-1][0]
+            checkpoint.processed += len(rows)
+            await self.save_checkpoint(checkpoint)
+            chunks += 1
+
+            # Duty-cycle throttle: work for t, then rest t * (1 - duty) / duty
+            elapsed = time.monotonic() - started
+            if self.max_duty < 1.0:
+                await self._sleep(stop, elapsed * (1 - self.max_duty) / self.max_duty)
+
+        logger.info(
+            f"NLP backfill {'finished' if finished else 'paused'}: "
+            f"{checkpoint.processed} articles, last id {checkpoint.last_id}"
+        )
+        return {
+            "processed": checkpoint.processed,
+            "last_id": checkpoint.last_id,
+            "finished": finished,
+        }
+
+    async def _next_chunk(self, after_id: int) -> List[tuple]:
+        """Next stale canonical articles by id (keyset pagination)."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(NewsArticle.id, NewsArticle.content)
+                .where(
+                    NewsArticle.id > after_id,
+                    NewsArticle.duplicate_of.is_(None),
+                    or_(NewsArticle.nlp_version.is_(None), NewsArticle.nlp_version != self.version),
+                )
+                .order_by(NewsArticle.id)
+                .limit(self.chunk_size)
+            )
+            return result.all()
+
+    async def _write(self, rows: List[tuple], analyses: List[Dict]) -> None:
+        """One executemany UPDATE for the whole chunk, then drop its cached copies."""
+        values = [
+            {"id": article_id, **analysis_fields(analysis), "nlp_version": self.version}
+            for (article_id, _), analysis in zip(rows, analyses)
+        ]
+        async with self.session_factory() as session:
+            await session.execute(update(NewsArticle), values)
+            await session.commit()
+        await redis_client.delete_many(f"article:{article_id}" for article_id, _ in rows)
+
+    async def _wait_for_quiet_queue(self, stop: asyncio.Event) -> None:
+        """Yield to live enrichment while its backlog is high."""
+        while not stop.is_set():
+            stats = await self.tasks.stats()
+            if stats["queued"] <= self.max_backlog:
+                return
+            logger.info(f"NLP backfill paused: {stats['queued']} live tasks queued")
+            await self._sleep(stop, 5.0)
+
+    @staticmethod
+    async def _sleep(stop: asyncio.Event, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
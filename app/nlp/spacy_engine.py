@@ -13,24 +13,83 @@ Strategic Decision: English-only content for better ML/NLP performance
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 from collections import Counter
 
-import spacy
-from spacy.language import Language
+from app.core.config import settings
+from app.core.lazy_imports import lazy_import
+from app.core.metrics import NLP_EXECUTOR_QUEUED, NLP_EXECUTOR_RUNNING, NLP_INFERENCE_SECONDS
+from app.core.profiling import span
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+
+# Loaded on first use (load_model), keeping ~1s of imports out of startup
+spacy = lazy_import("spacy")
 
 logger = logging.getLogger(__name__)
 
-import asyncio
-import logging
-from typing import Dict, List, Optional, Tuple
-from collections import Counter
 
-import spacy
-from spacy.language import Language
+# Sentiment lexicon (v1.0.0 simplified)
+POSITIVE_WORDS = {
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+    'positive', 'best', 'better', 'outstanding', 'superb', 'brilliant',
+    'impressive', 'exceptional', 'remarkable', 'successful', 'victory',
+    'win', 'progress', 'improvement', 'growth', 'benefit', 'advantage',
+    'strong', 'leading', 'breakthrough', 'innovation', 'achievement'
+}
+
+NEGATIVE_WORDS = {
+    'bad', 'terrible', 'awful', 'horrible', 'negative', 'worst',
+    'worse', 'poor', 'disappointing', 'failure', 'failed', 'crisis',
+    'problem', 'issue', 'concern', 'threat', 'risk', 'danger',
+    'decline', 'decrease', 'loss', 'damage', 'harm', 'conflict',
+    'weak', 'falling', 'collapse', 'corruption', 'scandal', 'violation'
+}
 
-logger = logging.getLogger(__name__)
+
+# Bump when sentiment scoring or keyword extraction changes; together with a
+# digest of the lexicons it forms part of the nlp_version stamp on articles
+ANALYSIS_REVISION = 1
+LEXICON_VERSION = f"{ANALYSIS_REVISION}." + hashlib.sha1(
+    " ".join(sorted(POSITIVE_WORDS) + ["|"] + sorted(NEGATIVE_WORDS)).encode()
+).hexdigest()[:8]
+
+
+def _sentiment_from_counts(pos_count: int, neg_count: int, total_words: int) -> Dict:
+    """Polarity and confidence from lexicon hit counts."""
+    if total_words == 0:
+        return {
+            "sentiment": "neutral",
+            "polarity": 0.0,
+            "confidence": 0.5
+        }
+
+    # Calculate polarity
+    pos_ratio = pos_count / total_words
+    neg_ratio = neg_count / total_words
+
+    if pos_count > neg_count:
+        sentiment = "positive"
+        polarity = min(0.9, 0.5 + pos_ratio * 2)
+        confidence = min(0.95, 0.6 + (pos_count - neg_count) / total_words)
+    elif neg_count > pos_count:
+        sentiment = "negative"
+        polarity = max(-0.9, -0.5 - neg_ratio * 2)
+        confidence = min(0.95, 0.6 + (neg_count - pos_count) / total_words)
+    else:
+        sentiment = "neutral"
+        polarity = 0.0
+        confidence = 0.7 if pos_count == 0 else 0.5
+
+    return {
+        "sentiment": sentiment,
+        "polarity": round(polarity, 2),
+        "confidence": round(confidence, 2)
+    }
 
 
 class SpacyNLPEngine:
@@ -44,7 +103,7 @@ class SpacyNLPEngine:
             model_name: spaCy model (default: en_core_web_sm for v1.0.0)
         """
         self.model_name = model_name
-        self.nlp: Optional[Language] = None
+        self.nlp: Optional["Language"] = None
         self._model_loaded = False
         
         # Load model immediately
@@ -80,6 +139,41 @@ class SpacyNLPEngine:
             logger.error(f"Unexpected error loading spaCy: {e}")
             return False
 
+    def warm_up(self) -> None:
+        """Run a throwaway parse so lazily built pipeline state exists before traffic."""
+        if self._model_loaded:
+            self.nlp("ARAS warms up its NLP pipeline before serving traffic in Tehran.")
+
+    async def run_async(self, analysis: str, func: Callable, *args):
+        """
+        Run an analysis in the default executor.
+
+        Records executor queue depth, running calls and inference time
+        per analysis for /metrics; the request's "nlp" profiling span
+        includes time spent queued for a thread.
+        """
+        started = False
+        NLP_EXECUTOR_QUEUED.inc()
+
+        def call():
+            nonlocal started
+            started = True
+            NLP_EXECUTOR_QUEUED.dec()
+            NLP_EXECUTOR_RUNNING.inc()
+            try:
+                with NLP_INFERENCE_SECONDS.time(analysis):
+                    return func(*args)
+            finally:
+                NLP_EXECUTOR_RUNNING.dec()
+
+        loop = asyncio.get_event_loop()
+        try:
+            with span("nlp"):
+                return await loop.run_in_executor(None, call)
+        finally:
+            if not started:  # Cancelled while still queued
+                NLP_EXECUTOR_QUEUED.dec()
+
     async def analyze_sentiment_async(self, text: str) -> Dict:
         """
         Async sentiment analysis wrapper.
@@ -90,8 +184,7 @@ class SpacyNLPEngine:
         Returns:
             Sentiment analysis results
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.analyze_sentiment, text)
+        return await self.run_async("sentiment", self.analyze_sentiment, text)
 
     def analyze_sentiment(self, text: str) -> Dict:
         """
@@ -113,58 +206,13 @@ class SpacyNLPEngine:
         try:
             doc = self.nlp(text.lower())
             
-            # Lexicon-based sentiment analysis
-            positive_words = {
-                'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
-                'positive', 'best', 'better', 'outstanding', 'superb', 'brilliant',
-                'impressive', 'exceptional', 'remarkable', 'successful', 'victory',
-                'win', 'progress', 'improvement', 'growth', 'benefit', 'advantage',
-                'strong', 'leading', 'breakthrough', 'innovation', 'achievement'
-            }
-            
-            negative_words = {
-                'bad', 'terrible', 'awful', 'horrible', 'negative', 'worst',
-                'worse', 'poor', 'disappointing', 'failure', 'failed', 'crisis',
-                'problem', 'issue', 'concern', 'threat', 'risk', 'danger',
-                'decline', 'decrease', 'loss', 'damage', 'harm', 'conflict',
-                'weak', 'falling', 'collapse', 'corruption', 'scandal', 'violation'
-            }
-            
             # Count sentiment words
-            pos_count = sum(1 for token in doc if token.text in positive_words)
-            neg_count = sum(1 for token in doc if token.text in negative_words)
+            pos_count = sum(1 for token in doc if token.text in POSITIVE_WORDS)
+            neg_count = sum(1 for token in doc if token.text in NEGATIVE_WORDS)
             total_words = len([t for t in doc if not t.is_stop and not t.is_punct])
             
-            if total_words == 0:
-                return {
-                    "sentiment": "neutral",
-                    "polarity": 0.0,
-                    "confidence": 0.5
-                }
-            
-            # Calculate polarity
-            pos_ratio = pos_count / total_words
-            neg_ratio = neg_count / total_words
-            
-            if pos_count > neg_count:
-                sentiment = "positive"
-                polarity = min(0.9, 0.5 + pos_ratio * 2)
-                confidence = min(0.95, 0.6 + (pos_count - neg_count) / total_words)
-            elif neg_count > pos_count:
-                sentiment = "negative"
-                polarity = max(-0.9, -0.5 - neg_ratio * 2)
-                confidence = min(0.95, 0.6 + (neg_count - pos_count) / total_words)
-            else:
-                sentiment = "neutral"
-                polarity = 0.0
-                confidence = 0.7 if pos_count == 0 else 0.5
-            
-            return {
-                "sentiment": sentiment,
-                "polarity": round(polarity, 2),
-                "confidence": round(confidence, 2)
-            }
-            
+            return _sentiment_from_counts(pos_count, neg_count, total_words)
+
         except Exception as e:
             logger.error(f"Sentiment analysis error: {e}")
             return {
@@ -175,8 +223,7 @@ class SpacyNLPEngine:
 
     async def extract_entities_async(self, text: str) -> List[Dict]:
         """Async entity extraction wrapper."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.extract_entities, text)
+        return await self.run_async("entities", self.extract_entities, text)
 
     def extract_entities(self, text: str) -> List[Dict]:
         """
@@ -214,8 +261,7 @@ class SpacyNLPEngine:
 
     async def extract_keywords_async(self, text: str, top_n: int = 10) -> List[Tuple[str, float]]:
         """Async keyword extraction wrapper."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.extract_keywords, text, top_n)
+        return await self.run_async("keywords", self.extract_keywords, text, top_n)
 
     def extract_keywords(self, text: str, top_n: int = 10) -> List[Tuple[str, float]]:
         """
@@ -264,8 +310,7 @@ class SpacyNLPEngine:
 
     async def summarize_async(self, text: str, ratio: float = 0.3) -> str:
         """Async text summarization wrapper."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.summarize, text, ratio)
+        return await self.run_async("summary", self.summarize, text, ratio)
 
     def summarize(self, text: str, ratio: float = 0.3) -> str:
         """
@@ -316,10 +361,14 @@ class SpacyNLPEngine:
             
             # Select top sentences
             num_sentences = max(1, int(len(sentences) * ratio))
-            top_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)[:num_sentences]
+            top_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)[
+                :num_sentences
+            ]
             
             # Sort by original order
-            summary_sentences = sorted([sent for sent, score in top_sentences], key=lambda x: x.start)
+            summary_sentences = sorted(
+                [sent for sent, score in top_sentences], key=lambda x: x.start
+            )
             
             return " ".join([sent.text.strip() for sent in summary_sentences])
             
@@ -333,8 +382,7 @@ class SpacyNLPEngine:
         
         Note: Advanced LDA removed for v1.0.0 simplicity
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.analyze_topics, texts, num_topics)
+        return await self.run_async("topics", self.analyze_topics, texts, num_topics)
 
     def analyze_topics(self, texts: List[str], num_topics: int = 5) -> List[List[str]]:
         """
@@ -376,13 +424,75 @@ class SpacyNLPEngine:
             logger.error(f"Topic extraction error: {e}")
             return []
 
+    def analyze_documents(
+        self, texts: List[str], batch_size: int = 32, top_n: int = 10
+    ) -> List[Dict]:
+        """
+        Sentiment, entities and keywords for many texts in one nlp.pipe pass.
+
+        Batching through nlp.pipe is much faster than calling the per-task
+        methods above, which each run the full pipeline on their own.
+
+        Args:
+            texts: Input documents
+            batch_size: nlp.pipe batch size
+            top_n: Keywords per document
+
+        Returns:
+            One {"sentiment", "entities", "keywords", "nlp_version"} dict per text
+        """
+        if not self._model_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        results = []
+        for doc in self.nlp.pipe(texts, batch_size=batch_size):
+            content_tokens = [t for t in doc if not t.is_stop and not t.is_punct]
+            pos_count = sum(1 for token in doc if token.lower_ in POSITIVE_WORDS)
+            neg_count = sum(1 for token in doc if token.lower_ in NEGATIVE_WORDS)
+
+            keyword_freq = Counter(
+                token.lemma_.lower()
+                for token in content_tokens
+                if token.pos_ in ("NOUN", "PROPN", "ADJ") and len(token.text) > 2
+            )
+            top_keywords = keyword_freq.most_common(top_n)
+            max_freq = top_keywords[0][1] if top_keywords else 1
+
+            results.append({
+                "sentiment": _sentiment_from_counts(pos_count, neg_count, len(content_tokens)),
+                "entities": [
+                    {
+                        "text": ent.text,
+                        "label": ent.label_,
+                        "start": ent.start_char,
+                        "end": ent.end_char,
+                        "description": spacy.explain(ent.label_)
+                    }
+                    for ent in doc.ents
+                ],
+                "keywords": [(kw, freq / max_freq) for kw, freq in top_keywords],
+                "nlp_version": self.version,
+            })
+
+        return results
+
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
         return self._model_loaded
 
+    @property
+    def version(self) -> str:
+        """nlp_version stamp for analysed articles (model, model version, lexicon)."""
+        if self.nlp is None:
+            model_version = "unloaded"
+        else:
+            model_version = self.nlp.meta.get("version", "unknown")
+        return f"{self.model_name}-{model_version}+lex.{LEXICON_VERSION}"
+
 
 # Global instance
 _nlp_engine: Optional[SpacyNLPEngine] = None
+_nlp_engine_lock = threading.Lock()
 
 
 def get_nlp_engine() -> SpacyNLPEngine:
@@ -395,7 +505,11 @@ def get_nlp_engine() -> SpacyNLPEngine:
     global _nlp_engine
     
     if _nlp_engine is None:
-        _nlp_engine = SpacyNLPEngine()
-        _nlp_engine.load_model()
+        # Executor threads may ask concurrently; load (and import spaCy) once
+        with _nlp_engine_lock:
+            if _nlp_engine is None:
+                engine = SpacyNLPEngine(settings.SPACY_MODEL)
+                engine.load_model()
+                _nlp_engine = engine
     
     return _nlp_engine
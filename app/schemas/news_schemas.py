@@ -26,6 +26,8 @@ class NewsArticleBase(BaseModel):
     entities: List[Dict] = Field(default_factory=list)
     topics: List[Dict] = Field(default_factory=list)
     url: HttpUrl
+    duplicate_of: Optional[int] = None  # Canonical article id for near-duplicates
+    nlp_version: Optional[str] = Field(None, max_length=64)  # Set when NLP fields are computed
 
 
 class NewsArticleCreate(NewsArticleBase):
@@ -5,14 +5,20 @@ Business logic for news article management
 Built by Elite Team - Backend Developers (PhD in Software Engineering)
 """
 
+import hashlib
+import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.metrics import record_cache
 from app.core.redis_client import redis_client
-from app.models.news_models import NewsArticle
+from app.ingestion.urls import canonicalize_url
+from app.models.news_models import ArticleUrl, NewsArticle, hash_url
 from app.schemas.news_schemas import NewsArticleCreate, NewsArticleUpdate
 
 logger = logging.getLogger(__name__)
@@ -24,17 +30,35 @@ class NewsService:
     @staticmethod
     async def create_article(db: AsyncSession, article_data: NewsArticleCreate) -> NewsArticle:
         """Create a new news article."""
-        # Check for duplicate URL
+        url = canonicalize_url(str(article_data.url))
+        url_hash = hash_url(url)
+
+        # Check for duplicate URL (dedup table spans all article partitions;
+        # keyed by canonical URL so tracking params/http variants match)
         existing = await db.execute(
-            select(NewsArticle).where(NewsArticle.url == str(article_data.url))
+            select(ArticleUrl.article_id).where(ArticleUrl.url_hash == url_hash)
         )
-        if existing.scalar_one_or_none():
+        if existing.scalar_one_or_none() is not None:
             raise ValueError("Article with this URL already exists")
 
-        # Create article
+        # Create article and register its URL in the same transaction
         article = NewsArticle(**article_data.model_dump())
         db.add(article)
-        await db.commit()
+        try:
+            await db.flush()
+            db.add(
+                ArticleUrl(
+                    url_hash=url_hash,
+                    url=url,
+                    article_id=article.id,
+                    published_date=article.published_date,
+                )
+            )
+            await db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent insert of the same URL
+            await db.rollback()
+            raise ValueError("Article with this URL already exists")
         await db.refresh(article)
 
         # Cache the article
@@ -52,17 +76,84 @@ class NewsService:
             "entities": article.entities,
             "topics": article.topics,
             "url": article.url,
+            "duplicate_of": article.duplicate_of,
+            "nlp_version": article.nlp_version,
         }
         await redis_client.set_json(f"article:{article.id}", article_dict)
 
         logger.info(f"Created news article: {article.id}")
         return article
 
+    @staticmethod
+    async def create_articles_bulk(
+        db: AsyncSession, articles_data: List[NewsArticleCreate]
+    ) -> List[Optional[NewsArticle]]:
+        """
+        Insert many articles in one transaction (used by the ingestion pipeline).
+
+        Known URLs are filtered with a single lookup instead of one SELECT per
+        article. If a concurrent writer wins a URL race the batch falls back
+        to create_article() per item.
+
+        Returns:
+            One entry per input: the created article, or None for duplicates
+        """
+        urls = [canonicalize_url(str(data.url)) for data in articles_data]
+        hashes = [hash_url(url) for url in urls]
+
+        existing = await db.execute(
+            select(ArticleUrl.url_hash).where(ArticleUrl.url_hash.in_(set(hashes)))
+        )
+        taken = set(existing.scalars().all())
+
+        created: List[Optional[NewsArticle]] = []
+        for data, url_hash in zip(articles_data, hashes):
+            if url_hash in taken:
+                created.append(None)
+                continue
+            taken.add(url_hash)
+            created.append(NewsArticle(**data.model_dump()))
+
+        new_articles = [article for article in created if article is not None]
+        if not new_articles:
+            return created
+
+        db.add_all(new_articles)
+        try:
+            await db.flush()
+            db.add_all(
+                [
+                    ArticleUrl(
+                        url_hash=url_hash,
+                        url=url,
+                        article_id=article.id,
+                        published_date=article.published_date,
+                    )
+                    for article, url, url_hash in zip(created, urls, hashes)
+                    if article is not None
+                ]
+            )
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            logger.warning("Bulk insert hit a duplicate URL, retrying articles one by one")
+            fallback: List[Optional[NewsArticle]] = []
+            for data in articles_data:
+                try:
+                    fallback.append(await NewsService.create_article(db, data))
+                except ValueError:
+                    fallback.append(None)
+            return fallback
+
+        logger.info(f"Created {len(new_articles)} news articles")
+        return created
+
     @staticmethod
     async def get_article_by_id(db: AsyncSession, article_id: int) -> Optional[NewsArticle]:
         """Get article by ID."""
         # Try cache first
         cached = await redis_client.get_json(f"article:{article_id}")
+        record_cache("article", cached is not None)
         if cached:
             return NewsArticle(**cached)
 
@@ -88,6 +179,8 @@ class NewsService:
                     "entities": article.entities,
                     "topics": article.topics,
                     "url": article.url,
+                    "duplicate_of": article.duplicate_of,
+                    "nlp_version": article.nlp_version,
                     "created_at": article.created_at.isoformat(),
                     "updated_at": article.updated_at.isoformat(),
                 },
@@ -157,19 +250,26 @@ class NewsService:
         db: AsyncSession, article_id: int, update_data: NewsArticleUpdate
     ) -> Optional[NewsArticle]:
         """Update an existing article."""
-        result = await db.execute(select(NewsArticle).where(NewsArticle.id == article_id))
+        update_dict = update_data.model_dump(exclude_unset=True)
+        if update_dict:
+            # One round trip instead of SELECT, UPDATE and a refresh for updated_at
+            statement = (
+                update(NewsArticle)
+                .where(NewsArticle.id == article_id)
+                .values(**update_dict)
+                .returning(NewsArticle)
+                .execution_options(populate_existing=True, synchronize_session=False)
+            )
+        else:
+            statement = select(NewsArticle).where(NewsArticle.id == article_id)
+        result = await db.execute(statement)
         article = result.scalar_one_or_none()
 
         if not article:
             return None
 
-        # Update fields
-        update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(article, field, value)
-
-        await db.commit()
-        await db.refresh(article)
+        if update_dict:
+            await db.commit()
 
         # Update cache
         await redis_client.delete(f"article:{article_id}")
@@ -187,6 +287,7 @@ class NewsService:
             return False
 
         await db.delete(article)
+        await db.execute(delete(ArticleUrl).where(ArticleUrl.article_id == article_id))
         await db.commit()
 
         # Remove from cache
@@ -197,44 +298,62 @@ class NewsService:
 
     @staticmethod
     async def search_articles(
-        db: AsyncSession, query: str, skip: int = 0, limit: int = 50
+        db: AsyncSession,
+        query: str,
+        skip: int = 0,
+        limit: int = 50,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
     ) -> List[NewsArticle]:
         """
         Search articles using database-specific full-text search.
 
         Uses PostgreSQL full-text search in production, SQLite LIKE fallback in tests.
+        Optional date bounds let PostgreSQL prune monthly partitions.
         """
+        from datetime import datetime
+
         from sqlalchemy import text
 
         # Detect database dialect
         dialect_name = db.bind.dialect.name
 
+        params = {"skip": skip, "limit": limit}
+        date_filter = ""
+        if start_date:
+            date_filter += " AND published_date >= :start_date"
+            params["start_date"] = datetime.fromisoformat(start_date)
+        if end_date:
+            date_filter += " AND published_date <= :end_date"
+            params["end_date"] = datetime.fromisoformat(end_date)
+
         if dialect_name == 'sqlite':
             # SQLite fallback using LIKE operator
             sql = text(
-                """
+                f"""
                 SELECT * FROM news_articles
-                WHERE title LIKE :query OR content LIKE :query
+                WHERE (title LIKE :query OR content LIKE :query){date_filter}
                 ORDER BY published_date DESC
                 LIMIT :limit
                 OFFSET :skip
             """
             )
             # Wrap query with % for LIKE operator
-            query_param = f"%{query}%"
-            result = await db.execute(sql, {"query": query_param, "skip": skip, "limit": limit})
+            params["query"] = f"%{query}%"
+            result = await db.execute(sql, params)
         else:
             # PostgreSQL full-text search with ranking
             sql = text(
-                """
+                f"""
                 SELECT * FROM news_articles
-                WHERE search_vector @@ plainto_tsquery('english', :query)
+                WHERE search_vector @@ plainto_tsquery('english', :query){date_filter}
                 ORDER BY ts_rank(search_vector, plainto_tsquery('english', :query)) DESC
                 OFFSET :skip
                 LIMIT :limit
             """
             )
-            result = await db.execute(sql, {"query": query, "skip": skip, "limit": limit})
+            params["query"] = query
+            result = await db.execute(sql, params)
 
         rows = result.fetchall()
 
@@ -282,17 +401,79 @@ class NewsService:
 
         Combines full-text search with filtering capabilities.
         """
+        from sqlalchemy import and_, text
+
+        conditions = NewsService._build_search_conditions(
+            dialect_name=db.bind.dialect.name,
+            query=query,
+            category=category,
+            source=source,
+            language=language,
+            tags=tags,
+            sentiment_min=sentiment_min,
+            sentiment_max=sentiment_max,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        # Build query
+        search_query = select(NewsArticle)
+        if conditions:
+            search_query = search_query.where(and_(*conditions))
+
+        # Order by relevance if full-text search, otherwise by date
+        if query and db.bind.dialect.name != "sqlite":
+            search_query = search_query.order_by(
+                text("ts_rank(search_vector, plainto_tsquery('english', :query)) DESC").bindparams(
+                    query=query
+                )
+            )
+        else:
+            search_query = search_query.order_by(NewsArticle.published_date.desc())
+
+        # Pagination
+        search_query = search_query.offset(skip).limit(limit)
+
+        result = await db.execute(search_query)
+        return result.scalars().all()
+
+    @staticmethod
+    def _build_search_conditions(
+        dialect_name: str,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        sentiment_min: Optional[float] = None,
+        sentiment_max: Optional[float] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> list:
+        """
+        Build WHERE conditions shared by advanced search and facet counts.
+
+        Uses PostgreSQL full-text search in production, SQLite LIKE fallback in tests.
+        """
         from datetime import datetime
 
-        from sqlalchemy import and_, text
+        from sqlalchemy import or_, text
 
         conditions = []
 
         # Full-text search
         if query:
-            conditions.append(
-                text("search_vector @@ plainto_tsquery('english', :query)").bindparams(query=query)
-            )
+            if dialect_name == "sqlite":
+                pattern = f"%{query}%"
+                conditions.append(
+                    or_(NewsArticle.title.like(pattern), NewsArticle.content.like(pattern))
+                )
+            else:
+                conditions.append(
+                    text("search_vector @@ plainto_tsquery('english', :query)").bindparams(
+                        query=query
+                    )
+                )
 
         # Category filter
         if category:
@@ -323,23 +504,192 @@ class NewsService:
         if end_date:
             conditions.append(NewsArticle.published_date <= datetime.fromisoformat(end_date))
 
-        # Build query
-        search_query = select(NewsArticle)
-        if conditions:
-            search_query = search_query.where(and_(*conditions))
+        return conditions
 
-        # Order by relevance if full-text search, otherwise by date
-        if query:
-            search_query = search_query.order_by(
-                text("ts_rank(search_vector, plainto_tsquery('english', :query)) DESC").bindparams(
-                    query=query
+    @staticmethod
+    def parse_facets(facets: Optional[str]) -> List[str]:
+        """
+        Parse a comma-separated facet list.
+
+        Raises ValueError for unknown facet names.
+        """
+        if not facets:
+            return []
+
+        names = []
+        for name in (part.strip() for part in facets.split(",")):
+            if not name or name in names:
+                continue
+            if name not in SEARCH_FACETS:
+                raise ValueError(
+                    f"Unknown facet '{name}'. Supported facets: {', '.join(SEARCH_FACETS)}"
                 )
-            )
+            names.append(name)
+        return names
+
+    @staticmethod
+    async def get_search_facets(
+        db: AsyncSession,
+        facets: List[str],
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        sentiment_min: Optional[float] = None,
+        sentiment_max: Optional[float] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Count matching articles per facet value in a single query.
+
+        PostgreSQL computes every facet with one GROUPING SETS aggregation over
+        the filtered set; SQLite (tests) falls back to a UNION ALL of GROUP BYs,
+        which is still a single round trip. Results are cached in Redis per
+        query fingerprint.
+
+        Returns:
+            Dict mapping facet name to a list of {"value", "count"} buckets
+        """
+        if not facets:
+            return {}
+
+        filters = {
+            "query": query,
+            "category": category,
+            "source": source,
+            "language": language,
+            "tags": tags,
+            "sentiment_min": sentiment_min,
+            "sentiment_max": sentiment_max,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        fingerprint = hashlib.sha256(
+            json.dumps({"facets": sorted(facets), **filters}, sort_keys=True).encode()
+        ).hexdigest()
+        cache_key = f"facets:{fingerprint}"
+
+        cached = await redis_client.get_json(cache_key)
+        record_cache("search_facets", cached is not None)
+        if cached:
+            return cached
+
+        dialect_name = db.bind.dialect.name
+        conditions = NewsService._build_search_conditions(dialect_name=dialect_name, **filters)
+
+        if dialect_name == "sqlite":
+            rows = await NewsService._facet_rows_union(db, facets, conditions)
         else:
-            search_query = search_query.order_by(NewsArticle.published_date.desc())
+            rows = await NewsService._facet_rows_grouping_sets(db, facets, conditions)
 
-        # Pagination
-        search_query = search_query.offset(skip).limit(limit)
+        result: Dict[str, List[Dict]] = {name: [] for name in facets}
+        for name, value, count in rows:
+            if value is not None and not isinstance(value, str):
+                value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+            result[name].append({"value": value, "count": int(count)})
 
-        result = await db.execute(search_query)
-        return result.scalars().all()
+        for name, buckets in result.items():
+            if name == "day":
+                buckets.sort(key=lambda b: b["value"] or "", reverse=True)
+            else:
+                buckets.sort(key=lambda b: b["count"], reverse=True)
+            del buckets[FACET_BUCKET_LIMIT:]
+
+        await redis_client.set_json(cache_key, result, ttl=settings.SEARCH_FACETS_CACHE_TTL)
+        return result
+
+    @staticmethod
+    async def _facet_rows_grouping_sets(
+        db: AsyncSession, facets: List[str], conditions: list
+    ) -> List[Tuple]:
+        """Run one GROUPING SETS query and return (facet, value, count) rows."""
+        from sqlalchemy import and_, func, tuple_
+
+        expressions = {name: SEARCH_FACETS[name]() for name in facets}
+
+        columns = []
+        for name, expression in expressions.items():
+            columns.append(expression.label(name))
+            columns.append(func.grouping(expression).label(f"{name}_grouping"))
+
+        stmt = select(*columns, func.count().label("count")).group_by(
+            func.grouping_sets(*[tuple_(expression) for expression in expressions.values()])
+        )
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        result = await db.execute(stmt)
+
+        rows = []
+        for row in result.mappings():
+            # Exactly one facet is grouped per row; GROUPING() is 0 for that one
+            for name in facets:
+                if row[f"{name}_grouping"] == 0:
+                    rows.append((name, row[name], row["count"]))
+                    break
+        return rows
+
+    @staticmethod
+    async def _facet_rows_union(
+        db: AsyncSession, facets: List[str], conditions: list
+    ) -> List[Tuple]:
+        """Run one UNION ALL of per-facet GROUP BYs (no GROUPING SETS in SQLite)."""
+        from sqlalchemy import and_, func, literal, union_all
+
+        selects = []
+        for name in facets:
+            expression = SEARCH_FACETS[name]()
+            stmt = select(
+                literal(name).label("facet"),
+                expression.label("value"),
+                func.count().label("count"),
+            ).group_by(expression)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
+            selects.append(stmt)
+
+        result = await db.execute(union_all(*selects))
+        return [tuple(row) for row in result.fetchall()]
+
+
+def _sentiment_bucket_expression():
+    """Map sentiment_score onto negative/neutral/positive buckets."""
+    from sqlalchemy import case, literal_column
+
+    # Inline constants so the SELECT and GROUP BY expressions compare equal in PostgreSQL
+    return case(
+        (
+            NewsArticle.sentiment_score <= literal_column(str(-SENTIMENT_BUCKET_THRESHOLD)),
+            literal_column("'negative'"),
+        ),
+        (
+            NewsArticle.sentiment_score >= literal_column(str(SENTIMENT_BUCKET_THRESHOLD)),
+            literal_column("'positive'"),
+        ),
+        else_=literal_column("'neutral'"),
+    )
+
+
+def _day_expression():
+    """Truncate published_date to a calendar day."""
+    from sqlalchemy import func
+
+    return func.date(NewsArticle.published_date)
+
+
+# Facet name -> factory for the grouped SQL expression
+SEARCH_FACETS = {
+    "category": lambda: NewsArticle.category,
+    "source": lambda: NewsArticle.source,
+    "language": lambda: NewsArticle.language,
+    "sentiment_bucket": _sentiment_bucket_expression,
+    "day": _day_expression,
+}
+
+# Sentiment scores within +/- this value count as neutral
+SENTIMENT_BUCKET_THRESHOLD = 0.1
+
+# Maximum number of buckets returned per facet
+FACET_BUCKET_LIMIT = 50
@@ -0,0 +1,107 @@
+"""
+ARAS Trend Service
+Keyword trend detection over recent articles
+
+Built by Elite Team - Data Scientist (PhD in Data Science)
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.news_models import NewsArticle, Trend
+
+logger = logging.getLogger(__name__)
+
+# Marks trends maintained by recompute_trends (manual trends are left alone)
+DETECTED_DESCRIPTION = "Detected from keyword frequency"
+
+
+def impact_level(count: int) -> str:
+    if count >= 20:
+        return "high"
+    if count >= 8:
+        return "medium"
+    return "low"
+
+
+class TrendService:
+    """Service for automatic trend detection."""
+
+    @staticmethod
+    async def recompute_trends(
+        db: AsyncSession, window_hours: Optional[int] = None, now: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Compare keyword counts of the last window with the window before.
+
+        Keywords (from article topics) mentioned by at least TREND_MIN_ARTICLES
+        canonical articles and growing by TREND_MIN_GROWTH become active
+        trends; detected trends whose keyword stopped rising are ended.
+
+        Returns:
+            Dict with counts of created, updated and ended trends
+        """
+        window = timedelta(hours=window_hours or settings.TREND_WINDOW_HOURS)
+        now = now or datetime.utcnow()
+        window_start = now - window
+
+        result = await db.execute(
+            select(NewsArticle.published_date, NewsArticle.topics).where(
+                NewsArticle.published_date >= now - 2 * window,
+                NewsArticle.published_date < now,
+                NewsArticle.duplicate_of.is_(None),
+            )
+        )
+        recent, previous = Counter(), Counter()
+        for published_date, topics in result.all():
+            keywords = {topic["keyword"] for topic in topics or [] if topic.get("keyword")}
+            (recent if published_date >= window_start else previous).update(keywords)
+
+        rising = {}
+        for keyword, count in recent.items():
+            growth = (count + 1) / (previous[keyword] + 1)
+            if count >= settings.TREND_MIN_ARTICLES and growth >= settings.TREND_MIN_GROWTH:
+                rising[keyword] = (count, round(1 - 1 / growth, 3))
+
+        active = await db.execute(
+            select(Trend).where(Trend.end_date.is_(None), Trend.description == DETECTED_DESCRIPTION)
+        )
+        stats = {"created": 0, "updated": 0, "ended": 0}
+        for trend in active.scalars().all():
+            if trend.name not in rising:
+                trend.end_date = now
+                stats["ended"] += 1
+                continue
+            count, confidence = rising.pop(trend.name)
+            if confidence > trend.confidence_score:
+                trend.peak_date = now
+            trend.confidence_score = confidence
+            trend.impact_level = impact_level(count)
+            stats["updated"] += 1
+
+        for keyword, (count, confidence) in rising.items():
+            db.add(
+                Trend(
+                    name=keyword,
+                    description=DETECTED_DESCRIPTION,
+                    start_date=now,
+                    peak_date=now,
+                    confidence_score=confidence,
+                    impact_level=impact_level(count),
+                    keywords=[keyword],
+                )
+            )
+            stats["created"] += 1
+
+        await db.commit()
+        logger.info(
+            f"Recomputed trends: {stats['created']} created, {stats['updated']} updated, "
+            f"{stats['ended']} ended"
+        )
+        return stats
@@ -0,0 +1,3 @@
+"""Background tasks package for ARAS microservice."""
+
+__all__ = []
@@ -0,0 +1,66 @@
+"""
+ARAS Background Task Handlers
+Enrichment, graph and trend jobs run by the task worker
+
+Each handler receives a database session and the payloads of every pending
+job of its kind claimed in one batch, so e.g. fifty "enrich_article" jobs
+become a single nlp.pipe() pass. Handlers must be idempotent: delivery is
+at-least-once.
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.task_queue import task_queue
+from app.services.graph_service import GraphService
+from app.services.nlp_service import NLPService
+from app.services.trend_service import TrendService
+
+ENRICH_ARTICLE = "enrich_article"
+REBUILD_GRAPH = "rebuild_graph"
+RECOMPUTE_TRENDS = "recompute_trends"
+
+TaskHandler = Callable[[AsyncSession, List[Dict]], Awaitable[None]]
+
+
+def _article_ids(payloads: List[Dict]) -> List[int]:
+    ids = set()
+    for payload in payloads:
+        if "article_id" in payload:
+            ids.add(payload["article_id"])
+        ids.update(payload.get("article_ids", []))
+    return sorted(ids)
+
+
+async def enrich_articles(db: AsyncSession, payloads: List[Dict]) -> None:
+    """NLP-enrich articles, then refresh their graph and the trends."""
+    article_ids = _article_ids(payloads)
+    enriched = await NLPService.enrich_articles(db, article_ids)
+    if enriched is None:
+        # Fail the task so the queue retries it, then dead-letters it after TASK_MAX_ATTEMPTS
+        raise RuntimeError(f"NLP model unavailable, {len(article_ids)} articles not enriched")
+    if enriched:
+        await task_queue.enqueue(REBUILD_GRAPH, {"article_ids": article_ids})
+        await task_queue.enqueue(RECOMPUTE_TRENDS, {}, dedup_key="all")
+
+
+async def rebuild_graph(db: AsyncSession, payloads: List[Dict]) -> None:
+    """Rebuild article/entity graph edges."""
+    await GraphService.rebuild_article_graph(db, _article_ids(payloads))
+
+
+async def recompute_trends(db: AsyncSession, payloads: List[Dict]) -> None:
+    """Recompute keyword trends (coalesced: one run per batch)."""
+    windows = {payload.get("window_hours") for payload in payloads}
+    for window_hours in windows:
+        await TrendService.recompute_trends(db, window_hours)
+
+
+TASK_HANDLERS: Dict[str, TaskHandler] = {
+    ENRICH_ARTICLE: enrich_articles,
+    REBUILD_GRAPH: rebuild_graph,
+    RECOMPUTE_TRENDS: recompute_trends,
+}
@@ -0,0 +1,130 @@
+"""
+ARAS Background Task Worker
+Consumes the task stream and runs handlers in batches
+
+Run one or more workers next to the API:
+    python -m app.tasks.worker
+
+Built by Elite Team - DevOps Engineer (PhD in Distributed Systems)
+"""
+
+import asyncio
+import logging
+import signal
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.task_queue import Task, TaskQueue, task_queue
+from app.tasks.handlers import TASK_HANDLERS, TaskHandler
+
+logger = logging.getLogger(__name__)
+
+
+class TaskWorker:
+    """
+    Claims batches of tasks and runs one handler call per task name.
+
+    A failing batch is retried task by task, so one bad job does not hold
+    back the rest of its batch.
+    """
+
+    def __init__(
+        self,
+        queue: Optional[TaskQueue] = None,
+        handlers: Optional[Dict[str, TaskHandler]] = None,
+        session_factory: Optional[Callable] = None,
+        batch_size: Optional[int] = None,
+        block_ms: Optional[int] = None,
+    ):
+        """
+        Initialize worker.
+
+        Args:
+            queue: Task queue (defaults to the global one)
+            handlers: Task name to handler mapping
+            session_factory: Async session factory for handlers
+            batch_size: Maximum tasks claimed per round
+            block_ms: How long a claim waits for new tasks
+        """
+        if session_factory is None:
+            from app.core.database import async_session_maker
+
+            session_factory = async_session_maker
+        self.queue = queue or task_queue
+        self.handlers = handlers or TASK_HANDLERS
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.TASK_BATCH_SIZE
+        self.block_ms = settings.TASK_BLOCK_MS if block_ms is None else block_ms
+
+    async def run_once(self) -> int:
+        """Claim and process one batch; returns the number of tasks claimed."""
+        tasks = await self.queue.claim(self.batch_size, self.block_ms)
+
+        groups: Dict[str, List[Task]] = defaultdict(list)
+        for task in tasks:
+            groups[task.name].append(task)
+
+        for name, group in groups.items():
+            handler = self.handlers.get(name)
+            if handler is None:
+                for task in group:
+                    await self.queue.dead_letter(task, f"no handler for task {name}")
+                continue
+            if not await self._run(handler, group) and len(group) > 1:
+                for task in group:
+                    await self._run(handler, [task])
+        return len(tasks)
+
+    async def _run(self, handler: TaskHandler, tasks: List[Task]) -> bool:
+        """Run handler over tasks; ack on success, retry single tasks on failure."""
+        try:
+            async with self.session_factory() as session:
+                await handler(session, [task.payload for task in tasks])
+        except Exception as e:
+            logger.error(f"Task {tasks[0].name} failed for a batch of {len(tasks)}: {e}")
+            if len(tasks) == 1:
+                await self.queue.retry(tasks[0], str(e))
+            return False
+
+        for task in tasks:
+            await self.queue.ack(task)
+        return True
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Process tasks until stop is set."""
+        stop = stop or asyncio.Event()
+        logger.info(f"Task worker {self.queue.consumer} started")
+        while not stop.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Task worker error: {e}")
+                await asyncio.sleep(1)
+        logger.info(f"Task worker {self.queue.consumer} stopped")
+
+
+async def main():
+    """Run a worker until SIGINT/SIGTERM."""
+    from app.core.database import dispose_engines
+    from app.core.redis_client import redis_client
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    await redis_client.connect()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await TaskWorker().run(stop)
+    finally:
+        await redis_client.disconnect()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""
+NLP Re-enrichment Backfill
+Re-analyses articles whose nlp_version differs from the loaded model
+
+Run after upgrading SPACY_MODEL or the sentiment lexicon. Safe to stop
+(Ctrl+C) and re-run; progress is checkpointed per target version:
+    python scripts/backfill_nlp.py [--chunk-size 200] [--max-duty 0.5] [--reset]
+
+Built by Elite Team - Data Scientist (PhD in NLP)
+"""
+
+import argparse
+import asyncio
+import signal
+
+from app.core.database import async_session_maker, dispose_engines
+from app.core.redis_client import redis_client
+from app.nlp.backfill import NLPBackfill
+
+
+async def main(chunk_size: int, max_duty: float, reset: bool):
+    """Main entry point."""
+    await redis_client.connect()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        backfill = NLPBackfill(async_session_maker, chunk_size=chunk_size, max_duty=max_duty)
+        if reset:
+            await backfill.reset()
+        stats = await backfill.run(stop)
+    finally:
+        await redis_client.disconnect()
+        await dispose_engines()
+
+    state = "✓ Finished" if stats["finished"] else "⏸ Stopped"
+    print(
+        f"{state}: {stats['processed']} articles re-enriched to {backfill.version} "
+        f"(last id {stats['last_id']})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Re-enrich articles analysed by an older NLP version"
+    )
+    parser.add_argument("--chunk-size", type=int, default=None, help="Articles per round")
+    parser.add_argument(
+        "--max-duty", type=float, default=None, help="Fraction of time spent working (0-1]"
+    )
+    parser.add_argument("--reset", action="store_true", help="Ignore the saved checkpoint")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.chunk_size, args.max_duty, args.reset))
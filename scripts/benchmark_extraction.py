@@ -0,0 +1,131 @@
+"""
+Content Extraction Benchmark
+Compares the lxml extraction engine with the previous BeautifulSoup approach
+
+Runs both extractors over a directory of saved article pages and reports
+median time per page and how much text each one returned. The legacy
+extractor is the selector cascade NewsSpider.parse_article used: a
+BeautifulSoup tree, seven soup.select() calls, then every <p> on the page.
+
+Build a corpus from the live feeds first (pages are saved as-is):
+    python scripts/benchmark_extraction.py --save 100
+Then benchmark:
+    python scripts/benchmark_extraction.py [--corpus tests/fixtures/html] [--runs 20]
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from bs4 import BeautifulSoup
+
+from app.ingestion.crawler import parse_feed
+from app.ingestion.extractor import ContentExtractor
+from app.ingestion.fetcher import AsyncFetcher
+from app.ingestion.sources import iter_feeds, load_news_sources
+from app.core.config import settings
+
+LEGACY_SELECTORS = [
+    "article .content",
+    "article .article-content",
+    "article .body",
+    ".article-body",
+    ".story-body",
+    "div.content p",
+    "article p",
+]
+
+
+def legacy_extract(html: str) -> Dict[str, str]:
+    """Previous extraction: BeautifulSoup + selector cascade + all-<p> fallback."""
+    soup = BeautifulSoup(html, "lxml")
+    title = soup.h1.get_text(strip=True) if soup.h1 else (soup.title.string if soup.title else "")
+    for selector in LEGACY_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            content = "\n\n".join(el.get_text(strip=True) for el in elements)
+            if len(content) > 100:
+                return {"title": title or "", "content": content}
+    content = "\n\n".join(p.get_text(strip=True) for p in soup.find_all("p"))
+    return {"title": title or "", "content": content}
+
+
+def time_extractor(extract: Callable, pages: List[str], runs: int) -> Dict:
+    """Median seconds per full pass over the corpus, plus extracted text size."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = [extract(html) for html in pages]
+        timings.append(time.perf_counter() - start)
+    return {
+        "ms_per_page": statistics.median(timings) / len(pages) * 1000,
+        "chars": sum(len(result["content"]) for result in results),
+        "empty": sum(1 for result in results if not result["content"]),
+    }
+
+
+async def save_corpus(corpus: Path, limit: int) -> None:
+    """Download up to limit article pages linked from the configured feeds."""
+    corpus.mkdir(parents=True, exist_ok=True)
+    feeds = iter_feeds(load_news_sources(settings.NEWS_SOURCES_CONFIG))
+
+    async with AsyncFetcher() as fetcher:
+        feed_results = await fetcher.fetch_many(feed_url for _, feed_url in feeds)
+        urls = []
+        for result in feed_results:
+            if result.ok:
+                urls.extend(entry["url"] for entry in parse_feed(result.text))
+
+        pages = await fetcher.fetch_many(urls[:limit])
+
+    saved = 0
+    for page in pages:
+        if page.ok and page.text:
+            name = hashlib.sha256(page.url.encode()).hexdigest()[:16]
+            (corpus / f"{name}.html").write_text(page.text, encoding="utf-8")
+            saved += 1
+    print(f"✅ Saved {saved} pages to {corpus}")
+
+
+def main(corpus: Path, runs: int) -> None:
+    """Main entry point."""
+    pages = [
+        path.read_text(encoding="utf-8", errors="replace") for path in sorted(corpus.glob("*.html"))
+    ]
+    if not pages:
+        print(f"❌ No .html files in {corpus} (use --save to build a corpus)")
+        return
+
+    engine = ContentExtractor()
+    legacy = time_extractor(legacy_extract, pages, runs)
+    current = time_extractor(engine.extract, pages, runs)
+
+    print(f"\n📊 Extraction benchmark: {len(pages)} pages, median of {runs} runs\n")
+    for name, stats in (("BeautifulSoup (legacy)", legacy), ("lxml engine", current)):
+        print(
+            f"▶ {name:24s} {stats['ms_per_page']:8.3f} ms/page  "
+            f"{stats['chars']:>9,} chars  {stats['empty']} empty"
+        )
+    print(f"\n   speedup: {legacy['ms_per_page'] / current['ms_per_page']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark article content extraction")
+    parser.add_argument(
+        "--corpus", type=Path, default=Path("tests/fixtures/html"), help="Directory of saved pages"
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Passes over the corpus")
+    parser.add_argument(
+        "--save", type=int, default=0, help="Download this many pages into --corpus first"
+    )
+    args = parser.parse_args()
+
+    if args.save:
+        asyncio.run(save_corpus(args.corpus, args.save))
+    main(args.corpus, args.runs)
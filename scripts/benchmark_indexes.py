@@ -0,0 +1,151 @@
+"""
+Query Plan Benchmark for Article/Trend Indexes
+Compares PostgreSQL plans with and without the query-pattern indexes
+
+Runs EXPLAIN (ANALYZE, BUFFERS) for the filter + sort queries issued by
+get_articles, date range scans and get_active_trends. The "before" pass
+drops the indexes from alembic revision 8d3f6a0b7c12 (and restores the
+single-column ones) inside a transaction that is always rolled back, so
+the schema is never changed. DROP INDEX takes an exclusive lock: run this
+against a development or staging database, e.g. after scripts/seed_data.py.
+
+Usage:
+    python scripts/benchmark_indexes.py [--runs 5]
+
+Built by Elite Team - Database Engineer (PhD in Database Systems)
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.config import settings
+
+NEW_INDEXES = [
+    "ix_news_articles_category_published_date",
+    "ix_news_articles_source_published_date",
+    "ix_news_articles_language_published_date",
+    "ix_news_articles_published_date_brin",
+    "ix_trends_active_confidence_score",
+]
+
+PRE_MIGRATION_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_news_articles_category ON news_articles (category)",
+    "CREATE INDEX IF NOT EXISTS ix_news_articles_source ON news_articles (source)",
+]
+
+QUERIES = {
+    "articles by category": (
+        "SELECT * FROM news_articles WHERE category = :category "
+        "ORDER BY published_date DESC LIMIT 100"
+    ),
+    "articles by source": (
+        "SELECT * FROM news_articles WHERE source = :source "
+        "ORDER BY published_date DESC LIMIT 100"
+    ),
+    "articles by language": (
+        "SELECT * FROM news_articles WHERE language = :language "
+        "ORDER BY published_date DESC LIMIT 100"
+    ),
+    "articles in date range": (
+        "SELECT count(*) FROM news_articles "
+        "WHERE published_date >= :start_date AND published_date <= :end_date"
+    ),
+    "active trends": ("SELECT * FROM trends WHERE end_date IS NULL ORDER BY confidence_score DESC"),
+}
+
+
+def summarize_plan(node: Dict) -> List[str]:
+    """Flatten a JSON plan into 'Node Type (index)' steps."""
+    label = node["Node Type"]
+    if "Index Name" in node:
+        label += f" ({node['Index Name']})"
+    steps = [label]
+    for child in node.get("Plans", []):
+        steps.extend(summarize_plan(child))
+    return steps
+
+
+async def sample_params(conn: AsyncConnection) -> Dict:
+    """Pick the most common filter values so every query has matching rows."""
+    params = {}
+    for column in ("category", "source", "language"):
+        result = await conn.execute(
+            text(
+                f"SELECT {column} FROM news_articles WHERE {column} IS NOT NULL "
+                f"GROUP BY {column} ORDER BY count(*) DESC LIMIT 1"
+            )
+        )
+        params[column] = result.scalar() or ""
+
+    params["end_date"] = datetime.utcnow()
+    params["start_date"] = params["end_date"] - timedelta(days=30)
+    return params
+
+
+async def explain_all(conn: AsyncConnection, params: Dict, runs: int) -> Dict[str, Dict]:
+    """Run EXPLAIN ANALYZE for every query and keep the median execution time."""
+    results = {}
+    for name, sql in QUERIES.items():
+        timings = []
+        plan = None
+        for _ in range(runs):
+            result = await conn.execute(
+                text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params
+            )
+            raw = result.scalar()
+            explained = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+            timings.append(explained["Execution Time"])
+            plan = explained["Plan"]
+        results[name] = {
+            "plan": " -> ".join(summarize_plan(plan)),
+            "ms": statistics.median(timings),
+        }
+    return results
+
+
+async def main(runs: int):
+    """Main entry point."""
+    engine = create_async_engine(settings.DATABASE_URL)
+
+    async with engine.connect() as conn:
+        params = await sample_params(conn)
+        await conn.execute(text("ANALYZE news_articles"))
+        await conn.execute(text("ANALYZE trends"))
+        await conn.commit()
+
+        # "After": indexes from revision 8d3f6a0b7c12 in place
+        after = await explain_all(conn, params, runs)
+        await conn.rollback()
+
+        # "Before": emulate the pre-migration schema, then roll back
+        trans = await conn.begin()
+        for index_name in NEW_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        for statement in PRE_MIGRATION_INDEXES:
+            await conn.execute(text(statement))
+        before = await explain_all(conn, params, runs)
+        await trans.rollback()
+
+    await engine.dispose()
+
+    print(f"\n📊 Index benchmark (median of {runs} runs)\n")
+    for name in QUERIES:
+        speedup = before[name]["ms"] / after[name]["ms"] if after[name]["ms"] else float("inf")
+        print(f"▶ {name}")
+        print(f"   before: {before[name]['ms']:9.3f} ms  {before[name]['plan']}")
+        print(f"   after:  {after[name]['ms']:9.3f} ms  {after[name]['plan']}")
+        print(f"   speedup: {speedup:.1f}x\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare query plans with/without indexes")
+    parser.add_argument("--runs", type=int, default=5, help="EXPLAIN ANALYZE runs per query")
+    args = parser.parse_args()
+    asyncio.run(main(args.runs))
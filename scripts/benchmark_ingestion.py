@@ -0,0 +1,424 @@
+"""
+Ingestion Throughput Benchmark
+Replays recorded feeds and article pages from a local fixture server
+
+Starts a uvicorn fixture server in a child process that serves RSS feeds
+and article pages for --sources synthetic news sites, then runs the full
+streaming ingestion pipeline (poll → fetch → extract → dedup → NLP →
+store) against it and reports articles/sec, per-stage p50/p99 latency and
+peak RSS of the ingesting process. Nothing leaves the machine: every
+request goes to 127.0.0.1 with the original Host header, Redis is not
+used (in-process fallbacks) and articles go to a throwaway SQLite file
+unless --database-url is given.
+
+Article pages are built from recorded pages (tests/fixtures/html, or a
+corpus saved with `scripts/benchmark_extraction.py --save N`): the markup
+and boilerplate are kept and paragraph text is replaced with seeded
+random words from the corpus, so every article is unique and runs are
+reproducible.
+
+Usage:
+    python scripts/benchmark_ingestion.py [--sources 20] [--entries 50]
+        [--latency-ms 40] [--jitter-ms 20] [--error-rate 0.02] [--no-nlp]
+    # Save a baseline, then fail (exit 1) on regressions before deploying:
+    python scripts/benchmark_ingestion.py --save-results baseline.json
+    python scripts/benchmark_ingestion.py --baseline baseline.json --tolerance 0.15
+
+Built by Elite Team - Backend Engineer (FastAPI Expert)
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import resource
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+import httpx
+import lxml.html
+
+from app.core.task_queue import LocalBackend, TaskQueue
+
+ROBOTS = b"User-agent: *\nAllow: /\n"
+
+
+# ----------------------------------------------------------------------
+# Fixture server (child process)
+# ----------------------------------------------------------------------
+
+
+def build_site(corpus: Path, sources: int, entries: int, seed: int) -> Dict[Tuple[str, str], bytes]:
+    """Feed XML and article HTML for every (host, path) the benchmark requests."""
+    templates = [path.read_bytes() for path in sorted(corpus.glob("*.html"))]
+    if not templates:
+        raise SystemExit(f"❌ No .html files in {corpus}")
+
+    vocabulary = []
+    for html in templates:
+        for paragraph in lxml.html.fromstring(html).iter("p"):
+            vocabulary.extend(paragraph.text_content().split())
+
+    rng = random.Random(seed)
+    site = {}
+    for s in range(sources):
+        host = source_host(s)
+        items = []
+        for e in range(entries):
+            title = f"Source {s} story {e}"
+            path = f"/news/{e}.html"
+            site[(host, path)] = render_article(
+                templates[(s + e) % len(templates)], title, vocabulary, rng
+            )
+            items.append(
+                f"<item><title>{escape(title)}</title><link>http://{host}{path}</link>"
+                f"<guid>{host}-{e}</guid>"
+                f"<pubDate>Mon, 17 Nov 2025 10:{e % 60:02d}:00 GMT</pubDate></item>"
+            )
+        site[(host, "/rss.xml")] = (
+            f'<?xml version="1.0"?><rss version="2.0"><channel><title>Source {s}</title>'
+            f'{"".join(items)}</channel></rss>'
+        ).encode()
+    return site
+
+
+def render_article(template: bytes, title: str, vocabulary: List[str], rng: random.Random) -> bytes:
+    """Recorded page with its paragraph text replaced by random corpus words."""
+    document = lxml.html.fromstring(template)
+    for heading in document.iter("h1", "title"):
+        heading.text = title
+    for paragraph in document.iter("p"):
+        words = len(paragraph.text_content().split())
+        if words:
+            for child in list(paragraph):
+                paragraph.remove(child)
+            paragraph.text = " ".join(rng.choices(vocabulary, k=words))
+    return lxml.html.tostring(document, doctype="<!DOCTYPE html>")
+
+
+def source_host(index: int) -> str:
+    return f"source{index}.bench.test"
+
+
+def make_app(site: Dict, latency: float, jitter: float, error_rate: float, seed: int):
+    """ASGI app serving the site with injected latency and 503s."""
+    rng = random.Random(seed)
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        host = dict(scope["headers"]).get(b"host", b"").decode().split(":")[0]
+        path = scope["path"]
+
+        await asyncio.sleep(max(0.0, latency + rng.uniform(-jitter, jitter)))
+        content_type = b"text/html; charset=utf-8"
+        if path == "/robots.txt":
+            status, body, content_type = 200, ROBOTS, b"text/plain"
+        elif rng.random() < error_rate:
+            status, body = 503, b"Service Unavailable"
+        elif (host, path) in site:
+            status, body = 200, site[(host, path)]
+            if path.endswith(".xml"):
+                content_type = b"application/rss+xml"
+        else:
+            status, body = 404, b"Not Found"
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def serve(
+    port: int,
+    corpus: Path,
+    sources: int,
+    entries: int,
+    seed: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+):
+    """Child process entry point."""
+    import uvicorn
+
+    site = build_site(corpus, sources, entries, seed)
+    app = make_app(site, latency, jitter, error_rate, seed)
+    uvicorn.run(
+        app, host="127.0.0.1", port=port, log_level="warning", lifespan="off", access_log=False
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_server(
+    server: multiprocessing.Process, port: int, timeout: float = 60.0
+) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline and server.is_alive():
+            try:
+                if (await client.get(f"http://127.0.0.1:{port}/robots.txt")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit("❌ Fixture server did not start")
+
+
+class FixtureTransport(httpx.AsyncBaseTransport):
+    """Send every request to the fixture server, keeping the original Host header."""
+
+    def __init__(self, port: int, max_connections: int):
+        self.port = port
+        self._inner = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            )
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self.port)
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+# ----------------------------------------------------------------------
+# Benchmark (this process)
+# ----------------------------------------------------------------------
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_once(args, port: int, database_url: str) -> Dict:
+    """One ingestion run against fresh state."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.core.config import settings
+    from app.ingestion.crawler import RSSCrawler
+    from app.ingestion.dedup import BloomFilter, UrlDeduplicator
+    from app.ingestion.feed_state import FeedStateStore
+    from app.ingestion.fetcher import AsyncFetcher
+    from app.ingestion.near_duplicates import NearDuplicateDetector
+    from app.ingestion.pipeline import IngestionPipeline
+    from app.models.news_models import Base
+
+    engine = create_async_engine(database_url)
+    if database_url.startswith("sqlite"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    fetcher = AsyncFetcher(
+        transport=FixtureTransport(port, settings.INGESTION_MAX_CONNECTIONS), backoff_base=0.05
+    )
+    crawler = RSSCrawler(
+        fetcher=fetcher,
+        state_store=FeedStateStore(),
+        dedup=UrlDeduplicator(
+            bloom=BloomFilter(key=f"bench:{time.time()}", capacity=args.sources * args.entries * 2),
+            session_factory=session_factory,
+        ),
+    )
+    pipeline_kwargs = {"tasks": TaskQueue(backend=LocalBackend(maxlen=100000))}
+    if args.no_nlp:
+        pipeline_kwargs["enricher"] = None
+    if database_url.startswith("sqlite"):
+        pipeline_kwargs["workers"] = {"store": 1}  # SQLite allows one writer
+    pipeline = IngestionPipeline(
+        crawler, session_factory, near_duplicates=NearDuplicateDetector(), **pipeline_kwargs
+    )
+
+    sources = [
+        {"name": f"Bench {s}", "rss_feeds": [f"http://{source_host(s)}/rss.xml"]}
+        for s in range(args.sources)
+    ]
+    started = time.perf_counter()
+    try:
+        stats = await pipeline.run(sources)
+    finally:
+        elapsed = time.perf_counter() - started
+        await crawler.close()
+        await engine.dispose()
+
+    return {
+        "articles": stats["inserted"],
+        "errors": stats["errors"],
+        "seconds": round(elapsed, 3),
+        "articles_per_second": round(stats["inserted"] / elapsed, 2),
+        "stages": stats["stages"],
+    }
+
+
+async def benchmark(args) -> Dict:
+    port = free_port()
+    server = multiprocessing.get_context("spawn").Process(
+        target=serve,
+        args=(
+            port,
+            args.corpus,
+            args.sources,
+            args.entries,
+            args.seed,
+            args.latency_ms / 1000,
+            args.jitter_ms / 1000,
+            args.error_rate,
+        ),
+        daemon=True,
+    )
+    server.start()
+    try:
+        await wait_for_server(server, port)
+        baseline_rss = peak_rss_mb()
+        runs = []
+        for run in range(args.runs):
+            with tempfile.TemporaryDirectory() as tmp:
+                database_url = args.database_url or f"sqlite+aiosqlite:///{tmp}/bench.db"
+                result = await run_once(args, port, database_url)
+            runs.append(result)
+            print(
+                f"  run {run + 1}: {result['articles']} articles in {result['seconds']}s "
+                f"({result['articles_per_second']}/s, {result['errors']} errors)"
+            )
+    finally:
+        server.terminate()
+        server.join()
+
+    best = sorted(runs, key=lambda r: r["articles_per_second"])[len(runs) // 2]
+    return {
+        "config": {
+            "sources": args.sources,
+            "entries": args.entries,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "nlp": not args.no_nlp,
+            "runs": args.runs,
+        },
+        "articles_per_second": statistics.median(r["articles_per_second"] for r in runs),
+        "articles": best["articles"],
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "baseline_rss_mb": round(baseline_rss, 1),
+        "stages": best["stages"],
+    }
+
+
+def report(results: Dict) -> None:
+    config = results["config"]
+    print(
+        f"\n📊 Ingestion benchmark: {config['sources']} sources x {config['entries']} entries, "
+        f"latency {config['latency_ms']}±{config['jitter_ms']} ms, "
+        f"{config['error_rate']:.0%} errors, "
+        f"median of {config['runs']} runs\n"
+    )
+    print(
+        f"{'stage':10s} {'items':>8s} {'items/s':>9s} {'p50 ms':>9s} {'p99 ms':>9s} "
+        f"{'util':>6s} {'max q':>6s}"
+    )
+    for name, stage in results["stages"].items():
+        print(
+            f"{name:10s} {stage['processed']:8d} {stage['items_per_second']:9.1f} "
+            f"{stage['p50_ms']:9.2f} {stage['p99_ms']:9.2f} {stage['utilization']:6.2f} "
+            f"{stage['max_queue_depth']:6d}"
+        )
+    print(
+        f"\n   throughput: {results['articles_per_second']:.1f} articles/s "
+        f"({results['articles']} stored)"
+    )
+    print(
+        f"   peak RSS:   {results['peak_rss_mb']:.1f} MB "
+        f"(before runs: {results['baseline_rss_mb']:.1f} MB)"
+    )
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions beyond tolerance against a saved baseline."""
+    problems = []
+    if results["articles_per_second"] < baseline["articles_per_second"] * (1 - tolerance):
+        problems.append(
+            f"throughput {results['articles_per_second']:.1f}/s "
+            f"< baseline {baseline['articles_per_second']:.1f}/s"
+        )
+    if results["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + tolerance):
+        problems.append(
+            f"peak RSS {results['peak_rss_mb']:.1f} MB > baseline {baseline['peak_rss_mb']:.1f} MB"
+        )
+    return problems
+
+
+def main(args) -> int:
+    """Main entry point."""
+    results = asyncio.run(benchmark(args))
+    report(results)
+
+    if args.save_results:
+        args.save_results.write_text(json.dumps(results, indent=2))
+        print(f"\n✅ Results saved to {args.save_results}")
+
+    if args.baseline:
+        problems = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for problem in problems:
+            print(f"❌ Regression: {problem}")
+        if problems:
+            return 1
+        print(f"\n✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark ingestion against a local fixture server"
+    )
+    parser.add_argument(
+        "--corpus", type=Path, default=Path("tests/fixtures/html"), help="Recorded article pages"
+    )
+    parser.add_argument(
+        "--sources", type=int, default=20, help="Simulated news sites (one feed each)"
+    )
+    parser.add_argument("--entries", type=int, default=50, help="Articles per feed")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Server response latency")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="Uniform latency jitter")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.02, help="Fraction of page requests answered 503"
+    )
+    parser.add_argument("--no-nlp", action="store_true", help="Skip NLP enrichment")
+    parser.add_argument(
+        "--runs", type=int, default=1, help="Runs with fresh state (median reported)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=7, help="Seed for content, latency and failures"
+    )
+    parser.add_argument(
+        "--database-url", default=None, help="Async DB URL (default: temporary SQLite)"
+    )
+    parser.add_argument("--save-results", type=Path, default=None, help="Write results JSON")
+    parser.add_argument(
+        "--baseline", type=Path, default=None, help="Compare with a saved results JSON"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="Allowed regression vs baseline"
+    )
+    sys.exit(main(parser.parse_args()))
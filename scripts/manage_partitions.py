@@ -0,0 +1,27 @@
+"""
+Article Partition Maintenance
+Creates upcoming monthly partitions and archives expired ones
+
+Run from cron (e.g. daily):
+    python scripts/manage_partitions.py
+
+Built by Elite Team - Database Engineer (PhD in Database Systems)
+"""
+
+import asyncio
+
+from app.core.database import engine
+from app.core.partitions import maintain_partitions
+
+
+async def main():
+    """Main entry point."""
+    stats = await maintain_partitions(engine)
+    await engine.dispose()
+
+    print(f"✓ Created partitions: {', '.join(stats['created']) or 'none'}")
+    print(f"✓ Archived partitions: {', '.join(stats['archived']) or 'none'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,7 +13,16 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
-from app.models.news_models import Edge, Entity, NewsArticle, Node, Trend
+from app.ingestion.urls import canonicalize_url
+from app.models.news_models import (
+    ArticleUrl,
+    Edge,
+    Entity,
+    NewsArticle,
+    Node,
+    Trend,
+    hash_url,
+)
 
 
 class SeedDataGenerator:
@@ -229,6 +238,20 @@ and innovation in this domain.
             articles.append(article)
 
         session.add_all(articles)
+        await session.flush()
+
+        # Register URLs in the dedup table (news_articles is partitioned)
+        session.add_all(
+            [
+                ArticleUrl(
+                    url_hash=hash_url(canonicalize_url(article.url)),
+                    url=canonicalize_url(article.url),
+                    article_id=article.id,
+                    published_date=article.published_date,
+                )
+                for article in articles
+            ]
+        )
         await session.commit()
         print(f"✅ Created {len(articles)} articles ({persian_count} Persian, {english_count} English)")
         return articles
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures for ARAS microservice tests."""
 
 import asyncio
+from contextlib import contextmanager
 from typing import AsyncGenerator, Generator
 
 import pytest
@@ -10,7 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
+from app.core.query_stats import QueryCounter
 from app.main import app
 from app.models.news_models import Base
 
@@ -97,6 +99,7 @@ def client(sync_db_session) -> Generator[TestClient, None, None]:
             sync_db_session.rollback()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     with TestClient(app) as tc:
         yield tc
@@ -104,6 +107,25 @@ def client(sync_db_session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def query_budget():
+    """
+    Assert that a block runs at most max_queries SQL statements on an engine.
+
+    Usage:
+        with query_budget(engine, 2):
+            client.put("/api/v1/articles/1", json={"title": "New"})
+    """
+
+    @contextmanager
+    def budget(db_engine, max_queries: int):
+        with QueryCounter(db_engine) as queries:
+            yield queries
+        assert queries.count <= max_queries, queries.report()
+
+    return budget
+
+
 @pytest.fixture
 async def sample_article_data():
     """Sample article data for testing."""
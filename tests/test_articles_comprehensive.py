@@ -224,3 +224,12 @@ class TestArticlesAPI:
         response = client.get(f"/api/v1/articles/?start_date={start_date}&end_date={end_date}")
 
         assert response.status_code in [200, 500]
+
+    def test_search_rejects_invalid_dates(self):
+        """Test that malformed search date filters are validation errors."""
+        response = client.get("/api/v1/articles/search/?q=test&start_date=yesterday")
+        assert response.status_code == 422
+        assert "start_date" in response.json()["detail"]
+
+        response = client.get("/api/v1/articles/search/?q=test&end_date=2025-13-01")
+        assert response.status_code == 422
@@ -0,0 +1,104 @@
+"""
+Test suite for the batched audit log sink and audit middleware
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import json
+import time
+
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.audit_logger import AuditLoggerMiddleware
+from app.core.audit_sink import AuditSink, RotatingFileWriter
+
+
+class ListWriter:
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def write(self, lines):
+        self.batches.append([json.loads(line) for line in lines])
+
+    def close(self):
+        self.closed = True
+
+
+def test_sink_batches_records_off_thread_and_flushes_on_close():
+    """Test that records are written in batches as NDJSON and nothing is lost on close."""
+    writer = ListWriter()
+    sink = AuditSink(writer=writer, batch_size=3, flush_interval=60)
+
+    for i in range(7):
+        sink.emit({"ts": time.time(), "event": "test", "n": i})
+    sink.close()
+
+    assert writer.closed
+    assert all(len(batch) <= 3 for batch in writer.batches)
+    records = [record for batch in writer.batches for record in batch]
+    assert [record["n"] for record in records] == list(range(7))
+    assert records[0]["timestamp"].endswith("Z") and "ts" not in records[0]
+
+
+def test_full_buffer_drops_oldest_records():
+    """Test that a full ring buffer drops instead of blocking."""
+    writer = ListWriter()
+    sink = AuditSink(writer=writer, buffer_size=5, batch_size=100, flush_interval=60)
+    sink._thread = object()  # Pretend the writer thread runs, but never drain
+
+    for i in range(8):
+        sink.emit({"ts": time.time(), "n": i})
+
+    assert sink.dropped == 3
+    assert [record["n"] for record in sink.buffer] == [3, 4, 5, 6, 7]
+
+
+def test_sampling_keeps_errors_and_writes():
+    """Test per-route GET sampling."""
+    sink = AuditSink(
+        writer=ListWriter(), get_sample_rate=1.0, sample_rates={"/api/v1/articles": 0.0}
+    )
+
+    assert not sink.sampled("GET", "/api/v1/articles/1", 200)
+    assert sink.sampled("GET", "/api/v1/articles/1", 404)
+    assert sink.sampled("POST", "/api/v1/articles/", 200)
+    assert sink.sampled("GET", "/api/v1/trends/", 200)
+
+
+def test_rotating_file_writer(tmp_path):
+    """Test size-based rotation keeps the configured number of backups."""
+    path = str(tmp_path / "audit" / "audit.ndjson")
+    writer = RotatingFileWriter(path, max_bytes=20, backups=2)
+    for i in range(4):
+        writer.write([f'{{"n": {i}}}\n'.encode(), f'{{"n": {i}}}\n'.encode()])
+    writer.close()
+
+    assert open(path).read().count("\n") == 2
+    assert open(f"{path}.1").read().startswith('{"n": 2}')
+    assert open(f"{path}.2").read().startswith('{"n": 1}')
+
+
+def test_middleware_emits_one_completed_record():
+    """Test a single request_completed record with status, size and timing."""
+    writer = ListWriter()
+    sink = AuditSink(writer=writer, flush_interval=60)
+
+    async def hello(request):
+        return PlainTextResponse("hello")
+
+    app = AuditLoggerMiddleware(Starlette(routes=[Route("/hello", hello)]), sink=sink)
+    with TestClient(app) as client:
+        response = client.get("/hello?x=1", headers={"User-Agent": "pytest"})
+    sink.close()
+
+    (record,) = [record for batch in writer.batches for record in batch]
+    assert record["event"] == "request_completed"
+    assert record["request_id"] == response.headers["X-Request-ID"]
+    assert record["status_code"] == 200
+    assert record["response_size"] == 5
+    assert record["query"] == "x=1"
+    assert record["user_agent"] == "pytest"
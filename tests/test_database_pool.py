@@ -0,0 +1,90 @@
+"""
+Test suite for database engine pool configuration and metrics
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import database
+from app.core.config import settings
+
+
+def test_sqlite_keeps_default_pool():
+    """Test that SQLite URLs get no server pool sizing."""
+    options = database._engine_options("sqlite+aiosqlite:///:memory:")
+
+    assert "pool_size" not in options
+    assert options["echo"] is settings.DATABASE_ECHO
+
+
+def test_postgres_pool_settings_wired(monkeypatch):
+    """Test that pool sizing and the statement cache come from Settings."""
+    monkeypatch.setattr(settings, "DATABASE_PGBOUNCER", False)
+    options = database._engine_options("postgresql+asyncpg://user:pw@db/aras")
+
+    assert options["poolclass"] is database.InstrumentedAsyncQueuePool
+    assert options["pool_size"] == settings.DATABASE_POOL_SIZE
+    assert options["max_overflow"] == settings.DATABASE_MAX_OVERFLOW
+    assert options["pool_timeout"] == settings.DATABASE_POOL_TIMEOUT
+    assert options["pool_recycle"] == settings.DATABASE_POOL_RECYCLE
+    assert options["connect_args"] == {
+        "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
+    }
+
+
+def test_pgbouncer_mode_disables_statement_caches(monkeypatch):
+    """Test PgBouncer transaction-pooling compatibility options."""
+    monkeypatch.setattr(settings, "DATABASE_PGBOUNCER", True)
+    connect_args = database._engine_options("postgresql+asyncpg://user:pw@db/aras")["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert (
+        connect_args["prepared_statement_name_func"]()
+        != connect_args["prepared_statement_name_func"]()
+    )
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_checkouts(tmp_path):
+    """Test checkout counting and wait timing on the instrumented pool."""
+    db_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=database.InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    metrics = database.PoolMetrics("test")
+    db_engine.sync_engine.pool.metrics = metrics
+
+    for _ in range(3):
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    stats = metrics.snapshot(db_engine.sync_engine.pool)
+    await db_engine.dispose()
+
+    assert stats["size"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["wait_seconds_max"] >= 0.0
+    assert db_engine.sync_engine.pool.metrics is metrics
+
+
+@pytest.mark.asyncio
+async def test_engine_events_count_checkouts(tmp_path, monkeypatch):
+    """Test that engines built by _create_engine report checkouts."""
+    monkeypatch.setattr(database, "pool_metrics", {})
+    db_engine = database._create_engine(f"sqlite+aiosqlite:///{tmp_path / 'events.db'}", "test")
+
+    for _ in range(3):
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await db_engine.dispose()
+
+    metrics = database.pool_metrics["test"]
+    assert metrics.checkouts == 3
+    assert metrics.checkins == 3
+    assert metrics.connects >= 1
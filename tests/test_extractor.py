@@ -0,0 +1,58 @@
+"""
+Test suite for the lxml content extraction engine
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from pathlib import Path
+
+from app.ingestion.extractor import ContentExtractor
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_extracts_body_without_boilerplate():
+    """Test that navigation, sidebars, related links, comments and footers are dropped."""
+    result = ContentExtractor().extract(read_fixture("article_with_boilerplate.html"))
+    content = result["content"]
+
+    assert result["title"] == "Oil exports rise as new terminal opens"
+    assert content.startswith("Crude exports climbed")
+    assert "Buyers in Asia" in content
+    assert "long-term investment in capacity" in content
+    assert content.endswith("limit flows in the spring.")
+    for noise in (
+        "Business",
+        "cookies",
+        "Share on",
+        "Most read",
+        "Gas prices",
+        "Great article",
+        "Copyright",
+    ):
+        assert noise not in content
+
+
+def test_source_selector_override():
+    """Test per-source selectors from news_sources.yaml (and XML-declared pages)."""
+    html = read_fixture("article_with_selector.html")
+    selectors = {"title": ".news-title", "content": "div.item-text"}
+
+    result = ContentExtractor().extract(html, selectors)
+
+    assert result["title"] == "Parliament approves budget for next year"
+    assert result["content"].startswith("Lawmakers approved the national budget")
+    assert "Subscribe" not in result["content"]
+
+
+def test_short_selector_match_falls_back_to_scoring():
+    """Test that a selector that misses falls back to text-density scoring."""
+    html = read_fixture("article_with_boilerplate.html")
+
+    result = ContentExtractor().extract(html, {"content": ".does-not-exist"})
+
+    assert result["content"].startswith("Crude exports climbed")
@@ -0,0 +1,181 @@
+"""
+Test suite for the async ingestion fetcher and RSS crawler
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.ingestion.crawler import RSSCrawler
+from app.ingestion.feed_state import FeedStateStore
+from app.ingestion.fetcher import AsyncFetcher
+from app.ingestion.sources import load_news_sources
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>First Story</title><link>https://news.test/a</link>
+<pubDate>Mon, 17 Nov 2025 10:00:00 GMT</pubDate></item>
+<item><title>Second Story</title><link>https://news.test/b</link></item>
+</channel></rss>"""
+
+ARTICLE = (
+    "<html><body><article>" + "<p>Paragraph of article text.</p>" * 10 + "</article></body></html>"
+)
+
+
+def make_fetcher(handler, **kwargs) -> AsyncFetcher:
+    """Fetcher with a mocked transport and no real sleeping between retries."""
+    kwargs.setdefault("respect_robots", False)
+    kwargs.setdefault("backoff_base", 0.0)
+    return AsyncFetcher(transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fetch_retries_transient_errors():
+    """Test that 503 responses are retried until success."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, text="ok")
+
+    async with make_fetcher(handler, max_retries=3) as fetcher:
+        result = await fetcher.fetch("https://news.test/feed")
+
+    assert result.ok
+    assert result.text == "ok"
+    assert result.attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_gives_up_after_max_retries():
+    """Test that network errors are reported, not raised."""
+
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async with make_fetcher(handler, max_retries=2) as fetcher:
+        result = await fetcher.fetch("https://down.test/feed")
+
+    assert not result.ok
+    assert result.attempts == 3
+    assert "ConnectError" in result.error
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_limit():
+    """Test that concurrent requests to one host never exceed the limit."""
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, text="ok")
+
+    async with make_fetcher(handler, per_host_limit=2) as fetcher:
+        results = await fetcher.fetch_many(f"https://news.test/{i}" for i in range(8))
+
+    assert all(result.ok for result in results)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_robots_txt_disallow():
+    """Test that robots.txt rules are honoured."""
+
+    def handler(request):
+        if request.url.path == "/robots.txt":
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private")
+        return httpx.Response(200, text="ok")
+
+    async with make_fetcher(handler, respect_robots=True) as fetcher:
+        blocked = await fetcher.fetch("https://news.test/private/page")
+        allowed = await fetcher.fetch("https://news.test/public/page")
+
+    assert blocked.error == "disallowed by robots.txt"
+    assert allowed.ok
+
+
+@pytest.mark.asyncio
+async def test_crawler_can_run_repeatedly():
+    """Test that the crawler extracts articles and is reusable across crawls."""
+
+    def handler(request):
+        if request.url.path == "/feed":
+            return httpx.Response(200, text=FEED)
+        return httpx.Response(200, text=ARTICLE)
+
+    sources = [{"name": "Test News", "category": "test", "rss_feeds": ["https://news.test/feed"]}]
+    crawler = RSSCrawler(fetcher=make_fetcher(handler), state_store=FeedStateStore())
+    try:
+        first = await crawler.crawl(sources)
+        second = await crawler.crawl(sources)
+    finally:
+        await crawler.close()
+
+    assert [a["url"] for a in first] == ["https://news.test/a", "https://news.test/b"]
+    assert second == []  # Nothing new since the first crawl
+    assert first[0]["title"] == "First Story"
+    assert first[0]["source"] == "Test News"
+    assert first[0]["published_date"].year == 2025
+
+
+@pytest.mark.asyncio
+async def test_crawler_conditional_get_and_feed_delta():
+    """Test ETag revalidation (304) and that only new entries are fetched."""
+    feed = {"text": FEED, "etag": '"v1"'}
+    article_requests = []
+
+    def handler(request):
+        if request.url.path == "/feed":
+            if request.headers.get("If-None-Match") == feed["etag"]:
+                return httpx.Response(304)
+            return httpx.Response(200, text=feed["text"], headers={"ETag": feed["etag"]})
+        article_requests.append(request.url.path)
+        return httpx.Response(200, text=ARTICLE)
+
+    sources = [{"name": "Delta News", "rss_feeds": ["https://delta.test/feed"]}]
+    store = FeedStateStore()
+    crawler = RSSCrawler(fetcher=make_fetcher(handler), state_store=store)
+    try:
+        await crawler.crawl(sources)
+        state = await store.get("https://delta.test/feed")
+        assert state.etag == '"v1"'
+        assert state.conditional_headers() == {"If-None-Match": '"v1"'}
+
+        # Unchanged feed: a single 304, no article fetches
+        assert await crawler.crawl(sources) == []
+        assert article_requests == ["/a", "/b"]
+
+        # Feed gains one entry: only that article is fetched
+        feed["etag"] = '"v2"'
+        feed["text"] = FEED.replace(
+            "<item>",
+            "<item><title>Third Story</title><link>https://delta.test/c</link></item><item>",
+            1,
+        )
+        third = await crawler.crawl(sources)
+    finally:
+        await crawler.close()
+
+    assert [a["url"] for a in third] == ["https://delta.test/c"]
+    assert article_requests == ["/a", "/b", "/c"]
+
+
+def test_load_news_sources_reads_all_groups():
+    """Test that every *_sources group from the config is loaded."""
+    sources = load_news_sources("config/news_sources.yaml")
+    names = {source["name"] for source in sources}
+
+    assert "PressTV" in names  # iranian_english_sources
+    assert "Reuters Iran" in names  # international_sources
+    assert "Middle East Eye" in names  # specialized_sources
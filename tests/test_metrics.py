@@ -0,0 +1,57 @@
+"""
+Test suite for the Prometheus metrics registry and /metrics endpoint
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import HTTP_REQUEST_SECONDS, MetricsRegistry
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test bucket counts, sum and count in the text exposition."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+    counter = registry.counter("test_total", "Test events", ("result",))
+
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value, "/a")
+    counter.inc("hit")
+    counter.inc("hit", amount=2)
+
+    text = registry.render()
+    assert "# TYPE test_seconds histogram" in text
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'test_seconds_bucket{route="/a",le="1.0"} 3' in text
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'test_seconds_sum{route="/a"} 4.25' in text
+    assert 'test_seconds_count{route="/a"} 4' in text
+    assert 'test_total{result="hit"} 3' in text
+
+
+def test_requests_are_labelled_by_route_template():
+    """Test that path parameters do not leak into labels."""
+    before = HTTP_REQUEST_SECONDS.count("GET", "/api/v1/articles/{article_id}", "422")
+    client.get("/api/v1/articles/not-a-number")
+    client.get("/api/v1/articles/also-not-a-number")
+    client.get("/no/such/route")
+
+    assert HTTP_REQUEST_SECONDS.count("GET", "/api/v1/articles/{article_id}", "422") == before + 2
+    assert HTTP_REQUEST_SECONDS.count("GET", "unmatched", "404") >= 1
+
+
+def test_metrics_endpoint_exposes_request_and_pool_metrics():
+    """Test the /metrics scrape output."""
+    client.get("/health")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    health = 'aras_http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+    assert health in response.text
+    assert 'aras_db_pool_checkouts{engine="primary"}' in response.text
+    assert "# TYPE aras_nlp_executor_queued gauge" in response.text
@@ -0,0 +1,117 @@
+"""
+Test suite for metrics and slow requests shared between gunicorn workers
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import json
+import time
+
+import pytest
+
+from app.core import multiprocess
+from app.core.config import settings
+from app.core.metrics import MetricsRegistry
+from app.core.profiling import SlowRequestLog
+
+OTHER_WORKER = 4242
+
+
+def make_registry(requests: int, in_flight: int) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("aras_test_requests_total", "Requests", ("route",)).inc("/a", amount=requests)
+    registry.gauge("aras_test_in_flight", "In flight").set(in_flight)
+    latency = registry.histogram("aras_test_seconds", "Latency", buckets=(0.1, 1.0))
+    for _ in range(requests):
+        latency.observe(0.05)
+    return registry
+
+
+def write_other_worker(kind: str, data) -> None:
+    with open(multiprocess._path(kind, OTHER_WORKER), "w") as f:
+        json.dump(data, f)
+
+
+@pytest.fixture(autouse=True)
+def shared_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "MULTIPROCESS_DIR", str(tmp_path))
+    multiprocess.prepare_directory()
+    return tmp_path
+
+
+def test_scrape_merges_every_worker():
+    """Test that counters, histograms and gauges are summed across workers."""
+    write_other_worker(multiprocess.METRICS, make_registry(requests=2, in_flight=1).collect())
+
+    registry = make_registry(requests=3, in_flight=4)
+    text = registry.render(multiprocess.collect_metrics(registry))
+
+    assert 'aras_test_requests_total{route="/a"} 5' in text
+    assert "aras_test_in_flight 5" in text
+    assert 'aras_test_seconds_bucket{le="0.1"} 5' in text
+    assert "aras_test_seconds_count 5" in text
+    assert text.count("# TYPE aras_test_requests_total counter") == 1
+
+
+def test_exited_worker_keeps_counters_but_not_gauges():
+    """Test that retiring a worker never makes a counter go backwards."""
+    write_other_worker(multiprocess.METRICS, make_registry(requests=2, in_flight=7).collect())
+    write_other_worker(multiprocess.SLOW_REQUESTS, [{"path": "/gone", "timestamp": 1.0}])
+
+    multiprocess.retire(OTHER_WORKER)
+    multiprocess.retire(OTHER_WORKER)  # A second exit notice changes nothing
+
+    families = multiprocess.collect_metrics(MetricsRegistry())
+    text = MetricsRegistry().render(families)
+    assert 'aras_test_requests_total{route="/a"} 2' in text
+    assert "aras_test_seconds_sum 0.1" in text
+    assert "aras_test_in_flight" not in text
+    assert multiprocess.collect_slow_requests(SlowRequestLog(threshold_ms=0)) == []
+
+
+def test_slow_requests_of_all_workers_newest_first():
+    """Test the merged slow-request list and that clearing hides every worker's entries."""
+    now = time.time()
+    write_other_worker(multiprocess.SLOW_REQUESTS, [{"path": "/other", "timestamp": now - 1}])
+    log = SlowRequestLog(threshold_ms=0, capacity=5)
+    log.record({"path": "/mine", "timestamp": now})
+
+    entries = multiprocess.collect_slow_requests(log)
+    assert [entry["path"] for entry in entries] == ["/mine", "/other"]
+    assert multiprocess.collect_slow_requests(log, limit=1)[0]["path"] == "/mine"
+
+    multiprocess.clear_slow_requests(log)
+    assert multiprocess.collect_slow_requests(log) == []
+
+    log.record({"path": "/later", "timestamp": time.time()})
+    assert [entry["path"] for entry in multiprocess.collect_slow_requests(log)] == ["/later"]
+
+
+def test_publisher_writes_a_final_snapshot(shared_dir):
+    """Test the worker-side thread lifecycle."""
+    publisher = multiprocess.Publisher(interval=60)
+    publisher.start()
+    publisher.stop()
+
+    assert sorted(path.name.split("-")[0] for path in shared_dir.iterdir()) == ["metrics", "slow"]
+
+
+def test_single_process_is_unchanged(monkeypatch):
+    """Test that without a shared directory only this process is reported."""
+    monkeypatch.setattr(settings, "MULTIPROCESS_DIR", "")
+    registry = make_registry(requests=1, in_flight=0)
+
+    assert multiprocess.collect_metrics(registry) == registry.collect()
+
+
+def test_prepare_directory_only_removes_own_files(shared_dir):
+    """Test that a shared MULTIPROCESS_DIR keeps other programs' files."""
+    (shared_dir / "other.json").write_text("{}")
+    (shared_dir / "metrics-dir").mkdir()
+    write_other_worker(multiprocess.METRICS, [])
+    (shared_dir / multiprocess.SLOW_REQUESTS_CLEARED).write_text("0")
+    (shared_dir / "slow-4242.json.7.tmp").write_text("[")
+
+    multiprocess.prepare_directory()
+
+    assert sorted(path.name for path in shared_dir.iterdir()) == ["metrics-dir", "other.json"]
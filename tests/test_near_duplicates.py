@@ -0,0 +1,103 @@
+"""
+Test suite for MinHash/LSH near-duplicate detection
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ingestion.near_duplicates import (
+    MinHasher,
+    NearDuplicateDetector,
+    NearDuplicateIndex,
+    similarity,
+)
+from app.ingestion.service import NewsIngestionService
+from app.models.news_models import NewsArticle
+
+STORY = (
+    "Iran and the European Union resumed talks in Vienna on Monday about the nuclear agreement, "
+    "with diplomats from both sides describing the first session as constructive. Officials said "
+    "technical teams would continue working through the week on sanctions relief and verification "
+    "measures, while foreign ministers are expected to meet later this month if progress "
+    "continues. Analysts cautioned that major differences remain over the sequencing of steps."
+)
+
+EDITED = STORY.replace("on Monday", "on Monday morning").replace(
+    "Analysts cautioned", "Experts warned"
+)
+
+UNRELATED = (
+    "Heavy rainfall caused flooding across several northern provinces over the weekend, closing "
+    "roads and schools. Emergency services evacuated hundreds of residents from low-lying villages "
+    "and meteorologists forecast more storms for the coming days as a cold front moves east."
+)
+
+
+def make_detector() -> NearDuplicateDetector:
+    return NearDuplicateDetector(
+        index=NearDuplicateIndex(prefix=f"test_near_dup_{datetime.now().timestamp()}")
+    )
+
+
+def test_minhash_similarity_tracks_edits():
+    """Test that lightly edited copies score high and unrelated text low."""
+    hasher = MinHasher()
+
+    assert similarity(hasher.signature(STORY), hasher.signature(STORY)) == 1.0
+    assert similarity(hasher.signature(STORY), hasher.signature(EDITED)) >= 0.6
+    assert similarity(hasher.signature(STORY), hasher.signature(UNRELATED)) < 0.1
+    assert hasher.signature("Too short to compare") is None
+
+
+@pytest.mark.asyncio
+async def test_lsh_index_finds_canonical():
+    """Test that the index returns the canonical article for a near-duplicate."""
+    detector = make_detector()
+    detector.index.threshold = 0.6
+    await detector.register(101, detector.signature(STORY))
+
+    assert await detector.find_canonical(detector.signature(EDITED)) == 101
+    assert await detector.find_canonical(detector.signature(UNRELATED)) is None
+
+
+@pytest.mark.asyncio
+async def test_ingest_links_near_duplicates(async_db: AsyncSession):
+    """Test that ingestion stores syndicated copies under the canonical article."""
+    stamp = datetime.now().timestamp()
+    detector = make_detector()
+    service = NewsIngestionService(crawler=object(), near_duplicates=detector)
+    articles = [
+        {
+            "title": "Talks resume",
+            "content": STORY,
+            "url": f"https://reuters.example/{stamp}",
+            "source": "Reuters",
+            "published_date": datetime(2025, 8, 4),
+        },
+        {
+            "title": "Talks resume in Vienna",
+            "content": STORY + " Talks are set to continue.",
+            "url": f"https://ap.example/{stamp}",
+            "source": "AP",
+            "published_date": datetime(2025, 8, 4),
+        },
+    ]
+
+    stats = await service.ingest_articles(articles, async_db)
+
+    assert stats["inserted"] == 2
+    assert stats["near_duplicates"] == 1
+
+    result = await async_db.execute(
+        select(NewsArticle).where(
+            NewsArticle.source.in_(["Reuters", "AP"]), NewsArticle.url.like(f"%{stamp}")
+        )
+    )
+    stored = {article.source: article for article in result.scalars().all()}
+    assert stored["Reuters"].duplicate_of is None
+    assert stored["AP"].duplicate_of == stored["Reuters"].id
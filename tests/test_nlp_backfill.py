@@ -0,0 +1,102 @@
+"""
+Test suite for the resumable NLP re-enrichment backfill
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.redis_client import redis_client
+from app.core.task_queue import LocalBackend, TaskQueue
+from app.models.news_models import NewsArticle
+from app.nlp.backfill import BackfillCheckpoint, NLPBackfill
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_backfill_is_chunked_resumable_and_skips_current_rows(session_factory, monkeypatch):
+    """Test keyset chunks, checkpoint resume, and that current/duplicate rows are left alone."""
+    stamp = datetime.now().timestamp()
+    version = f"test-model-{stamp}"
+    versions = [None, "old", version, "old", None, "old"]
+
+    async with session_factory() as session:
+        articles = [
+            NewsArticle(
+                title=f"Backfill {i}",
+                content=f"content {i}",
+                source="Test",
+                published_date=datetime.utcnow(),
+                url=f"https://backfill.test/{stamp}/{i}",
+                nlp_version=nlp_version,
+                duplicate_of=1 if i == 5 else None,
+            )
+            for i, nlp_version in enumerate(versions)
+        ]
+        session.add_all(articles)
+        await session.commit()
+        ids = [article.id for article in articles]
+
+    analysed = []
+
+    async def analyzer(texts):
+        analysed.append(texts)
+        return [
+            {"sentiment": {"polarity": 0.25}, "entities": [], "keywords": [("topic", 1.0)]}
+            for _ in texts
+        ]
+
+    invalidated = []
+
+    async def delete_many(keys):
+        invalidated.extend(keys)
+        return 0
+
+    monkeypatch.setattr(redis_client, "delete_many", delete_many)
+
+    def make_backfill():
+        backfill = NLPBackfill(
+            session_factory,
+            version=version,
+            analyzer=analyzer,
+            chunk_size=2,
+            max_duty=1.0,
+            tasks=TaskQueue(backend=LocalBackend(maxlen=10)),
+        )
+        backfill.checkpoint_key = f"test:{version}"
+        return backfill
+
+    first = make_backfill()
+    await first.save_checkpoint(BackfillCheckpoint(last_id=ids[0] - 1))
+    stats = await first.run(max_chunks=1)
+    assert stats == {"processed": 2, "last_id": ids[1], "finished": False}
+
+    # A new job object resumes from the saved checkpoint (local copy without Redis)
+    second = make_backfill()
+    second._local_checkpoint = first._local_checkpoint
+    stats = await second.run()
+    assert stats["finished"] is True
+    assert stats["processed"] == 4
+
+    assert analysed == [["content 0", "content 1"], ["content 3", "content 4"]]
+    assert invalidated == [f"article:{ids[i]}" for i in (0, 1, 3, 4)]
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(NewsArticle).where(NewsArticle.id.in_(ids)).order_by(NewsArticle.id)
+        )
+        stored = result.scalars().all()
+
+    assert [article.nlp_version for article in stored] == [version] * 5 + ["old"]
+    assert stored[0].sentiment_score == 0.25
+    assert stored[0].topics == [{"keyword": "topic", "score": 1.0}]
+    assert stored[5].sentiment_score == 0.0  # Near-duplicate untouched
@@ -0,0 +1,79 @@
+"""
+Test suite for article table partitioning
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.partitions import (
+    add_months,
+    maintain_partitions,
+    month_start,
+    parse_partition_month,
+    partition_name,
+)
+from app.models.news_models import ArticleUrl, NewsArticle, hash_url
+from app.schemas.news_schemas import NewsArticleCreate
+from app.services.news_service import NewsService
+
+
+def test_month_arithmetic():
+    """Test month flooring and shifting across year boundaries."""
+    assert month_start(date(2025, 11, 17)) == date(2025, 11, 1)
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+
+def test_partition_names_round_trip():
+    """Test partition naming and parsing."""
+    name = partition_name("news_articles", date(2025, 3, 1))
+
+    assert name == "news_articles_2025_03"
+    assert parse_partition_month("news_articles", name) == date(2025, 3, 1)
+    assert parse_partition_month("news_articles", "news_articles_default") is None
+
+
+def test_article_url_not_unique_like_partitioned_table():
+    """Test that the model matches the migration: URL uniqueness lives in ArticleUrl."""
+    table = NewsArticle.__table__
+
+    assert not table.c.url.unique
+    assert not any(index.unique for index in table.indexes if "url" in index.columns)
+
+
+@pytest.mark.asyncio
+async def test_maintain_partitions_skips_non_postgres(test_engine):
+    """Test that partition maintenance is a no-op outside PostgreSQL."""
+    stats = await maintain_partitions(test_engine)
+
+    assert stats == {"created": [], "archived": []}
+
+
+@pytest.mark.asyncio
+async def test_article_url_registered_and_released(async_db: AsyncSession):
+    """Test that the URL dedup table tracks article creation and deletion."""
+    url = f"https://test.com/partition-dedup-{datetime.now().timestamp()}"
+    article = await NewsService.create_article(
+        async_db,
+        NewsArticleCreate(
+            title="Partitioned Article",
+            content="Content",
+            source="Test Source",
+            published_date=datetime(2025, 6, 15),
+            url=url,
+        ),
+    )
+
+    result = await async_db.execute(select(ArticleUrl).where(ArticleUrl.url_hash == hash_url(url)))
+    registered = result.scalar_one()
+    assert registered.article_id == article.id
+
+    await NewsService.delete_article(async_db, article.id)
+
+    result = await async_db.execute(select(ArticleUrl).where(ArticleUrl.url_hash == hash_url(url)))
+    assert result.scalar_one_or_none() is None
@@ -0,0 +1,259 @@
+"""
+Test suite for the streaming ingestion pipeline
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.task_queue import LocalBackend, TaskQueue
+from app.ingestion.crawler import RSSCrawler
+from app.ingestion.feed_state import FeedStateStore
+from app.ingestion.fetcher import AsyncFetcher
+from app.ingestion.near_duplicates import NearDuplicateDetector, NearDuplicateIndex
+from app.ingestion.pipeline import IngestionPipeline
+from app.models.news_models import NewsArticle
+
+STORY = (
+    "The central bank raised its benchmark interest rate by half a percentage point on "
+    "Tuesday, citing persistent inflation in food and energy prices. Officials said further "
+    "increases were possible if price growth did not slow over the coming months, and "
+    "analysts expect the decision to weigh on lending to small businesses."
+)
+OTHER_STORY = (
+    "Heavy rain flooded several districts of the capital overnight, closing schools and "
+    "disrupting public transport. Emergency services evacuated residents from low-lying "
+    "neighbourhoods while the weather service warned of more storms later in the week."
+)
+
+
+def make_feed(host: str, count: int) -> str:
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://{host}/story/{i}</link>"
+        f"<guid>{host}-{i}</guid></item>"
+        for i in range(count)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'
+    )
+
+
+def make_page(title: str, text: str) -> str:
+    return f"<html><body><h1>{title}</h1><article><p>{text}</p></article></body></html>"
+
+
+def make_pipeline(handler, session_factory, enricher=None, **kwargs) -> IngestionPipeline:
+    fetcher = AsyncFetcher(
+        transport=httpx.MockTransport(handler), respect_robots=False, backoff_base=0.0
+    )
+    crawler = RSSCrawler(fetcher=fetcher, state_store=FeedStateStore())
+    detector = NearDuplicateDetector(
+        index=NearDuplicateIndex(prefix=f"test_pipeline_{datetime.now().timestamp()}")
+    )
+    kwargs.setdefault("batch_wait", 0.05)
+    # The test engine shares one SQLite connection, so writes are serialised
+    kwargs["workers"] = {**kwargs.get("workers", {}), "store": 1}
+    return IngestionPipeline(
+        crawler, session_factory, near_duplicates=detector, enricher=enricher, **kwargs
+    )
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stores_enriches_and_links_near_duplicates(session_factory):
+    """Test the full flow: batched NLP for canonical articles, duplicate_of for copies."""
+    host = f"pipe-{datetime.now().timestamp()}.test"
+    pages = {
+        "/story/0": make_page("Rates rise", STORY),
+        "/story/1": make_page("Rates rise again", STORY + " Reporting by staff."),
+        "/story/2": make_page("Floods", OTHER_STORY),
+    }
+
+    def handler(request):
+        if request.url.path == "/feed":
+            return httpx.Response(200, text=make_feed(host, 3))
+        return httpx.Response(200, text=pages[request.url.path])
+
+    batches = []
+
+    async def enricher(texts):
+        batches.append(texts)
+        return [
+            {
+                "sentiment": {"polarity": 0.5},
+                "entities": [{"text": "bank"}],
+                "keywords": [("rate", 0.9)],
+            }
+            for _ in texts
+        ]
+
+    tasks = TaskQueue(backend=LocalBackend(maxlen=100), consumer="test")
+    pipeline = make_pipeline(handler, session_factory, enricher=enricher, tasks=tasks)
+    stats = await pipeline.run([{"name": "Pipe", "rss_feeds": [f"https://{host}/feed"]}])
+
+    assert stats["entries"] == 3
+    assert stats["inserted"] == 3
+    assert stats["near_duplicates"] == 1
+    assert stats["errors"] == 0
+    assert sum(len(batch) for batch in batches) == 2  # The copy skipped NLP
+    assert set(stats["stages"]) == set(IngestionPipeline.STAGES)
+    assert stats["stages"]["store"]["processed"] == 3
+    assert stats["stages"]["fetch"]["p99_ms"] >= stats["stages"]["fetch"]["p50_ms"] > 0
+    assert {task.name for task in await tasks.claim(10)} == {"rebuild_graph", "recompute_trends"}
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(NewsArticle).where(NewsArticle.url.like(f"https://{host}/%"))
+        )
+        articles = {article.url.rsplit("/", 1)[1]: article for article in result.scalars()}
+
+    copy = articles["1"] if articles["1"].duplicate_of is not None else articles["0"]
+    canonical = articles["0"] if copy is articles["1"] else articles["1"]
+    assert copy.duplicate_of == canonical.id
+    assert canonical.sentiment_score == 0.5
+    assert canonical.topics == [{"keyword": "rate", "score": 0.9}]
+    assert copy.sentiment_score == 0.0
+    assert articles["2"].duplicate_of is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_with_tiny_queues_and_transient_failures(session_factory):
+    """Test back-pressure with one-slot queues; failed pages stay unseen for a retry."""
+    host = f"tiny-{datetime.now().timestamp()}.test"
+    count = 12
+
+    def handler(request):
+        if request.url.path == "/feed":
+            return httpx.Response(200, text=make_feed(host, count))
+        index = int(request.url.path.rsplit("/", 1)[1])
+        if index == 0:
+            return httpx.Response(503)
+        return httpx.Response(
+            200,
+            text=make_page(f"Story {index}", f"Unique story number {index}. " * 20 + STORY[index:]),
+        )
+
+    pipeline = make_pipeline(
+        handler,
+        session_factory,
+        queue_size=1,
+        store_batch_size=5,
+        workers={"fetch": 3, "extract": 2},
+    )
+    feed_url = f"https://{host}/feed"
+    stats = await pipeline.run([{"name": "Tiny", "rss_feeds": [feed_url]}])
+
+    assert stats["inserted"] == count - 1
+    assert stats["stages"]["fetch"]["emitted"] == count - 1
+    assert stats["stages"]["fetch"]["max_queue_depth"] <= 1
+
+    state = await pipeline.crawler.state_store.get(feed_url)
+    assert f"{host}-0" not in state.seen_guids
+    assert f"{host}-1" in state.seen_guids
+
+
+@pytest.mark.asyncio
+async def test_copy_reaching_store_first_waits_for_its_canonical(session_factory):
+    """Test that a near-duplicate is not stored as a canonical while NLP is still running."""
+    host = f"race-{datetime.now().timestamp()}.test"
+    pages = {
+        "/story/0": make_page("Rates rise", STORY),
+        "/story/1": make_page("Rates rise again", STORY + " Reporting by staff."),
+    }
+
+    def handler(request):
+        if request.url.path == "/feed":
+            return httpx.Response(200, text=make_feed(host, 2))
+        return httpx.Response(200, text=pages[request.url.path])
+
+    async def slow_enricher(texts):
+        await asyncio.sleep(0.2)  # The copy has no NLP to do and reaches store first
+        return [{"sentiment": {"polarity": 0.5}, "entities": [], "keywords": []} for _ in texts]
+
+    pipeline = make_pipeline(
+        handler,
+        session_factory,
+        enricher=slow_enricher,
+        nlp_batch_size=1,
+        store_batch_size=1,
+        workers={"nlp": 2},
+        tasks=TaskQueue(backend=LocalBackend(maxlen=100), consumer="test"),
+    )
+    stats = await pipeline.run([{"name": "Race", "rss_feeds": [f"https://{host}/feed"]}])
+
+    assert stats["inserted"] == 2
+    assert stats["near_duplicates"] == 1
+    async with session_factory() as session:
+        result = await session.execute(
+            select(NewsArticle).where(NewsArticle.url.like(f"https://{host}/%"))
+        )
+        articles = list(result.scalars())
+    (canonical,) = [article for article in articles if article.duplicate_of is None]
+    (copy,) = [article for article in articles if article.duplicate_of is not None]
+    assert copy.duplicate_of == canonical.id
+    assert canonical.sentiment_score == 0.5
+
+
+@pytest.mark.asyncio
+async def test_failed_store_leaves_entries_unseen_for_retry(session_factory):
+    """Test that feed state is only saved once entries are stored."""
+    host = f"fail-{datetime.now().timestamp()}.test"
+
+    def handler(request):
+        if request.url.path == "/feed":
+            return httpx.Response(200, text=make_feed(host, 3))
+        index = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, text=make_page(f"Story {index}", f"Story {index}. " + STORY))
+
+    @asynccontextmanager
+    async def broken_session():
+        raise RuntimeError("database unavailable")
+        yield
+
+    pipeline = make_pipeline(handler, broken_session)
+    feed_url = f"https://{host}/feed"
+    stats = await pipeline.run([{"name": "Fail", "rss_feeds": [feed_url]}])
+
+    assert stats["inserted"] == 0
+    assert stats["errors"] == 3
+    state = await pipeline.crawler.state_store.get(feed_url)
+    assert not any(guid.startswith(host) for guid in state.seen_guids)
+    assert state.etag is None
+    assert not pipeline.crawler._in_flight
+
+
+@pytest.mark.asyncio
+async def test_extraction_error_releases_the_poll(session_factory, monkeypatch):
+    """Test that an entry lost to a stage exception still finishes its feed poll."""
+    host = f"boom-{datetime.now().timestamp()}.test"
+
+    def handler(request):
+        if request.url.path == "/feed":
+            return httpx.Response(200, text=make_feed(host, 2))
+        return httpx.Response(200, text=make_page("Story", STORY))
+
+    pipeline = make_pipeline(handler, session_factory)
+
+    async def explode(source, entry, html):
+        raise ValueError("bad markup")
+
+    monkeypatch.setattr(pipeline.crawler, "extract_article", explode)
+    feed_url = f"https://{host}/feed"
+    stats = await pipeline.run([{"name": "Boom", "rss_feeds": [feed_url]}])
+
+    assert stats["errors"] == 2
+    assert not pipeline.crawler._in_flight
+    state = await pipeline.crawler.state_store.get(feed_url)
+    assert f"{host}-0" not in state.seen_guids
@@ -0,0 +1,148 @@
+"""
+Test suite for request span profiling, slow-request capture and the sampling profiler
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import threading
+import time
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.debug import router as debug_router
+from app.core.config import settings
+from app.core.profiling import (
+    ProfiledRoute,
+    ProfilingMiddleware,
+    SamplingProfiler,
+    SlowRequestLog,
+    slow_requests,
+    span,
+)
+from app.core.query_stats import instrument_engine
+
+engine = create_async_engine("sqlite+aiosqlite://")
+instrument_engine(engine.sync_engine)
+
+
+async def get_item(item_id: int):
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        await conn.execute(text("SELECT 2"))
+    with span("redis"):
+        time.sleep(0.01)
+    return {"id": item_id, "tags": ["x"] * 1000}
+
+
+def fast():
+    return {"ok": True}
+
+
+def make_client(log: SlowRequestLog, monkeypatch) -> TestClient:
+    monkeypatch.setattr(settings, "ENABLE_PROFILING", True)
+    router = APIRouter(route_class=ProfiledRoute)
+    router.add_api_route("/items/{item_id}", get_item)
+    router.add_api_route("/fast", fast)
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ProfilingMiddleware, log=log)
+    return TestClient(app)
+
+
+def test_slow_requests_are_captured_with_span_breakdown(monkeypatch):
+    """Test that db, redis and serialize time are attributed to the request."""
+    log = SlowRequestLog(threshold_ms=0, capacity=10)
+    client = make_client(log, monkeypatch)
+
+    assert client.get("/items/7").status_code == 200
+
+    (entry,) = log.snapshot()
+    assert entry["route"] == "/items/{item_id}"
+    assert entry["path"] == "/items/7"
+    assert entry["status_code"] == 200
+    assert entry["calls"]["db"] == 2
+    assert entry["calls"]["redis"] == 1
+    assert entry["calls"]["serialize"] == 1
+    assert entry["spans_ms"]["redis"] >= 10
+    assert entry["spans_ms"]["db"] > 0
+    assert set(entry["spans_ms"]) == {"db", "redis", "serialize", "other"}
+    assert entry["duration_ms"] >= sum(entry["spans_ms"].values()) - 0.1
+
+
+def test_fast_requests_are_not_captured_and_buffer_is_bounded(monkeypatch):
+    """Test the threshold and the ring buffer size."""
+    log = SlowRequestLog(threshold_ms=10_000, capacity=2)
+    client = make_client(log, monkeypatch)
+    client.get("/fast")
+    assert log.snapshot() == []
+
+    log.threshold_ms = 0
+    for i in range(3):
+        client.get(f"/items/{i}")
+    assert [entry["path"] for entry in log.snapshot()] == ["/items/2", "/items/1"]
+
+
+def test_span_outside_a_request_is_a_no_op():
+    """Test that instrumented code runs normally when profiling is off."""
+    with span("redis"):
+        value = 42
+    assert value == 42
+
+
+def test_sampling_profiler_finds_busy_function():
+    """Test that a CPU-bound thread shows up in the samples."""
+    stop = threading.Event()
+
+    def busy_loop():
+        while not stop.is_set():
+            sum(range(1000))
+
+    thread = threading.Thread(target=busy_loop)
+    thread.start()
+    try:
+        result = SamplingProfiler(interval=0.001).run(0.2)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert result["samples"] > 0
+    assert any("busy_loop" in row["function"] for row in result["cumulative"])
+    assert "busy_loop (" in result["collapsed"]
+
+
+def test_debug_endpoints_require_admin_token(monkeypatch):
+    """Test token checks, slow-request listing and on-demand profiles."""
+    app = FastAPI()
+    app.include_router(debug_router, prefix="/debug")
+    client = TestClient(app)
+
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "")
+    assert client.get("/debug/slow-requests", headers={"X-Admin-Token": ""}).status_code == 403
+
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", "s3cret")
+    assert client.get("/debug/slow-requests").status_code == 403
+    assert client.get("/debug/slow-requests", headers={"X-Admin-Token": "nope"}).status_code == 403
+
+    headers = {"X-Admin-Token": "s3cret"}
+    slow_requests.clear()
+    slow_requests.record({"path": "/a"})
+    response = client.get("/debug/slow-requests", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["requests"] == [{"path": "/a"}]
+    assert client.delete("/debug/slow-requests", headers=headers).status_code == 204
+    assert slow_requests.snapshot() == []
+
+    too_long = settings.PROFILING_MAX_SECONDS + 1
+    response = client.post(f"/debug/profile?seconds={too_long}", headers=headers)
+    assert response.status_code == 400
+
+    response = client.post("/debug/profile?seconds=0.05&include_idle=true", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["samples"] > 0
+
+    response = client.post("/debug/profile?seconds=0.05&format=collapsed", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
@@ -0,0 +1,174 @@
+"""
+Test suite for per-request SQL statistics and endpoint query budgets
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.metrics import DB_QUERIES_PER_REQUEST, DB_REPEATED_QUERIES
+from app.core.query_stats import QueryStatsMiddleware, fingerprint, instrument_engine
+from app.main import app
+from app.models.news_models import Base, NewsArticle
+
+
+@pytest.fixture
+def article_api(tmp_path):
+    """The real app on an instrumented SQLite database holding one article."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/aras.db", poolclass=NullPool)
+    instrument_engine(engine.sync_engine)
+    session_maker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_maker() as session:
+            session.add(
+                NewsArticle(
+                    id=1,
+                    title="Old title",
+                    content="Body",
+                    source="test",
+                    published_date=datetime(2024, 1, 1),
+                    url="https://example.com/1",
+                )
+            )
+            await session.commit()
+
+    asyncio.run(setup())
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+            await session.commit()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    try:
+        yield engine, TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_update_article_query_budget(article_api, query_budget):
+    """Test that updating an article is a single UPDATE ... RETURNING."""
+    engine, client = article_api
+
+    with query_budget(engine, 1) as queries:
+        response = client.put("/api/v1/articles/1", json={"title": "New title"})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["article"]["title"] == "New title"
+    assert response.json()["data"]["article"]["updated_at"] is not None
+    assert queries.statements[0].lstrip().upper().startswith("UPDATE")
+
+
+def test_update_missing_article_query_budget(article_api, query_budget):
+    """Test that a 404 update costs one statement."""
+    engine, client = article_api
+
+    with query_budget(engine, 1):
+        response = client.put("/api/v1/articles/99", json={"title": "New title"})
+
+    assert response.status_code == 404
+
+
+def test_get_article_query_budget(article_api, query_budget):
+    """Test that reading an article is one SELECT."""
+    engine, client = article_api
+
+    with query_budget(engine, 1):
+        response = client.get("/api/v1/articles/1")
+
+    assert response.status_code == 200
+
+
+def test_query_budget_reports_statements(article_api, query_budget):
+    """Test that an exceeded budget lists the statements that ran."""
+    engine, client = article_api
+
+    with pytest.raises(AssertionError, match=r"1 statements:\s+1\. UPDATE news_articles"):
+        with query_budget(engine, 0):
+            client.put("/api/v1/articles/1", json={"title": "New title"})
+
+
+def test_requests_record_query_counts_per_route(article_api):
+    """Test the per-route statement histogram."""
+    _, client = article_api
+    route = "/api/v1/articles/{article_id}"
+    before = DB_QUERIES_PER_REQUEST.count(route)
+
+    client.get("/api/v1/articles/1")
+
+    assert DB_QUERIES_PER_REQUEST.count(route) == before + 1
+    assert "aras_db_query_duration_seconds_bucket" in client.get("/metrics").text
+
+
+def make_stats_client(engine) -> TestClient:
+    stats_app = FastAPI()
+
+    @stats_app.get("/items")
+    async def list_items(n: int = 1):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'x'"))
+            for i in range(n):
+                await conn.execute(text("SELECT :i"), {"i": i})
+        return {"ok": True}
+
+    stats_app.add_middleware(QueryStatsMiddleware)
+    return TestClient(stats_app)
+
+
+def test_debug_headers_describe_sql(monkeypatch):
+    """Test X-DB-Queries, X-DB-Time-Ms and X-DB-Slowest."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_engine(engine.sync_engine)
+    client = make_stats_client(engine)
+
+    assert "x-db-queries" not in client.get("/items").headers
+
+    monkeypatch.setattr(settings, "SQL_DEBUG_HEADERS", True)
+    response = client.get("/items?n=2")
+
+    assert response.headers["x-db-queries"] == "3"
+    assert float(response.headers["x-db-time-ms"]) > 0
+    assert response.headers["x-db-slowest"].split("ms ", 1)[1].startswith("SELECT ")
+
+
+def test_repeated_statements_are_flagged(monkeypatch, caplog):
+    """Test N+1 detection on one statement executed many times."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_engine(engine.sync_engine)
+    client = make_stats_client(engine)
+    monkeypatch.setattr(settings, "SQL_REPEATED_QUERY_THRESHOLD", 5)
+    before = DB_REPEATED_QUERIES.value("/items")
+
+    client.get("/items?n=4")
+    assert DB_REPEATED_QUERIES.value("/items") == before
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        client.get("/items?n=5")
+    assert DB_REPEATED_QUERIES.value("/items") == before + 1
+    assert "Possible N+1 on GET /items: 5 executions of SELECT ?" in caplog.text
+
+
+def test_fingerprint_replaces_literals_and_value_lists():
+    """Test statement normalization."""
+    statement = """SELECT id  FROM news_articles
+        WHERE source = 'bbc' AND id IN (?, ?, ?) LIMIT 10"""
+    assert fingerprint(statement) == (
+        "SELECT id FROM news_articles WHERE source = ? AND id IN (...) LIMIT ?"
+    )
+    assert fingerprint("SELECT * FROM t WHERE id = $1") == "SELECT * FROM t WHERE id = $?"
@@ -7,6 +7,7 @@ Built by Elite Team - QA Lead (PhD in Software Testing)
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
 from app.main import app
 
 client = TestClient(app)
@@ -49,3 +50,224 @@ def test_advanced_search_endpoint_exists():
     """Test that advanced search endpoint exists."""
     response = client.post("/api/v1/articles/search/advanced?q=test")
     assert response.status_code in [200, 404, 422]
+
+
+class FakeScript:
+    """Stands in for a registered Lua script, replaying canned replies."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+class FakeRedis:
+    def __init__(self, script):
+        self.script = script
+        self.registered = 0
+
+    def register_script(self, source):
+        self.registered += 1
+        return self.script
+
+
+@pytest.mark.asyncio
+async def test_limiter_resolves_client_lazily_and_uses_one_script_call(monkeypatch):
+    """Test that a limiter built before Redis connects picks it up, one call for both windows."""
+    from app.core.rate_limiter import GCRALimiter, redis_client
+
+    limiter = GCRALimiter("rate_limit", [("minute", 60, 60), ("hour", 1000, 3600)])
+    assert (await limiter.hit("1.2.3.4")).allowed  # No Redis yet: fail open
+
+    script = FakeScript([[1, 0, 59, 999], [1, 0, 58, 998]])
+    fake = FakeRedis(script)
+    monkeypatch.setattr(redis_client, "client", fake)
+
+    first = await limiter.hit("1.2.3.4")
+    second = await limiter.hit("1.2.3.4")
+
+    assert fake.registered == 1
+    assert first.remaining == {"minute": 59, "hour": 999}
+    assert second.remaining == {"minute": 58, "hour": 998}
+    keys, args = script.calls[0]
+    assert keys == ["rate_limit:{1.2.3.4}:minute", "rate_limit:{1.2.3.4}:hour"]
+    assert args == [1, 60, 60000, 1000, 3600000]
+
+
+@pytest.mark.asyncio
+async def test_leased_limiter_serves_requests_locally_between_refills():
+    """Test one Redis round trip per lease, lease expiry, and locally cached denials."""
+    from app.core.rate_limiter import GCRALimiter, LeasedLimiter
+
+    now = [0.0]
+    script = FakeScript([[5, 0, 55, 995], [2, 0, 0, 988], [0, 3000, 0, 988]])
+    limiter = LeasedLimiter(
+        GCRALimiter(
+            "rate_limit", [("minute", 60, 60), ("hour", 1000, 3600)], redis=FakeRedis(script)
+        ),
+        lease_size=5,
+        lease_ttl=10.0,
+        clock=lambda: now[0],
+    )
+
+    results = [await limiter.hit("client") for _ in range(5)]
+    assert len(script.calls) == 1
+    assert script.calls[0][1][0] == 5
+    assert all(result.allowed for result in results)
+    assert [result.remaining["minute"] for result in results] == [59, 58, 57, 56, 55]
+
+    # Partial grant: only two tokens left in the minute window
+    assert (await limiter.hit("client")).allowed
+    assert (await limiter.hit("client")).remaining == {"minute": 0, "hour": 988}
+    assert len(script.calls) == 2
+
+    denied = await limiter.hit("client")
+    assert not denied.allowed and denied.retry_after == 3.0
+
+    now[0] = 2.0
+    again = await limiter.hit("client")  # Still blocked: answered without Redis
+    assert not again.allowed and again.retry_after == 1.0
+    assert len(script.calls) == 3
+
+    # Unused tokens of an expired lease are not spent
+    script.replies.append([5, 0, 50, 980])
+    now[0] = 4.0
+    assert (await limiter.hit("client")).allowed
+    now[0] = 20.0
+    script.replies.append([5, 0, 45, 975])
+    assert (await limiter.hit("client")).allowed
+    assert len(script.calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_limiter_fails_open_on_redis_error(monkeypatch):
+    """Test that a Redis error lets the request through."""
+    from app.core.rate_limiter import EndpointRateLimiter, redis_client
+
+    monkeypatch.setattr(redis_client, "client", FakeRedis(FakeScript([ConnectionError("down")])))
+    result = await EndpointRateLimiter(requests=10, window=60).limiter.hit("1.2.3.4:/x")
+    assert result.allowed
+
+
+def test_middleware_returns_429_with_retry_after(monkeypatch):
+    """Test that a rejected request gets 429 instead of reaching the endpoint."""
+    from app.core.rate_limiter import redis_client
+    from app.main import rate_limiter
+
+    monkeypatch.setattr(redis_client, "client", FakeRedis(FakeScript([[0, 1500, 0, 940]])))
+    try:
+        response = client.get("/api/v1/articles/")
+    finally:
+        rate_limiter.limiter.leases.clear()
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    assert "Rate limit exceeded" in response.json()["detail"]
+
+
+class CountingScript:
+    """Fixed-window stand-in for the GCRA script: grants what is left of each limit."""
+
+    def __init__(self):
+        self.used = {}
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        requested, windows = args[0], list(zip(args[1::2], args[2::2]))
+        left = [limit - self.used.get(key, 0) for key, (limit, _) in zip(keys, windows)]
+        granted = max(0, min([requested] + left))
+        if not granted:
+            return [0, 30000] + [max(n, 0) for n in left]
+        for key in keys:
+            self.used[key] = self.used.get(key, 0) + granted
+        return [granted, 0] + [n - granted for n in left]
+
+
+@pytest.mark.asyncio
+async def test_leased_limiter_charges_weighted_costs():
+    """Test that costs come out of the lease and requests costing more than the grant fail."""
+    from app.core.rate_limiter import GCRALimiter, LeasedLimiter
+
+    script = CountingScript()
+    limiter = LeasedLimiter(
+        GCRALimiter("cost", [("window", 12, 60)], redis=FakeRedis(script)), lease_size=4
+    )
+
+    assert (await limiter.hit("key", cost=5)).allowed  # Lease grows to cover the cost
+    assert (await limiter.hit("key", cost=3)).allowed  # Served from the leftover
+    assert script.calls == 2
+
+    refused = await limiter.hit("key", cost=6)  # Only 4 units left in Redis
+    assert not refused.allowed and refused.retry_after > 0
+    assert (await limiter.hit("key", cost=4)).allowed  # The partial grant stays usable
+    assert script.calls == 3
+
+
+def test_nlp_budget_does_not_crowd_out_reads(monkeypatch):
+    """Test that exhausting the NLP budget blocks analysis calls per API key but not reads."""
+    from app.api.v1.endpoints.analysis import EXTRACTION_COST
+    from app.core.rate_limiter import GCRALimiter, LeasedLimiter, nlp_budget, redis_client
+    from app.main import rate_limiter
+
+    monkeypatch.setattr(redis_client, "client", FakeRedis(CountingScript()))
+    monkeypatch.setattr(settings, "RATE_LIMIT_API_KEYS", ["heavy-user", "light-user"])
+    monkeypatch.setattr(nlp_budget, "budget", 4 * EXTRACTION_COST)
+    monkeypatch.setattr(
+        nlp_budget,
+        "limiter",
+        LeasedLimiter(GCRALimiter("cost_limit:nlp", [("window", 4 * EXTRACTION_COST, 60)])),
+    )
+    heavy = {"X-API-Key": "heavy-user"}
+    body = {"text": "Apple Inc. announced a new product in California.", "language": "en"}
+    try:
+        statuses = [
+            client.post("/api/v1/analysis/entities", json=body, headers=heavy).status_code
+            for _ in range(5)
+        ]
+        reads = client.get("/api/v1/health", headers=heavy)
+        other_key = client.post(
+            "/api/v1/analysis/entities", json=body, headers={"X-API-Key": "light-user"}
+        )
+    finally:
+        rate_limiter.limiter.leases.clear()
+
+    assert 429 not in statuses[:-1]
+    assert statuses[-1] == 429
+    assert reads.status_code == 200
+    assert other_key.status_code != 429
+
+
+def test_rotating_unissued_api_keys_shares_one_budget(monkeypatch):
+    """Test that sending a new random X-API-Key per call does not reset the NLP budget."""
+    from app.api.v1.endpoints.analysis import EXTRACTION_COST
+    from app.core.rate_limiter import GCRALimiter, LeasedLimiter, nlp_budget, redis_client
+    from app.main import rate_limiter
+
+    monkeypatch.setattr(redis_client, "client", FakeRedis(CountingScript()))
+    monkeypatch.setattr(settings, "RATE_LIMIT_API_KEYS", [])
+    monkeypatch.setattr(nlp_budget, "budget", 4 * EXTRACTION_COST)
+    monkeypatch.setattr(
+        nlp_budget,
+        "limiter",
+        LeasedLimiter(GCRALimiter("cost_limit:nlp", [("window", 4 * EXTRACTION_COST, 60)])),
+    )
+    body = {"text": "Apple Inc. announced a new product in California.", "language": "en"}
+    try:
+        statuses = [
+            client.post(
+                "/api/v1/analysis/entities", json=body, headers={"X-API-Key": f"random-{i}"}
+            ).status_code
+            for i in range(5)
+        ]
+    finally:
+        rate_limiter.limiter.leases.clear()
+
+    assert 429 not in statuses[:-1]
+    assert statuses[-1] == 429
@@ -0,0 +1,202 @@
+"""
+Test suite for the adaptive feed scheduler
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+import yaml
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.task_queue import LocalBackend, TaskQueue
+from app.ingestion import pipeline as pipeline_module
+from app.ingestion.crawler import RSSCrawler
+from app.ingestion.feed_state import FeedStateStore
+from app.ingestion.fetcher import AsyncFetcher
+from app.ingestion.scheduler import FeedScheduler, parse_frequency
+from app.ingestion.service import NewsIngestionService
+from app.models.news_models import NewsArticle
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeIngester:
+    """Feed ingester stub returning a scripted number of new entries per feed."""
+
+    def __init__(self, new_per_feed):
+        self.new_per_feed = new_per_feed
+        self.polled = []
+
+    async def __call__(self, source, feed_url):
+        self.polled.append(feed_url)
+        return self.new_per_feed.get(feed_url, 0)
+
+
+HIGH = "https://high.test/rss"
+LOW = "https://low.test/rss"
+SOURCES = [
+    {"name": "Low", "priority": "low", "update_frequency": "60min", "rss_feeds": [LOW]},
+    {"name": "High", "priority": "high", "update_frequency": "15min", "rss_feeds": [HIGH]},
+]
+
+
+async def settle():
+    """Let started polling tasks run until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_parse_frequency():
+    """Test update_frequency parsing."""
+    assert parse_frequency("15min") == 900
+    assert parse_frequency("2h") == 7200
+    assert parse_frequency(None) == 1800
+    assert parse_frequency("often") == 1800
+
+
+@pytest.mark.asyncio
+async def test_high_priority_polled_first():
+    """Test that due feeds are polled in priority order."""
+    ingest = FakeIngester({})
+    scheduler = FeedScheduler(ingest, clock=FakeClock(), max_concurrent_feeds=1)
+    scheduler.load(SOURCES)
+
+    await scheduler.run_once()
+
+    assert ingest.polled == [HIGH, LOW]
+
+
+@pytest.mark.asyncio
+async def test_interval_adapts_to_publish_rate():
+    """Test that quiet feeds back off and busy feeds speed up."""
+    clock = FakeClock()
+    scheduler = FeedScheduler(FakeIngester({HIGH: 12}), clock=clock)
+    scheduler.load(SOURCES)
+    assert await scheduler.run_once() == 12
+
+    items = {item.feed_url: item for item in scheduler._heap}
+    busy, quiet = items[HIGH], items[LOW]
+
+    assert busy.interval < busy.base_interval
+    assert busy.interval >= busy.min_interval
+    assert quiet.interval == quiet.base_interval * 1.5
+
+    # Only the busy feed is due again first
+    clock.now += busy.interval
+    assert [item.feed_url for item in scheduler.pop_due()] == [HIGH]
+
+
+@pytest.mark.asyncio
+async def test_slow_feed_does_not_hold_back_other_feeds():
+    """Test that each feed is requeued when its own poll finishes."""
+    clock = FakeClock()
+    release = asyncio.Event()
+    polled = []
+
+    async def ingest(source, feed_url):
+        polled.append(feed_url)
+        if feed_url == LOW:
+            await release.wait()  # A slow host
+        return 1
+
+    scheduler = FeedScheduler(ingest, clock=clock)
+    scheduler.load(SOURCES)
+    scheduler.start_due()
+    await settle()
+
+    assert [item.feed_url for item in scheduler._heap] == [HIGH]
+    clock.now += 10**6
+    scheduler.start_due()
+    await settle()
+    assert polled == [HIGH, LOW, HIGH]
+
+    release.set()
+    await settle()
+    assert sorted(item.feed_url for item in scheduler._heap) == [HIGH, LOW]
+
+
+@pytest.mark.asyncio
+async def test_run_polls_requeued_feeds_until_stopped():
+    """Test the run loop wakes for requeued feeds and cancels polls on stop."""
+    stop = asyncio.Event()
+    polled = []
+    ticks = iter(range(0, 10**9, 10**6))  # Every feed is due again by the next look
+
+    async def ingest(source, feed_url):
+        polled.append(feed_url)
+        if feed_url == LOW:
+            await asyncio.Event().wait()  # Never finishes; cancelled on stop
+        if polled.count(HIGH) == 3:
+            stop.set()
+        return 0
+
+    scheduler = FeedScheduler(ingest, clock=lambda: float(next(ticks)))
+    scheduler.load(SOURCES)
+    await asyncio.wait_for(scheduler.run(stop), timeout=5)
+
+    assert polled.count(HIGH) == 3
+    assert polled.count(LOW) == 1
+    assert not scheduler._polling
+
+
+@pytest.mark.asyncio
+async def test_scheduled_polls_run_through_the_pipeline(test_engine, tmp_path, monkeypatch):
+    """Test that scheduled ingestion stores, links and queues enrichment like full runs."""
+    host = f"sched-{datetime.now().timestamp()}.test"
+    feed = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+        f"<item><title>Story</title><link>https://{host}/story/0</link>"
+        f"<guid>{host}-0</guid></item></channel></rss>"
+    )
+    page = "<html><body><h1>Story</h1><article><p>" + "Scheduled story text. " * 20
+    page += "</p></article></body></html>"
+
+    def handler(request):
+        return httpx.Response(200, text=feed if request.url.path == "/feed" else page)
+
+    config = tmp_path / "sources.yaml"
+    config.write_text(
+        yaml.safe_dump({"test_sources": [{"name": "Sched", "rss_feeds": [f"https://{host}/feed"]}]})
+    )
+    session_factory = sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    tasks = TaskQueue(backend=LocalBackend(maxlen=100), consumer="test")
+    monkeypatch.setattr(database, "async_session_maker", session_factory)
+    monkeypatch.setattr(pipeline_module, "task_queue", tasks)
+
+    fetcher = AsyncFetcher(
+        transport=httpx.MockTransport(handler), respect_robots=False, backoff_base=0.0
+    )
+    crawler = RSSCrawler(fetcher=fetcher, state_store=FeedStateStore())
+    service = NewsIngestionService(config_path=str(config), crawler=crawler)
+
+    stop = asyncio.Event()
+    finish_poll = crawler.finish_poll
+
+    async def finish_and_stop(poll):
+        await finish_poll(poll)
+        stop.set()
+
+    monkeypatch.setattr(crawler, "finish_poll", finish_and_stop)
+    await asyncio.wait_for(service.run_scheduled(stop), timeout=10)
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(NewsArticle).where(NewsArticle.url == f"https://{host}/story/0")
+        )
+        assert result.scalar_one().title == "Story"
+    assert "enrich_article" in {task.name for task in await tasks.claim(10)}
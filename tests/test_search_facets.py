@@ -0,0 +1,132 @@
+"""
+Test suite for faceted search aggregations
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.news_schemas import NewsArticleCreate
+from app.services.news_service import NewsService
+
+
+async def _create_articles(db: AsyncSession, source: str) -> None:
+    """Create a small, uniquely-sourced article set for facet counts."""
+    samples = [
+        ("Technology", "en", 0.8, datetime(2024, 3, 1, 9, 0)),
+        ("Technology", "en", -0.7, datetime(2024, 3, 1, 18, 0)),
+        ("Politics", "fa", 0.0, datetime(2024, 3, 2, 12, 0)),
+    ]
+    for i, (category, language, sentiment, published) in enumerate(samples):
+        await NewsService.create_article(
+            db,
+            NewsArticleCreate(
+                title=f"Facet Article {i}",
+                content=f"Facet content {i}",
+                source=source,
+                published_date=published,
+                language=language,
+                category=category,
+                sentiment_score=sentiment,
+                url=f"https://test.com/facets-{source}-{i}-{datetime.now().timestamp()}",
+            ),
+        )
+
+
+def test_parse_facets():
+    """Test facet list parsing and validation."""
+    assert NewsService.parse_facets(None) == []
+    assert NewsService.parse_facets("category, source,category") == ["category", "source"]
+
+    with pytest.raises(ValueError, match="Unknown facet"):
+        NewsService.parse_facets("category,author")
+
+
+@pytest.mark.asyncio
+async def test_search_facets_counts(async_db: AsyncSession):
+    """Test facet counts over the filtered set."""
+    source = f"Facet Source {datetime.now().timestamp()}"
+    await _create_articles(async_db, source)
+
+    facets = await NewsService.get_search_facets(
+        async_db,
+        ["category", "language", "sentiment_bucket", "day"],
+        source=source,
+    )
+
+    assert facets["category"] == [
+        {"value": "Technology", "count": 2},
+        {"value": "Politics", "count": 1},
+    ]
+    assert {b["value"]: b["count"] for b in facets["language"]} == {"en": 2, "fa": 1}
+    assert {b["value"]: b["count"] for b in facets["sentiment_bucket"]} == {
+        "positive": 1,
+        "negative": 1,
+        "neutral": 1,
+    }
+    assert facets["day"] == [
+        {"value": "2024-03-02", "count": 1},
+        {"value": "2024-03-01", "count": 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_facets_respect_filters(async_db: AsyncSession):
+    """Test that facet counts honour the search filters."""
+    source = f"Facet Filter Source {datetime.now().timestamp()}"
+    await _create_articles(async_db, source)
+
+    facets = await NewsService.get_search_facets(
+        async_db, ["category"], source=source, language="fa"
+    )
+
+    assert facets == {"category": [{"value": "Politics", "count": 1}]}
+
+
+@pytest.mark.asyncio
+async def test_grouping_sets_query_shape():
+    """Test that PostgreSQL facets run as a single GROUPING SETS query."""
+    from app.models.news_models import NewsArticle
+
+    class CapturingSession:
+        """Records the statement and returns one grouped row per facet."""
+
+        async def execute(self, stmt):
+            self.stmt = stmt
+            return self
+
+        def mappings(self):
+            return [
+                {
+                    "category": "Technology",
+                    "category_grouping": 0,
+                    "sentiment_bucket": None,
+                    "sentiment_bucket_grouping": 1,
+                    "count": 2,
+                },
+                {
+                    "category": None,
+                    "category_grouping": 1,
+                    "sentiment_bucket": "positive",
+                    "sentiment_bucket_grouping": 0,
+                    "count": 1,
+                },
+            ]
+
+    db = CapturingSession()
+    rows = await NewsService._facet_rows_grouping_sets(
+        db, ["category", "sentiment_bucket"], [NewsArticle.language == "en"]
+    )
+    sql = str(db.stmt.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("SELECT") == 1
+    assert "GROUP BY GROUPING SETS" in sql
+    assert "grouping(news_articles.category)" in sql
+    assert "WHERE news_articles.language = %(language_1)s" in sql
+    # Bucket constants are inlined so SELECT and GROUP BY expressions match
+    assert sql.count("%(") == 1
+    assert rows == [("category", "Technology", 2), ("sentiment_bucket", "positive", 1)]
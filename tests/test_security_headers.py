@@ -79,3 +79,31 @@ class TestSecurityHeaders:
         assert "Content-Security-Policy" in response.headers
         assert "X-Frame-Options" in response.headers
         assert "X-Content-Type-Options" in response.headers
+
+    def test_streaming_response_passes_through_middleware(self):
+        """Test that pure ASGI middleware adds headers without buffering a streamed body."""
+        from starlette.applications import Starlette
+        from starlette.responses import StreamingResponse
+        from starlette.routing import Route
+
+        from app.core.audit_logger import AuditLoggerMiddleware
+        from app.core.security_headers import SecurityHeadersMiddleware
+
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}\n".encode()
+
+        async def stream(request):
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        app = SecurityHeadersMiddleware(
+            AuditLoggerMiddleware(Starlette(routes=[Route("/stream", stream)]))
+        )
+        with TestClient(app) as stream_client:
+            with stream_client.stream("GET", "/stream") as response:
+                lines = list(response.iter_lines())
+
+        assert lines == ["chunk0", "chunk1", "chunk2"]
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "X-Request-ID" in response.headers
+        assert "X-Process-Time" in response.headers
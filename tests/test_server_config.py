@@ -0,0 +1,138 @@
+"""
+Test suite for the gunicorn production server configuration
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import gc
+import os
+import runpy
+from pathlib import Path
+
+import pytest
+import spacy
+from spacy.language import Language
+
+from app.core import database
+from app.core.config import settings
+from app.core.rate_limiter import GCRALimiter, LeasedLimiter
+from app.nlp import spacy_engine
+from app.nlp.spacy_engine import SpacyNLPEngine
+
+CONFIG_PATH = str(Path(__file__).resolve().parent.parent / "gunicorn.conf.py")
+
+parsed = []
+
+
+@Language.component("warm_up_probe")
+def warm_up_probe(doc):
+    parsed.append(doc.text)
+    return doc
+
+
+def load_config() -> dict:
+    return runpy.run_path(CONFIG_PATH)
+
+
+@pytest.fixture(autouse=True)
+def restore_settings(monkeypatch, tmp_path):
+    """The config and its hooks set these for the workers they fork."""
+    monkeypatch.setattr(settings, "WEB_WORKERS", settings.WEB_WORKERS)
+    monkeypatch.setattr(settings, "DATABASE_SCHEMA_ON_STARTUP", False)
+    monkeypatch.setattr(settings, "MULTIPROCESS_DIR", str(tmp_path))
+
+
+def test_config_uses_uvicorn_workers_and_preloads():
+    """Test the server settings gunicorn reads from the config file."""
+    config = load_config()
+
+    assert config["worker_class"] == "uvicorn_worker.UvicornWorker"
+    assert config["preload_app"] is True
+    assert config["bind"] == f"0.0.0.0:{settings.PORT}"
+    assert config["graceful_timeout"] == settings.WEB_GRACEFUL_TIMEOUT
+
+
+def test_workers_default_to_available_cpus(monkeypatch):
+    """Test worker sizing with and without WEB_WORKERS."""
+    monkeypatch.setattr(settings, "WEB_WORKERS", 0)
+    expected = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    assert load_config()["workers"] == expected
+
+    monkeypatch.setattr(settings, "WEB_WORKERS", 3)
+    assert load_config()["workers"] == 3
+
+
+def test_master_warms_the_nlp_engine_before_fork(monkeypatch):
+    """Test that on_starting parses once with the shared engine and freezes the heap."""
+    engine = SpacyNLPEngine("blank_en")
+    engine.nlp = spacy.blank("en")
+    engine.nlp.add_pipe("warm_up_probe")
+    engine._model_loaded = True
+    monkeypatch.setattr(spacy_engine, "_nlp_engine", engine)
+    monkeypatch.setattr(settings, "NLP_PRELOAD", True)
+    parsed.clear()
+
+    try:
+        load_config()["on_starting"](server=None)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert len(parsed) == 1
+
+
+def test_master_creates_the_schema_once_for_all_workers(monkeypatch):
+    """Test that on_starting runs the DDL and turns it off for the forked workers."""
+    calls = []
+
+    async def prepare_schema():
+        calls.append("schema")
+
+    async def dispose_engines():
+        calls.append("dispose")
+
+    monkeypatch.setattr(database, "prepare_schema", prepare_schema)
+    monkeypatch.setattr(database, "dispose_engines", dispose_engines)
+    monkeypatch.setattr(settings, "NLP_PRELOAD", False)
+    monkeypatch.setattr(settings, "DATABASE_SCHEMA_ON_STARTUP", True)
+
+    try:
+        load_config()["on_starting"](server=None)
+    finally:
+        gc.unfreeze()
+
+    assert calls == ["schema", "dispose"]
+    assert settings.DATABASE_SCHEMA_ON_STARTUP is False
+
+
+def test_warm_up_skips_missing_model():
+    """Test that a model that failed to load does not break startup."""
+    engine = SpacyNLPEngine("missing_model")
+    engine.warm_up()
+
+    assert not engine._model_loaded
+
+
+def test_post_fork_resets_inherited_pools():
+    """Test that each worker gets fresh pools instead of the master's connections."""
+    engines = (database.engine, *database.read_engines)
+    inherited = [db_engine.sync_engine.pool for db_engine in engines]
+
+    load_config()["post_fork"](server=None, worker=None)
+    try:
+        for db_engine, pool in zip(engines, inherited):
+            assert db_engine.sync_engine.pool is not pool
+            assert db_engine.sync_engine.pool.checkedout() == 0
+    finally:
+        load_config()["worker_exit"](server=None, worker=None)
+
+
+def test_workers_share_the_pod_lease(monkeypatch):
+    """Test that default rate limit leases are split across the configured workers."""
+    monkeypatch.setattr(settings, "WEB_WORKERS", 4)
+    config = load_config()
+
+    assert settings.WEB_WORKERS == config["workers"] == 4
+    limiter = LeasedLimiter(GCRALimiter("lease_test", [("minute", 2000, 60)]))
+    single = int(2000 * settings.RATE_LIMIT_LEASE_FRACTION)
+    assert limiter.lease_size == min(single, settings.RATE_LIMIT_LEASE_MAX) // 4
@@ -0,0 +1,272 @@
+"""
+Test suite for the background task queue, worker and task handlers
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from redis.crc import key_slot
+
+from app.core.redis_client import redis_client
+from app.core.task_queue import LocalBackend, RedisStreamBackend, TaskQueue
+from app.models.news_models import Edge, NewsArticle, Trend
+from app.services.nlp_service import NLPService
+from app.tasks.handlers import ENRICH_ARTICLE, REBUILD_GRAPH, RECOMPUTE_TRENDS, TASK_HANDLERS
+from app.tasks.worker import TaskWorker
+
+
+def make_queue(**kwargs) -> TaskQueue:
+    kwargs.setdefault("retry_backoff", 0.0)
+    return TaskQueue(backend=LocalBackend(maxlen=1000), consumer="test", **kwargs)
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_dedup_key_coalesces_waiting_jobs():
+    """Test that identical jobs collapse while waiting, but not once one is running."""
+    queue = make_queue()
+
+    assert await queue.enqueue("recompute_trends", {}, dedup_key="all")
+    assert await queue.enqueue("recompute_trends", {}, dedup_key="all") is None
+
+    tasks = await queue.claim(10)
+    assert len(tasks) == 1
+
+    # A request arriving during the run is kept
+    assert await queue.enqueue("recompute_trends", {}, dedup_key="all")
+
+
+@pytest.mark.asyncio
+async def test_failed_enqueue_releases_dedup_key(monkeypatch):
+    """Test that a job lost to a stream error does not swallow later jobs with its key."""
+    queue = make_queue()
+    add = queue.backend.add
+
+    async def broken_add(fields):
+        raise ConnectionError("stream unavailable")
+
+    monkeypatch.setattr(queue.backend, "add", broken_add)
+    assert await queue.enqueue("recompute_trends", {}, dedup_key="all") is None
+
+    monkeypatch.setattr(queue.backend, "add", add)
+    assert await queue.enqueue("recompute_trends", {}, dedup_key="all")
+    assert len(await queue.claim(10)) == 1
+
+
+@pytest.mark.asyncio
+async def test_unacknowledged_task_is_redelivered_after_visibility_timeout():
+    """Test at-least-once delivery when a worker dies mid-task."""
+    queue = make_queue(visibility_timeout=0.01, max_attempts=2)
+    await queue.enqueue("enrich_article", {"article_id": 1})
+
+    first = await queue.claim(10)
+    assert await queue.claim(10) == []  # Still invisible
+
+    await asyncio.sleep(0.02)
+    second = await queue.claim(10)
+    assert [task.id for task in second] == [first[0].id]
+    assert second[0].attempts == 2
+
+    await asyncio.sleep(0.02)
+    assert await queue.claim(10) == []  # Exceeded max_attempts
+    assert (await queue.stats())["dead"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_then_dead_letter():
+    """Test that failed tasks are retried with a growing attempt count, then dead-lettered."""
+    queue = make_queue(max_attempts=3)
+    await queue.enqueue("rebuild_graph", {"article_ids": [1]})
+
+    for attempt in (1, 2, 3):
+        (task,) = await queue.claim(10)
+        assert task.attempts == attempt
+        await queue.retry(task, "boom")
+
+    assert await queue.claim(10) == []
+    assert await queue.stats() == {"queued": 0, "pending": 0, "delayed": 0, "dead": 1}
+
+
+def test_default_consumer_name_follows_the_process(monkeypatch):
+    """Test that workers forked from a preloaded master each get their own consumer name."""
+    queue = TaskQueue(backend=LocalBackend(maxlen=10))
+    master = queue.consumer
+
+    monkeypatch.setattr("app.core.task_queue.os.getpid", lambda: 4242)
+    assert queue.consumer != master
+    assert queue.consumer.endswith("-4242")
+
+
+def test_stream_keys_share_a_cluster_slot():
+    """Test that the promote script's keys hash to one Redis Cluster slot."""
+
+    class ScriptClient:
+        def register_script(self, script):
+            return script
+
+    backend = RedisStreamBackend(ScriptClient(), "aras:tasks", "workers", maxlen=10)
+
+    assert backend.stream == "{aras:tasks}"
+    slots = {key_slot(key.encode()) for key in (backend.stream, backend.delayed_key)}
+    assert len(slots) == 1
+    assert RedisStreamBackend(ScriptClient(), "{q}:jobs", "g", 10).delayed_key == "{q}:jobs:delayed"
+
+
+@pytest.mark.asyncio
+async def test_worker_batches_jobs_and_isolates_failures():
+    """Test one handler call per batch, falling back to single tasks when it fails."""
+    queue = make_queue()
+    calls = []
+
+    async def handler(db, payloads):
+        calls.append([payload["n"] for payload in payloads])
+        if any(payload["n"] == 3 for payload in payloads):
+            raise ValueError("bad payload")
+
+    for n in range(1, 6):
+        await queue.enqueue("job", {"n": n})
+
+    class NoSession:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *exc):
+            return False
+
+    worker = TaskWorker(
+        queue=queue, handlers={"job": handler}, session_factory=NoSession, block_ms=0
+    )
+    assert await worker.run_once() == 5
+
+    assert calls[0] == [1, 2, 3, 4, 5]
+    assert calls[1:] == [[1], [2], [3], [4], [5]]
+    stats = await queue.stats()
+    assert stats["pending"] == 0
+    assert stats["delayed"] == 1  # The failing job awaits its retry
+
+
+@pytest.mark.asyncio
+async def test_graph_and_trend_handlers(session_factory):
+    """Test rebuild_graph and recompute_trends through the worker."""
+    stamp = str(datetime.now().timestamp()).replace(".", "")
+    keyword = f"kw{stamp}"
+    now = datetime.utcnow()
+
+    async with session_factory() as session:
+        articles = [
+            NewsArticle(
+                title=f"Story {i}",
+                content="Body",
+                source="Test",
+                published_date=now - timedelta(hours=1),
+                url=f"https://tasks.test/{stamp}/{i}",
+                entities=[
+                    {"text": f"Org {stamp}", "label": "ORG"},
+                    {"text": "Tehran", "label": "GPE"},
+                ],
+                topics=[{"keyword": keyword, "score": 1.0}],
+            )
+            for i in range(3)
+        ]
+        session.add_all(articles)
+        await session.commit()
+        ids = [article.id for article in articles]
+
+    queue = make_queue()
+    await queue.enqueue(REBUILD_GRAPH, {"article_ids": ids[:2]})
+    await queue.enqueue(REBUILD_GRAPH, {"article_ids": ids})  # Redelivery-style overlap
+    await queue.enqueue(RECOMPUTE_TRENDS, {}, dedup_key="all")
+
+    worker = TaskWorker(
+        queue=queue, handlers=TASK_HANDLERS, session_factory=session_factory, block_ms=0
+    )
+    assert await worker.run_once() == 3
+
+    async with session_factory() as session:
+        edges = await session.execute(
+            select(Edge).where(Edge.source_id.in_([f"article:{i}" for i in ids]))
+        )
+        edges = edges.scalars().all()
+        trend = await session.execute(select(Trend).where(Trend.name == keyword))
+        trend = trend.scalar_one()
+
+    assert len(edges) == 6  # Two entities per article, no duplicates
+    assert {edge.target_id for edge in edges} == {f"entity:ORG:org {stamp}", "entity:GPE:tehran"}
+    assert trend.end_date is None
+    assert trend.confidence_score == 0.75
+    assert (await queue.stats())["dead"] == 0
+
+
+@pytest.mark.asyncio
+async def test_enrichment_invalidates_cached_articles(session_factory, monkeypatch):
+    """Test that enriched articles are dropped from the article cache."""
+    stamp = datetime.now().timestamp()
+    async with session_factory() as session:
+        article = NewsArticle(
+            title="Cached",
+            content="Body",
+            source="Test",
+            published_date=datetime.utcnow(),
+            url=f"https://tasks.test/{stamp}/cached",
+        )
+        session.add(article)
+        await session.commit()
+
+    async def analyze_documents(texts):
+        return [{"sentiment": {"polarity": 0.5}, "entities": [], "keywords": []} for _ in texts]
+
+    deleted = []
+
+    async def delete_many(keys):
+        deleted.extend(keys)
+        return len(deleted)
+
+    monkeypatch.setattr(NLPService, "analyze_documents", analyze_documents)
+    monkeypatch.setattr(redis_client, "delete_many", delete_many)
+
+    async with session_factory() as session:
+        assert await NLPService.enrich_articles(session, [article.id]) == 1
+
+    assert deleted == [f"article:{article.id}"]
+
+
+@pytest.mark.asyncio
+async def test_enrichment_retried_while_model_unavailable(session_factory, monkeypatch):
+    """Test that enrichment jobs fail (and are retried) instead of being acked unenriched."""
+    stamp = datetime.now().timestamp()
+    async with session_factory() as session:
+        article = NewsArticle(
+            title="Unenriched",
+            content="Body",
+            source="Test",
+            published_date=datetime.utcnow(),
+            url=f"https://tasks.test/{stamp}/unenriched",
+        )
+        session.add(article)
+        await session.commit()
+
+    async def model_unavailable(texts):
+        return None
+
+    monkeypatch.setattr(NLPService, "analyze_documents", model_unavailable)
+    queue = make_queue(max_attempts=2)
+    await queue.enqueue(ENRICH_ARTICLE, {"article_id": article.id})
+    worker = TaskWorker(
+        queue=queue, handlers=TASK_HANDLERS, session_factory=session_factory, block_ms=0
+    )
+
+    await worker.run_once()
+    assert (await queue.stats())["delayed"] == 1
+    await worker.run_once()
+    assert (await queue.stats())["dead"] == 1
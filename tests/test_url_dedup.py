@@ -0,0 +1,108 @@
+"""
+Test suite for URL canonicalization and the Bloom filter dedup index
+
+Built by Elite Team - QA Lead (PhD in Software Testing)
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.ingestion.dedup import BloomFilter, UrlDeduplicator
+from app.ingestion.urls import canonicalize_url
+from app.schemas.news_schemas import NewsArticleCreate
+from app.services.news_service import NewsService
+
+
+def test_canonicalize_url_variants():
+    """Test that tracking params, fragments, scheme and host variants collapse."""
+    canonical = "https://news.example.com/world/story-1?id=7&page=2"
+
+    assert (
+        canonicalize_url("http://WWW.News.Example.com:80/world/story-1/?page=2&id=7#comments")
+        == canonical
+    )
+    assert (
+        canonicalize_url(
+            "https://news.example.com/world/story-1"
+            "?utm_source=rss&utm_medium=feed&id=7&page=2&fbclid=x"
+        )
+        == canonical
+    )
+    # Path case and meaningful parameters are preserved
+    assert canonicalize_url("https://news.example.com/World/story-1") != canonicalize_url(
+        "https://news.example.com/world/story-1"
+    )
+
+
+def test_canonicalize_malformed_url_returned_as_given():
+    """Test that URLs urlsplit cannot parse do not raise."""
+    assert canonicalize_url(" http://host:abc/story ") == "http://host:abc/story"
+    assert canonicalize_url("http://[::1/story") == "http://[::1/story"
+
+
+@pytest.mark.asyncio
+async def test_bloom_filter_has_no_false_negatives():
+    """Test that every added item is reported as present."""
+    bloom = BloomFilter(key="test:bloom", capacity=1000, error_rate=0.01)
+    items = [f"https://example.com/{i}" for i in range(500)]
+
+    await bloom.add_many(items)
+
+    assert all(await bloom.contains_many(items))
+    unseen = await bloom.contains_many([f"https://other.example/{i}" for i in range(500)])
+    assert sum(unseen) < 25  # ~1% false positives at capacity
+
+
+@pytest.mark.asyncio
+async def test_deduplicator_confirms_positives_in_database(test_engine, async_db: AsyncSession):
+    """Test that Bloom positives are checked against the URL table."""
+    stamp = datetime.now().timestamp()
+    stored_url = f"https://dedup.example.com/stored-{stamp}"
+    await NewsService.create_article(
+        async_db,
+        NewsArticleCreate(
+            title="Stored",
+            content="Content",
+            source="Test Source",
+            published_date=datetime(2025, 7, 1),
+            url=stored_url,
+        ),
+    )
+
+    false_positive = f"https://dedup.example.com/fetched-not-stored-{stamp}"
+    dedup = UrlDeduplicator(
+        bloom=BloomFilter(key="test:dedup", capacity=1000, error_rate=0.01),
+        session_factory=sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    await dedup.mark_seen([stored_url, false_positive])
+
+    fresh = f"https://dedup.example.com/fresh-{stamp}"
+    result = await dedup.filter_new(
+        [f"{stored_url}?utm_source=rss", false_positive, fresh, fresh + "#top"]
+    )
+
+    assert result == [false_positive, fresh]
+
+
+@pytest.mark.asyncio
+async def test_create_article_rejects_tracking_variant(async_db: AsyncSession):
+    """Test that a URL differing only by tracking params is a duplicate."""
+    url = f"https://dedup.example.com/variant-{datetime.now().timestamp()}"
+    data = dict(
+        title="Variant",
+        content="Content",
+        source="Test Source",
+        published_date=datetime(2025, 7, 2),
+    )
+    await NewsService.create_article(async_db, NewsArticleCreate(url=url, **data))
+
+    with pytest.raises(ValueError):
+        await NewsService.create_article(
+            async_db,
+            NewsArticleCreate(
+                url=url.replace("https://", "http://www.") + "?utm_campaign=x", **data
+            ),
+        )